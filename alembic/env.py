@@ -7,15 +7,26 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
-# Import models
+# Import models (autogenerate 대상 테이블 등록)
+from app.config.settings import settings
 from app.core.database import Base
-from app.models.user import User
-from app.models.district import District, DistrictCluster, IndustryCluster, DistrictIndustryMix
-from app.models.coupon import Coupon
+from app.models.user import (  # noqa: F401
+    User,
+    UserStore,
+    IndustryCluster,
+    DistrictIndustryMix,
+    Partnership,
+    StoreImage,
+)
+from app.models.district import DistrictCluster  # noqa: F401
 
 # this is the Alembic Config object
 config = context.config
 
+# 접속 정보는 alembic.ini 가 아니라 앱 설정(.env)에서 가져온다 (ini 보간 문자 % 이스케이프)
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", settings.ASYNC_DATABASE_URL.replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -0,0 +1,66 @@
+"""hot lookup indexes on user_stores / store_images
+
+- user_stores.user_id: /stores/me/* 매장 조회
+- user_stores.kakao_place_id: 카카오 장소 회원 여부 조회
+- store_images (user_store_id, sequence) UNIQUE: 이미지 조회 + 매장당 순서 중복 방지
+
+Revision ID: a1f3c9d2e4b7
+Revises:
+Create Date: 2026-10-16 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1f3c9d2e4b7"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_names(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    names = {ix["name"] for ix in inspector.get_indexes(table)}
+    names.update(uq["name"] for uq in inspector.get_unique_constraints(table))
+    return names
+
+
+def upgrade() -> None:
+    user_store_indexes = _index_names("user_stores")
+    if "ix_user_stores_user_id" not in user_store_indexes:
+        op.create_index("ix_user_stores_user_id", "user_stores", ["user_id"])
+    if "ix_user_stores_kakao_place_id" not in user_store_indexes:
+        op.create_index("ix_user_stores_kakao_place_id", "user_stores", ["kakao_place_id"])
+
+    if "uq_store_images_store_sequence" not in _index_names("store_images"):
+        duplicates = op.get_bind().execute(sa.text(
+            "SELECT user_store_id, sequence, COUNT(*) FROM store_images "
+            "GROUP BY user_store_id, sequence HAVING COUNT(*) > 1"
+        )).fetchall()
+        if duplicates:
+            raise RuntimeError(
+                "store_images 에 (user_store_id, sequence) 중복 행이 있어 UNIQUE 제약을 만들 수 없습니다. "
+                f"정리 후 다시 실행하세요: {[tuple(row) for row in duplicates[:20]]}"
+            )
+        # UNIQUE 인덱스로 생성 (MySQL 에서는 UNIQUE 제약과 동일, SQLite 에서도 ALTER 없이 가능)
+        op.create_index(
+            "uq_store_images_store_sequence", "store_images", ["user_store_id", "sequence"], unique=True
+        )
+
+
+def downgrade() -> None:
+    is_mysql = op.get_bind().dialect.name == "mysql"
+
+    # MySQL 은 FK 컬럼에 인덱스가 필요 - UNIQUE 를 지우기 전에 FK 용 인덱스를 먼저 만든다
+    if is_mysql and "ix_store_images_user_store_id" not in _index_names("store_images"):
+        op.create_index("ix_store_images_user_store_id", "store_images", ["user_store_id"])
+    op.drop_index("uq_store_images_store_sequence", table_name="store_images")
+
+    op.drop_index("ix_user_stores_kakao_place_id", table_name="user_stores")
+    if not is_mysql:
+        # MySQL 에서는 FK(users.id) 가 이 인덱스를 쓰고 있으므로 남겨둔다 (upgrade 는 이름으로 건너뜀)
+        op.drop_index("ix_user_stores_user_id", table_name="user_stores")
@@ -0,0 +1,57 @@
+"""user_stores.geohash column + index (backfill from x, y)
+
+Revision ID: b7d2e8f4c1a9
+Revises: a1f3c9d2e4b7
+Create Date: 2026-10-16 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.geohash import STORE_PRECISION, encode
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e8f4c1a9"
+down_revision: Union[str, None] = "a1f3c9d2e4b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def upgrade() -> None:
+    op.add_column("user_stores", sa.Column("geohash", sa.String(length=12), nullable=True))
+
+    # 좌표가 있는 기존 매장 채우기 (id 키셋 페이지 단위)
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, x, y FROM user_stores "
+                "WHERE id > :last_id AND x IS NOT NULL AND y IS NOT NULL "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        conn.execute(
+            sa.text("UPDATE user_stores SET geohash = :geohash WHERE id = :id"),
+            [
+                {"id": row.id, "geohash": encode(float(row.y), float(row.x), STORE_PRECISION)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    # 채운 뒤에 인덱스 생성 (UPDATE 중 인덱스 유지 비용 회피)
+    op.create_index("ix_user_stores_geohash", "user_stores", ["geohash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_stores_geohash", table_name="user_stores")
+    op.drop_column("user_stores", "geohash")
@@ -1,34 +1,52 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token, decode_token
+from app.config.settings import settings
+from app.core.auth_cache import AuthPrincipal, decode_token_cached, get_cached_user, cache_user
+from app.core.database import get_async_db
+from app.core.security import hash_password_async, verify_password_async, create_access_token
 from app.models.user import User, UserStore, IndustryCluster
 from app.schemas.auth import SignupRequest, UserOut, Token
 from app.services.district_service import DistrictService
+from app.services.reference_cache import ReferenceDataUnavailable
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
-    payload = decode_token(token)
+async def get_current_user(
+        db: AsyncSession = Depends(get_async_db),
+        token: str = Depends(oauth2_scheme),
+) -> AuthPrincipal:
+    payload = decode_token_cached(token)
     if not payload or "sub" not in payload:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
+    # 서명된 클레임 신뢰 모드: DB 조회 없음
+    if settings.AUTH_TRUST_TOKEN_CLAIMS:
+        return AuthPrincipal.from_claims(payload)
+
     user_id = int(payload["sub"])
-    user = db.query(User).filter(User.id == user_id).first()
+    principal = get_cached_user(user_id)
+    if principal is not None:
+        return principal
+
+    user = await db.scalar(select(User).where(User.id == user_id).limit(1))
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    return user
+
+    principal = AuthPrincipal(id=user.id, login_id=user.login_id, name=user.name)
+    cache_user(principal)
+    return principal
 
 
 @router.get("/check-username")
-def check_username(login_id: str, db: Session = Depends(get_db)):
+async def check_username(login_id: str, db: AsyncSession = Depends(get_async_db)):
     """아이디 중복 체크"""
-    exists = db.query(User).filter(User.login_id == login_id).first()
+    exists = await db.scalar(select(User).where(User.login_id == login_id).limit(1))
     return {
         "available": exists is None,
         "message": None if exists is None else "이미 사용 중인 아이디입니다.",
@@ -55,20 +73,24 @@ def verify_business(businessNumber: str):
 
 
 @router.post("/signup", response_model=UserOut)
-def signup(data: SignupRequest, db: Session = Depends(get_db)):
+async def signup(data: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         # 1. 중복 아이디 체크
-        if db.query(User).filter(User.login_id == data.login_id).first():
+        if await db.scalar(select(User).where(User.login_id == data.login_id).limit(1)):
             raise HTTPException(status_code=400, detail="이미 사용 중인 아이디입니다.")
 
         # 2. 사용자 생성
+        # 해싱(프로세스 풀) 동안 DB 커넥션을 잡고 있지 않도록 읽기 트랜잭션을 먼저 종료
+        await db.rollback()
+        hashed = await hash_password_async(data.password)
+
         user = User(
             login_id=data.login_id,
-            password=hash_password(data.password),
+            password=hashed,
             name=data.name,
         )
         db.add(user)
-        db.flush()  # commit 대신 flush로 변경 (ID 생성하지만 트랜잭션 유지)
+        await db.flush()  # commit 대신 flush로 변경 (ID 생성하지만 트랜잭션 유지)
         
         print(f"✅ User created with ID: {user.id}")
 
@@ -76,15 +98,16 @@ def signup(data: SignupRequest, db: Session = Depends(get_db)):
         store_info = data.store_info
         print(f"📍 Finding nearest district for coordinates: x={store_info.x}, y={store_info.y}")
         
-        nearest_district = DistrictService.find_nearest_district_cluster(
-            db, store_info.x, store_info.y  # x=경도, y=위도
+        nearest_district = await db.run_sync(
+            DistrictService.find_nearest_district_cluster,
+            store_info.x, store_info.y  # x=경도, y=위도
         )
         print(f"🏢 Nearest district: {nearest_district}")
 
         # 4. 업종 클러스터 정보 조회
         print(f"🏭 Looking up industry cluster for: {store_info.industry_name}")
-        industry_cluster = DistrictService.get_industry_cluster_info(
-            db, store_info.industry_name
+        industry_cluster = await db.run_sync(
+            DistrictService.get_industry_cluster_info, store_info.industry_name
         )
         print(f"📊 Industry cluster: {industry_cluster}")
 
@@ -128,26 +151,41 @@ def signup(data: SignupRequest, db: Session = Depends(get_db)):
         db.add(user_store)
         
         print("💾 Committing transaction...")
-        db.commit()
+        await db.commit()
         
         print("✅ Signup completed successfully!")
         return UserOut(id=user.id, loginId=user.login_id, name=user.name)
         
+    except ReferenceDataUnavailable:
+        await db.rollback()  # 상권/업종 매핑 없이 가입시키지 않고 503 그대로
+        raise
     except Exception as e:
         print(f"❌ Error during signup: {e}")
         print(f"❌ Error type: {type(e)}")
         import traceback
         print(f"❌ Traceback: {traceback.format_exc()}")
         
-        db.rollback()  # 에러 발생시 롤백
+        await db.rollback()  # 에러 발생시 롤백
         raise HTTPException(status_code=500, detail=f"회원가입 중 오류가 발생했습니다: {str(e)}")
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.login_id == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password):
+async def login(
+        form_data: OAuth2PasswordRequestForm = Depends(),
+        db: AsyncSession = Depends(get_async_db),
+):
+    user = (
+        await db.execute(
+            select(User.id, User.login_id, User.name, User.password)
+            .where(User.login_id == form_data.username)
+            .limit(1)
+        )
+    ).first()
+    # 검증(프로세스 풀) 동안 DB 커넥션 반납
+    await db.close()
+
+    if not user or not await verify_password_async(form_data.password, user.password):
         raise HTTPException(status_code=400, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
 
-    token = create_access_token({"sub": str(user.id)})
+    token = create_access_token({"sub": str(user.id), "login_id": user.login_id, "name": user.name})
     return {"access_token": token, "token_type": "bearer"}
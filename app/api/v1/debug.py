@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.models.district import DistrictCluster
 from app.models.user import IndustryCluster
 
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/debug", tags=["debug"])
 
 
 @router.get("/table-structure")
-def check_table_structure(db: Session = Depends(get_db)):
+def check_table_structure(db: Session = Depends(get_read_db)):
     """테이블 구조 확인"""
     try:
         # industry_clusters 테이블 구조 확인
@@ -51,7 +51,7 @@ def check_table_structure(db: Session = Depends(get_db)):
 
 
 @router.get("/district-clusters")
-def get_district_clusters_sample(db: Session = Depends(get_db)):
+def get_district_clusters_sample(db: Session = Depends(get_read_db)):
     """district_clusters 테이블 샘플 데이터 조회"""
     
     # 전체 개수
@@ -87,7 +87,7 @@ def get_district_clusters_sample(db: Session = Depends(get_db)):
 
 
 @router.get("/industry-clusters")
-def get_industry_clusters_sample(db: Session = Depends(get_db)):
+def get_industry_clusters_sample(db: Session = Depends(get_read_db)):
     """industry_clusters 테이블 샘플 데이터 조회"""
     
     # 전체 개수
@@ -114,7 +114,7 @@ def get_industry_clusters_sample(db: Session = Depends(get_db)):
 
 
 @router.get("/search-industry/{industry_name}")
-def search_industry(industry_name: str, db: Session = Depends(get_db)):
+def search_industry(industry_name: str, db: Session = Depends(get_read_db)):
     """특정 업종 검색"""
     
     # 정확한 매칭
@@ -151,7 +151,7 @@ def search_industry(industry_name: str, db: Session = Depends(get_db)):
 
 
 @router.get("/test-coordinates")
-def test_coordinates(x: float, y: float, db: Session = Depends(get_db)):
+def test_coordinates(x: float, y: float, db: Session = Depends(get_read_db)):
     """좌표 기반 가장 가까운 상권 찾기 테스트"""
     
     from app.services.district_service import DistrictService
@@ -162,3 +162,35 @@ def test_coordinates(x: float, y: float, db: Session = Depends(get_db)):
         "input_coordinates": {"x": x, "y": y},
         "nearest_district": result
     }
+
+
+@router.get("/kakao-cache")
+def get_kakao_cache_stats():
+    """카카오 API 응답 캐시 적중/미스 통계"""
+    from app.external.kakao_client import kakao_client
+
+    return kakao_client.cache_info()
+
+
+@router.get("/reference-snapshot")
+def get_reference_snapshot_info():
+    """참조 데이터 스냅샷 버전 / 크기 / 갱신 상태"""
+    from app.services.reference_snapshot import reference_snapshot
+
+    return reference_snapshot.info()
+
+
+@router.get("/place-membership")
+def get_place_membership_stats():
+    """kakao_place_id 멤버십 집합 크기 / 필터링 통계"""
+    from app.services.place_membership import place_membership
+
+    return place_membership.info()
+
+
+@router.get("/auth-cache")
+def get_auth_cache_stats():
+    """토큰/사용자 캐시 통계"""
+    from app.core.auth_cache import auth_cache_info
+
+    return auth_cache_info()
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.database import get_read_db
+from app.schemas.district import (
+    NearestDistrictBatchRequest,
+    NearestDistrictBatchResponse,
+    NearestDistrictItem,
+)
+from app.services.district_service import DistrictService
+
+router = APIRouter(prefix="/districts", tags=["districts"])
+
+
+@router.post("/nearest/batch", response_model=NearestDistrictBatchResponse)
+def find_nearest_districts_batch(
+        data: NearestDistrictBatchRequest,
+        db: Session = Depends(get_read_db),
+):
+    """좌표 목록의 최근접 상권을 한 번에 조회 (매장 목록 재매핑용)"""
+    if len(data.coordinates) > settings.DISTRICT_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.DISTRICT_BATCH_MAX_SIZE}개 좌표까지 조회할 수 있습니다.",
+        )
+
+    coordinates = [(c.x, c.y) for c in data.coordinates]
+    nearest = DistrictService.find_nearest_district_clusters(db, coordinates)
+
+    return NearestDistrictBatchResponse(
+        results=[
+            NearestDistrictItem(x=c.x, y=c.y, **(district or {}))
+            for c, district in zip(data.coordinates, nearest)
+        ]
+    )
@@ -1,27 +1,67 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_read_db
 from app.models.user import UserStore
 from app.api.v1.auth import get_current_user
 from app.services.recommendation import recommend_for_industry_db
-from app.schemas.recommendation import IndustryRecommendationResponse
-from app.services.recommendation import recommend_for_industry_name
+from app.schemas.recommendation import (
+    DistrictFitResponse,
+    IndustryRecommendationResponse,
+    PartnerRecommendationResponse,
+)
+from app.services.recommendation import district_fit, recommend_for_industry_name
+from app.services.district_mix_index import district_mix_index
+from app.services.partner_matching import recommend_partners
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
 
 @router.get("/industries", response_model=IndustryRecommendationResponse)
-def recommend_industries_for_me(
+async def recommend_industries_for_me(
         top_n: int = Query(3, ge=1, le=10),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_read_db),
+        user=Depends(get_current_user),
+):
+    store = await db.scalar(select(UserStore).where(UserStore.user_id == user.id).limit(1))
+    if not store:
+        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+
+    return await db.run_sync(recommend_for_industry_db, store.industry_name, top_n=top_n)
+
+@router.get("/partners", response_model=PartnerRecommendationResponse)
+async def recommend_partners_for_me(
+        radius: float = Query(1000, gt=0, le=5000, description="반경 (미터)"),
+        top_n: int = Query(10, ge=1, le=50),
+        db: AsyncSession = Depends(get_async_read_db),
         user=Depends(get_current_user),
 ):
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
+    """주변 회원 매장 중 제휴 후보 추천 (거리 + 상권 유형 + 업종 궁합)"""
+    store = await db.scalar(select(UserStore).where(UserStore.user_id == user.id).limit(1))
     if not store:
         raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
 
-    return recommend_for_industry_db(db, store.industry_name, top_n=top_n)
+    try:
+        return await db.run_sync(recommend_partners, store, radius_m=radius, top_n=top_n)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/district-fit", response_model=DistrictFitResponse)
+async def get_district_fit(
+        cluster_label: Optional[int] = Query(None, ge=0, le=3, description="상권 유형 → 잘 맞는 업종"),
+        industry_name: Optional[str] = Query(None, description="업종 → 잘 맞는 상권 유형"),
+        top_n: int = Query(10, ge=1, le=100),
+):
+    """상권 유형 ↔ 업종 적합도 (district_industry_mix 비율 / lift)"""
+    # 행렬은 메모리에 있고 만료/무효화 시에만 스레드풀에서 다시 빌드 (요청 세션 불필요)
+    index = await district_mix_index.get_async()
+    try:
+        return district_fit(index, cluster_label=cluster_label, industry_name=industry_name, top_n=top_n)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 # 로그인 X / 회원 검증 X / 그냥 업종 이름만 넣으면 추천
 @router.get(
@@ -29,9 +69,9 @@ def recommend_industries_for_me(
     response_model=IndustryRecommendationResponse,
     summary="업종 이름으로 유클리드 거리 기반 추천 테스트"
 )
-def test_recommend_industry(
+async def test_recommend_industry(
         industry_name: str = Query(..., description="industry_clusters.industry_name"),
         top_n: int = Query(3, ge=1, le=10),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_read_db)
 ):
-    return recommend_for_industry_name(db, industry_name, top_n)
\ No newline at end of file
+    return await db.run_sync(recommend_for_industry_name, industry_name, top_n)
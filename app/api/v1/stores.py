@@ -1,10 +1,18 @@
-from typing import List, Dict
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.models.user import UserStore, IndustryCluster, StoreImage
+import json
+from typing import Any, List, Dict, Optional
+
+from fastapi import APIRouter, Body, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from starlette.concurrency import run_in_threadpool
+
+from app.config.settings import settings
+from app.core.database import AsyncReadSessionLocal, SessionLocal, get_async_db, get_async_read_db
+from app.core.etag import etag_matches, make_etag, not_modified, set_etag
+from app.models.user import UserStore, StoreImage
 from app.schemas.store import (
     StoreCreate,
     StoreUpdate,
@@ -16,16 +24,105 @@ from app.schemas.store import (
     KakaoPlaceBulkRequest,
     KakaoPlaceBulkResponse,
     KakaoPlaceBulkResultItem,
+    StoreBulkImportResponse,
+    NearbyStoresResponse,
 )
+from app.services.place_membership import place_membership
+from app.services.reference_snapshot import reference_snapshot
+from app.services.store_geo import find_nearby_stores
+from app.services.store_import import import_stores, parse_csv
 from app.api.v1.auth import get_current_user
 
 router = APIRouter(prefix="/stores", tags=["stores"])
 
 
+def _my_store_id(user_id: int):
+    """로그인 사용자의 매장 id 스칼라 서브쿼리 (사용자당 첫 번째 매장)"""
+    return (
+        select(UserStore.id)
+        .where(UserStore.user_id == user_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+async def _get_my_store(db: AsyncSession, user_id: int, with_images: bool = False) -> UserStore:
+    """
+    로그인 사용자의 매장 조회 (없으면 404)
+    사용자(store.user)와 - with_images 이면 sequence 순 이미지(store.images)까지 -
+    JOIN 한 번으로 함께 읽는다.
+    """
+    stmt = (
+        select(UserStore)
+        .join(UserStore.user)
+        .options(contains_eager(UserStore.user))
+        .where(UserStore.id == _my_store_id(user_id))
+    )
+    if with_images:
+        stmt = (
+            stmt.outerjoin(UserStore.images)
+            .options(contains_eager(UserStore.images))
+            .order_by(StoreImage.sequence)
+        )
+
+    store = (await db.scalars(stmt)).unique().first()
+    if not store:
+        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    return store
+
+
+# 리소스별로 응답에 직렬화되는 매장 컬럼
+# updated_at 은 MySQL DATETIME(초 단위)이라 같은 초 안의 두 번째 수정을 구분하지 못하므로 값 자체를 해시한다
+_ETAG_STORE_COLUMNS = {
+    "industry": (UserStore.industry_name, UserStore.industry_cluster_label, UserStore.industry_cluster_type),
+    "district": (
+        UserStore.district_code, UserStore.district_name, UserStore.district_cluster_label,
+        UserStore.district_cluster_type, UserStore.x, UserStore.y,
+    ),
+    "detail": (
+        UserStore.store_name, UserStore.industry_name, UserStore.district_name, UserStore.road_address_name,
+        UserStore.phone, UserStore.store_description, UserStore.x, UserStore.y,
+    ),
+    "images": (),
+}
+
+
+async def _get_my_store_etag(db: AsyncSession, user_id: int, resource: str, with_images: bool) -> str:
+    """
+    응답에 들어가는 컬럼만 읽어 ETag 계산 (본문 조립 / 사용자 JOIN 없이)
+    - 매장: id + _ETAG_STORE_COLUMNS[resource]
+    - 이미지: id, sequence, image_url
+    """
+    store_columns = (UserStore.id, *_ETAG_STORE_COLUMNS[resource])
+    if with_images:
+        stmt = (
+            select(*store_columns, StoreImage.id, StoreImage.sequence, StoreImage.image_url)
+            .outerjoin(StoreImage, StoreImage.user_store_id == UserStore.id)
+            .where(UserStore.id == _my_store_id(user_id))
+            .order_by(StoreImage.sequence, StoreImage.id)
+        )
+    else:
+        stmt = select(*store_columns).where(UserStore.id == _my_store_id(user_id))
+
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+
+    n = len(store_columns)
+    images = [tuple(row[n:]) for row in rows if with_images and row[n] is not None]
+    return make_etag(resource, *rows[0][:n], images)
+
+
+async def _get_industry_cluster(db: AsyncSession, industry_name: str):
+    # 참조 데이터 스냅샷 조회 (스냅샷이 준비돼 있으면 DB 조회 없음)
+    snapshot = await db.run_sync(reference_snapshot.get)
+    return snapshot.industries.get(industry_name)
+
+
 @router.post("", response_model=StoreOut)
-def create_store(
+async def create_store(
         data: StoreCreate,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
         user=Depends(get_current_user),
 ):
     store = UserStore(
@@ -42,18 +139,14 @@ def create_store(
         industry_name=data.industryName,
     )
 
-    cluster = (
-        db.query(IndustryCluster)
-        .filter(IndustryCluster.industry_name == data.industryName)
-        .first()
-    )
+    cluster = await _get_industry_cluster(db, data.industryName)
     if cluster:
         store.industry_cluster_label = cluster.cluster_label
         store.industry_cluster_type = cluster.industry_type_code
 
     db.add(store)
-    db.commit()
-    db.refresh(store)
+    await db.commit()
+    await db.refresh(store)
 
     return StoreOut(
         id=store.id,
@@ -67,14 +160,58 @@ def create_store(
     )
 
 
+def _import_stores_sync(user_id: int, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        return import_stores(db, user_id, rows)
+    finally:
+        db.close()
+
+
+async def _import_stores(user_id: int, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if len(rows) > settings.STORE_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.STORE_IMPORT_MAX_ROWS}개 매장까지 등록할 수 있습니다.",
+        )
+    # 행 검증 / 상권 매핑 / INSERT 파라미터 생성이 수만 행 규모라 이벤트 루프 밖(스레드풀, 동기 세션)에서 실행
+    return await run_in_threadpool(_import_stores_sync, user_id, rows)
+
+
+@router.post("/bulk", response_model=StoreBulkImportResponse)
+async def import_stores_bulk(
+        rows: List[Dict[str, Any]] = Body(...),
+        user=Depends(get_current_user),
+):
+    """
+    매장 일괄 등록 (JSON 배열 - 각 항목은 POST /stores 와 같은 형식)
+    잘못된 행은 건너뛰고 errors 에 행 번호와 사유를 담아 반환
+    """
+    return await _import_stores(user.id, rows)
+
+
+@router.post("/bulk/csv", response_model=StoreBulkImportResponse)
+async def import_stores_bulk_csv(
+        file: UploadFile = File(...),
+        user=Depends(get_current_user),
+):
+    """매장 일괄 등록 (CSV 업로드 - 헤더는 POST /stores 필드명)"""
+    content = await file.read()
+    try:
+        rows = await run_in_threadpool(parse_csv, content)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"CSV 파일을 읽을 수 없습니다: {e}")
+    return await _import_stores(user.id, rows)
+
+
 @router.patch("/{store_id}", response_model=StoreOut)
-def update_store(
+async def update_store(
         store_id: int,
         data: StoreUpdate,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
         user=Depends(get_current_user),
 ):
-    store = db.query(UserStore).filter(UserStore.id == store_id).first()
+    store = await db.scalar(select(UserStore).where(UserStore.id == store_id).limit(1))
     if not store:
         raise HTTPException(status_code=404, detail="매장을 찾을 수 없습니다.")
     if store.user_id != user.id:
@@ -88,17 +225,13 @@ def update_store(
         store.phone = data.phone
     if data.industryName is not None:
         store.industry_name = data.industryName
-        cluster = (
-            db.query(IndustryCluster)
-            .filter(IndustryCluster.industry_name == data.industryName)
-            .first()
-        )
+        cluster = await _get_industry_cluster(db, data.industryName)
         if cluster:
             store.industry_cluster_label = cluster.cluster_label
             store.industry_cluster_type = cluster.industry_type_code
 
-    db.commit()
-    db.refresh(store)
+    await db.commit()
+    await db.refresh(store)
 
     return StoreOut(
         id=store.id,
@@ -113,13 +246,18 @@ def update_store(
 
 
 @router.get("/me/industry")
-def get_my_industry(
-        db: Session = Depends(get_db),
+async def get_my_industry(
+        response: Response,
+        db: AsyncSession = Depends(get_async_read_db),
         user=Depends(get_current_user),
+        if_none_match: Optional[str] = Header(None),
 ):
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    etag = await _get_my_store_etag(db, user.id, "industry", with_images=False)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    store = await _get_my_store(db, user.id)
 
     return {
         "industry_name": store.industry_name,
@@ -129,14 +267,19 @@ def get_my_industry(
 
 
 @router.get("/me/district")
-def get_my_district(
-        db: Session = Depends(get_db),
+async def get_my_district(
+        response: Response,
+        db: AsyncSession = Depends(get_async_read_db),
         user=Depends(get_current_user),
+        if_none_match: Optional[str] = Header(None),
 ):
     """내 상권 정보 조회"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    etag = await _get_my_store_etag(db, user.id, "district", with_images=False)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    store = await _get_my_store(db, user.id)
 
     return {
         "district_code": store.district_code,
@@ -151,20 +294,26 @@ def get_my_district(
 
 
 @router.post("/search/kakao/bulk", response_model=KakaoPlaceBulkResponse)
-def check_stores_by_place_ids(
+async def check_stores_by_place_ids(
         data: KakaoPlaceBulkRequest,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_read_db),
 ):
     place_ids = [p.placeId for p in data.places]
     if not place_ids:
         return KakaoPlaceBulkResponse(results=[])
 
-    db_stores = (
-        db.query(UserStore)
-        .filter(UserStore.kakao_place_id.in_(place_ids))
-        .all()
-    )
-    store_map: Dict[str, UserStore] = {s.kakao_place_id: s for s in db_stores}
+    # 멤버십 집합에 없는 id 는 DB 조회 없이 비회원
+    await place_membership.ensure_fresh(db)
+    candidates = [pid for pid in set(place_ids) if place_membership.might_contain(pid)]
+
+    store_map: Dict[str, UserStore] = {}
+    if candidates:
+        db_stores = (
+            await db.scalars(
+                select(UserStore).where(UserStore.kakao_place_id.in_(candidates))
+            )
+        ).all()
+        store_map = {s.kakao_place_id: s for s in db_stores}
 
     results: list[KakaoPlaceBulkResultItem] = []
 
@@ -199,25 +348,141 @@ def check_stores_by_place_ids(
     return KakaoPlaceBulkResponse(results=results)
 
 
+# StoreOut 에 필요한 컬럼만 조회 (ORM 객체를 만들지 않음)
+_STORE_OUT_COLUMNS = (
+    UserStore.kakao_place_id,
+    UserStore.id,
+    UserStore.store_name,
+    UserStore.industry_name,
+    UserStore.district_name,
+    UserStore.road_address_name,
+    UserStore.x,
+    UserStore.y,
+)
+
+
+async def _read_ndjson_place_ids(request: Request) -> List[str]:
+    """
+    NDJSON 요청 본문에서 placeId 만 추출 ({"placeId": "...", ...} 한 줄에 하나)
+    StreamingResponse 가 응답 중 receive 채널을 점유하므로 본문은 응답 전에 모두 읽는다.
+    PLACE_MEMBERSHIP_MAX_IDS 개를 넘는 순간 나머지 본문은 읽지 않고 400.
+    """
+    max_ids = settings.PLACE_MEMBERSHIP_MAX_IDS
+    place_ids: List[str] = []
+    buffer = b""
+    line_no = 0
+
+    def _parse(line: bytes) -> None:
+        nonlocal line_no
+        line_no += 1
+        if not line.strip():
+            return
+        try:
+            place_id = json.loads(line)["placeId"]
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail=f"{line_no}번째 줄이 올바른 NDJSON 이 아닙니다.")
+        place_ids.append(str(place_id))
+        if len(place_ids) > max_ids:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 최대 {max_ids}개 장소까지 조회할 수 있습니다.",
+            )
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            _parse(line)
+    _parse(buffer)
+    return place_ids
+
+
+async def _stream_place_membership(place_ids: List[str]):
+    """PLACE_MEMBERSHIP_CHUNK_SIZE 개씩 IN 조회하고 chunk 가 끝날 때마다 결과 줄을 내보낸다"""
+    chunk_size = settings.PLACE_MEMBERSHIP_CHUNK_SIZE
+    # 응답 스트리밍 동안 요청 스코프 세션과 무관하게 자체 세션 사용
+    async with AsyncReadSessionLocal() as db:
+        await place_membership.ensure_fresh(db)
+        await db.rollback()
+
+        for start in range(0, len(place_ids), chunk_size):
+            chunk = place_ids[start:start + chunk_size]
+            # 멤버십 집합에 있는 id 만 DB 확인 (chunk 전체가 비회원이면 조회 생략)
+            candidates = [pid for pid in set(chunk) if place_membership.might_contain(pid)]
+            if not candidates:
+                yield "".join(
+                    json.dumps({"placeId": pid, "isMember": False, "store": None}, ensure_ascii=False) + "\n"
+                    for pid in chunk
+                )
+                continue
+
+            rows = await db.execute(
+                select(*_STORE_OUT_COLUMNS).where(UserStore.kakao_place_id.in_(candidates))
+            )
+            store_map = {
+                row.kakao_place_id: {
+                    "id": row.id,
+                    "store_name": row.store_name,
+                    "industry_name": row.industry_name,
+                    "district_name": row.district_name,
+                    "road_address_name": row.road_address_name,
+                    "x": float(row.x) if row.x is not None else None,
+                    "y": float(row.y) if row.y is not None else None,
+                }
+                for row in rows
+            }
+            # 다음 chunk 조회 동안 커넥션을 잡고 있지 않도록 트랜잭션 종료
+            await db.rollback()
+
+            lines = []
+            for place_id in chunk:
+                store = store_map.get(place_id)
+                lines.append(json.dumps(
+                    {"placeId": place_id, "isMember": store is not None, "store": store},
+                    ensure_ascii=False,
+                ))
+            yield "\n".join(lines) + "\n"
+
+
+@router.post("/search/kakao/bulk/stream")
+async def stream_stores_by_place_ids(request: Request):
+    """
+    카카오 장소 회원 여부 조회 (NDJSON 스트리밍)
+    요청/응답 모두 한 줄에 한 장소 - 응답 줄은 /search/kakao/bulk 결과 항목과 같은 형식
+    """
+    place_ids = await _read_ndjson_place_ids(request)
+    return StreamingResponse(_stream_place_membership(place_ids), media_type="application/x-ndjson")
+
+
+@router.get("/nearby", response_model=NearbyStoresResponse)
+async def get_nearby_stores(
+        lat: float = Query(..., ge=-90, le=90, description="위도"),
+        lng: float = Query(..., ge=-180, le=180, description="경도"),
+        radius: float = Query(500, gt=0, le=5000, description="반경 (미터)"),
+        limit: int = Query(50, ge=1, le=200),
+        db: AsyncSession = Depends(get_async_read_db),
+):
+    """주변 회원 매장 (geohash 셀 범위 조회 + 정확한 거리 필터, 가까운 순)"""
+    results = await db.run_sync(find_nearby_stores, lat, lng, radius, limit)
+    return NearbyStoresResponse(results=results)
+
+
 # ----- 새로운 매장 정보 수정 APIs -----
 
 @router.get("/me/detail", response_model=StoreDetailOut)
-def get_my_store_detail(
-    db: Session = Depends(get_db),
+async def get_my_store_detail(
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     user=Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ):
-    """내 매장 상세 정보 조회 (이미지 포함)"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    """내 매장 상세 정보 조회 (이미지 포함, If-None-Match 일치 시 304)"""
+    etag = await _get_my_store_etag(db, user.id, "detail", with_images=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
 
-    # 이미지들도 함께 조회
-    images = (
-        db.query(StoreImage)
-        .filter(StoreImage.user_store_id == store.id)
-        .order_by(StoreImage.sequence)
-        .all()
-    )
+    store = await _get_my_store(db, user.id, with_images=True)
 
     return StoreDetailOut(
         id=store.id,
@@ -235,28 +500,26 @@ def get_my_store_detail(
                 imageUrl=img.image_url,
                 sequence=img.sequence
             )
-            for img in images
+            for img in store.images
         ]
     )
 
 
 @router.patch("/me/info", response_model=dict)
-def update_my_store_info(
+async def update_my_store_info(
     data: StoreInfoUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
     """내 매장 상세 내용 수정"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    store = await _get_my_store(db, user.id)
 
     # 상세 내용 업데이트
     if data.storeDescription is not None:
         store.store_description = data.storeDescription
 
-    db.commit()
-    db.refresh(store)
+    await db.commit()
+    await db.refresh(store)
 
     return {
         "success": True,
@@ -268,28 +531,26 @@ def update_my_store_info(
 
 
 @router.post("/me/images", response_model=StoreImageOut)
-def add_store_image(
+async def add_store_image(
     data: StoreImageUpload,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
     """매장 이미지 추가"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    store = await _get_my_store(db, user.id)
 
     # sequence 유효성 검사
     if not (1 <= data.sequence <= 5):
         raise HTTPException(status_code=400, detail="이미지 순서는 1~5 사이여야 합니다.")
 
     # 동일한 sequence가 이미 있는지 확인
-    existing_image = (
-        db.query(StoreImage)
-        .filter(
+    existing_image = await db.scalar(
+        select(StoreImage)
+        .where(
             StoreImage.user_store_id == store.id,
             StoreImage.sequence == data.sequence
         )
-        .first()
+        .limit(1)
     )
 
     if existing_image:
@@ -306,8 +567,16 @@ def add_store_image(
     )
 
     db.add(new_image)
-    db.commit()
-    db.refresh(new_image)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 확인 후 커밋 사이에 같은 순서가 먼저 들어온 경우 (uq_store_images_store_sequence)
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"순서 {data.sequence}에 이미 이미지가 있습니다. 먼저 삭제해주세요."
+        )
+    await db.refresh(new_image)
 
     return StoreImageOut(
         id=new_image.id,
@@ -317,21 +586,19 @@ def add_store_image(
 
 
 @router.get("/me/images", response_model=List[StoreImageOut])
-def get_my_store_images(
-    db: Session = Depends(get_db),
+async def get_my_store_images(
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     user=Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ):
-    """내 매장 이미지 목록 조회"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    """내 매장 이미지 목록 조회 (If-None-Match 일치 시 304)"""
+    etag = await _get_my_store_etag(db, user.id, "images", with_images=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
 
-    images = (
-        db.query(StoreImage)
-        .filter(StoreImage.user_store_id == store.id)
-        .order_by(StoreImage.sequence)
-        .all()
-    )
+    store = await _get_my_store(db, user.id, with_images=True)
 
     return [
         StoreImageOut(
@@ -339,29 +606,27 @@ def get_my_store_images(
             imageUrl=img.image_url,
             sequence=img.sequence
         )
-        for img in images
+        for img in store.images
     ]
 
 
 @router.put("/me/images/{image_id}")
-def update_store_image(
+async def update_store_image(
     image_id: int,
     data: StoreImageUpload,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
     """매장 이미지 수정"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    store = await _get_my_store(db, user.id)
 
-    image = (
-        db.query(StoreImage)
-        .filter(
+    image = await db.scalar(
+        select(StoreImage)
+        .where(
             StoreImage.id == image_id,
             StoreImage.user_store_id == store.id
         )
-        .first()
+        .limit(1)
     )
     
     if not image:
@@ -373,14 +638,14 @@ def update_store_image(
 
     # 다른 이미지가 동일한 sequence를 사용하는지 확인
     if data.sequence != image.sequence:
-        existing_image = (
-            db.query(StoreImage)
-            .filter(
+        existing_image = await db.scalar(
+            select(StoreImage)
+            .where(
                 StoreImage.user_store_id == store.id,
                 StoreImage.sequence == data.sequence,
                 StoreImage.id != image_id
             )
-            .first()
+            .limit(1)
         )
 
         if existing_image:
@@ -393,8 +658,16 @@ def update_store_image(
     image.image_url = data.imageUrl
     image.sequence = data.sequence
 
-    db.commit()
-    db.refresh(image)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 확인 후 커밋 사이에 같은 순서가 먼저 들어온 경우 (uq_store_images_store_sequence)
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"순서 {data.sequence}에 이미 다른 이미지가 있습니다."
+        )
+    await db.refresh(image)
 
     return {
         "success": True,
@@ -408,30 +681,28 @@ def update_store_image(
 
 
 @router.delete("/me/images/{image_id}")
-def delete_store_image(
+async def delete_store_image(
     image_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
     """매장 이미지 삭제"""
-    store = db.query(UserStore).filter(UserStore.user_id == user.id).first()
-    if not store:
-        raise HTTPException(status_code=404, detail="등록된 매장이 없습니다.")
+    store = await _get_my_store(db, user.id)
 
-    image = (
-        db.query(StoreImage)
-        .filter(
+    image = await db.scalar(
+        select(StoreImage)
+        .where(
             StoreImage.id == image_id,
             StoreImage.user_store_id == store.id
         )
-        .first()
+        .limit(1)
     )
     
     if not image:
         raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
 
-    db.delete(image)
-    db.commit()
+    await db.delete(image)
+    await db.commit()
 
     return {
         "success": True,
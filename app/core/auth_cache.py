@@ -0,0 +1,75 @@
+"""
+인증 캐시
+
+- 토큰 캐시: 같은 Bearer 토큰을 매 요청마다 다시 검증하지 않도록 디코딩 결과 보관
+  (토큰의 exp 이후에는 캐시가 있어도 사용하지 않음)
+- 사용자 캐시: user_id → AuthPrincipal, 짧은 TTL + invalidate_user() 로 명시적 무효화
+"""
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.config.settings import settings
+from app.core.cache import MISSING, TTLCache
+from app.core.security import decode_token
+
+
+@dataclass(frozen=True)
+class AuthPrincipal:
+    """인증된 사용자 (핸들러는 id 만 사용)"""
+    id: int
+    login_id: Optional[str] = None
+    name: Optional[str] = None
+
+    @classmethod
+    def from_claims(cls, payload: Dict) -> "AuthPrincipal":
+        return cls(
+            id=int(payload["sub"]),
+            login_id=payload.get("login_id"),
+            name=payload.get("name"),
+        )
+
+
+_token_cache = TTLCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+_user_cache = TTLCache(
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+
+def decode_token_cached(token: str) -> Optional[dict]:
+    payload = _token_cache.get(token)
+    if payload is not MISSING:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _token_cache.delete(token)
+
+    payload = decode_token(token)
+    if payload:
+        _token_cache.set(token, payload)
+    return payload
+
+
+def get_cached_user(user_id: int) -> Optional[AuthPrincipal]:
+    principal = _user_cache.get(user_id)
+    return None if principal is MISSING else principal
+
+
+def cache_user(principal: AuthPrincipal) -> None:
+    _user_cache.set(principal.id, principal)
+
+
+def invalidate_user(user_id: int) -> None:
+    """사용자 정보 변경/삭제 시 호출"""
+    _user_cache.delete(user_id)
+
+
+def auth_cache_info() -> Dict:
+    return {
+        "tokens": {"size": len(_token_cache), **_token_cache.stats.as_dict()},
+        "users": {"size": len(_user_cache), **_user_cache.stats.as_dict()},
+        "trust_token_claims": settings.AUTH_TRUST_TOKEN_CLAIMS,
+    }
@@ -0,0 +1,211 @@
+"""
+응답 캐시 계층
+
+- TTLCache: 프로세스 메모리 TTL + LRU 캐시 (크기 제한, 스레드 안전)
+- CacheBackend: 비동기 캐시 인터페이스 (memory / redis 구현)
+- make_cache_key: 질의 파라미터를 정규화해 캐시 키 생성
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# 캐시 미스 표시 (None 도 캐시 가능한 값이므로 별도 센티널 사용)
+MISSING = object()
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class TTLCache:
+    """TTL 만료 + LRU 제거 + 최대 항목 수 제한 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return MISSING
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.stats.misses += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class CacheBackend:
+    """비동기 캐시 백엔드 인터페이스"""
+
+    name = "none"
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Any:
+        self.stats.misses += 1
+        return MISSING
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": self.name, **self.stats.as_dict()}
+
+
+class MemoryCacheBackend(CacheBackend):
+    name = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        super().__init__()
+        self._cache = TTLCache(max_entries, ttl_seconds)
+        self.stats = self._cache.stats
+
+    async def get(self, key: str) -> Any:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        self._cache.set(key, value, ttl_seconds)
+
+    def info(self) -> Dict[str, Any]:
+        return {**super().info(), "size": len(self._cache), "max_entries": self._cache.max_entries}
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 캐시 (값은 JSON 직렬화)
+    크기 제한/LRU 제거는 Redis 서버의 maxmemory + allkeys-lru 정책을 따른다.
+    Redis 장애 시에는 캐시 미스로 처리하고 요청은 계속 진행한다.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl_seconds: float, prefix: str):
+        super().__init__()
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+        return self._client
+
+    async def get(self, key: str) -> Any:
+        try:
+            raw = await self._get_client().get(self.prefix + key)
+        except Exception as e:
+            self.stats.errors += 1
+            print(f"⚠️  Redis cache get failed: {e!r}")
+            raw = None
+
+        if raw is None:
+            self.stats.misses += 1
+            return MISSING
+        self.stats.hits += 1
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            await self._get_client().set(
+                self.prefix + key, json.dumps(value, ensure_ascii=False), ex=max(1, int(ttl))
+            )
+        except Exception as e:
+            self.stats.errors += 1
+            print(f"⚠️  Redis cache set failed: {e!r}")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+def create_cache_backend(
+    kind: str,
+    max_entries: int,
+    ttl_seconds: float,
+    redis_url: str,
+    prefix: str,
+) -> CacheBackend:
+    kind = (kind or "none").lower()
+    if kind == "memory":
+        return MemoryCacheBackend(max_entries, ttl_seconds)
+    if kind == "redis":
+        return RedisCacheBackend(redis_url, ttl_seconds, prefix)
+    return CacheBackend()
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    if isinstance(value, float):
+        return round(value, 6)  # 약 0.1m 단위
+    return value
+
+
+def make_cache_key(namespace: str, params: Dict[str, Any]) -> str:
+    """
+    정규화된 파라미터로 캐시 키 생성
+    - None 값 제거, 키 정렬
+    - 문자열: 앞뒤/중복 공백 제거 + 소문자
+    - 실수: 소수 6자리 반올림
+    """
+    normalized = {k: _normalize(v) for k, v in sorted(params.items()) if v is not None}
+    payload = json.dumps(normalized, ensure_ascii=False, sort_keys=True)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
@@ -0,0 +1,27 @@
+"""
+Celery 앱 (백그라운드 작업)
+
+워커 실행:
+    celery -A app.core.celery_app worker -l info
+"""
+from celery import Celery
+
+from app.config.settings import settings
+
+celery_app = Celery(
+    "shh_server",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.tasks.district_tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    timezone="Asia/Seoul",
+    task_track_started=True,
+    # 장시간 배치 작업 - 워커가 죽으면 다른 워커가 다시 받도록
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+)
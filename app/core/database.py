@@ -1,17 +1,80 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config.settings import settings
+from app.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_engine
 
-# 연결 설정 최적화: pool_pre_ping 제거, 연결 수 제한
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=5,  # 연결 풀 크기 제한
-    max_overflow=0,  # 추가 연결 생성 금지
-    future=True,
+
+def _pool_options(pool_size: int, max_overflow: int) -> dict:
+    """커넥션 풀 설정 (Settings 의 DB_POOL_* 값)"""
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": settings.DB_POOL_RECYCLE,  # MySQL wait_timeout 이전에 커넥션 교체
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,  # 풀 고갈 시 대기 상한 (초)
+    }
+
+
+def _create_sync_engine(url: str, name: str):
+    engine = create_engine(
+        url,
+        poolclass=TimedQueuePool,  # checkout 대기 시간 측정
+        pool_logging_name=name,
+        future=True,
+        **_pool_options(settings.DB_SYNC_POOL_SIZE, settings.DB_SYNC_MAX_OVERFLOW),
+    )
+    instrument_engine(engine, name)
+    return engine
+
+
+def _create_async_engine(url: str, name: str):
+    # 이벤트 루프에서 커넥션을 기다리므로 스레드풀 슬롯을 점유하지 않는다
+    engine = create_async_engine(
+        url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name=name,
+        future=True,
+        **_pool_options(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+    )
+    instrument_engine(engine.sync_engine, name)
+    return engine
+
+
+# 동기 엔진 (debug / districts 라우터, 배치 작업)
+engine = _create_sync_engine(settings.DATABASE_URL, "sync")
+# 읽기 전용 레플리카 - 지정하지 않으면 primary 를 그대로 사용
+read_engine = (
+    _create_sync_engine(settings.DATABASE_REPLICA_URL, "sync_replica")
+    if settings.DATABASE_REPLICA_URL
+    else engine
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# 비동기 엔진 (aiomysql) - async def 라우터용
+async_engine = _create_async_engine(settings.ASYNC_DATABASE_URL, "async")
+async_read_engine = (
+    _create_async_engine(settings.ASYNC_DATABASE_REPLICA_URL, "async_replica")
+    if settings.ASYNC_DATABASE_REPLICA_URL
+    else async_engine
+)
+
+# commit 후에도 응답 생성 시 속성 접근이 가능하도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
@@ -22,3 +85,30 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """읽기 전용 세션 (레플리카) - 쓰기/commit 금지"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """읽기 전용 비동기 세션 (레플리카) - 쓰기/commit 금지"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    for async_eng in {async_engine, async_read_engine}:
+        await async_eng.dispose()
+    for sync_eng in {engine, read_engine}:
+        sync_eng.dispose()
@@ -0,0 +1,43 @@
+"""
+조건부 GET (ETag / If-None-Match)
+
+응답 본문을 조립하지 않고 본문에 들어가는 값(매장 컬럼, 이미지 id/순서/URL 등)으로
+약한 ETag 를 만들고, 클라이언트가 보낸 If-None-Match 와 비교한다.
+"""
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response
+
+# 클라이언트가 매번 재검증하도록 (본문은 바뀌지 않았으면 304)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """값들로 약한 ETag 생성 (W/"sha1")"""
+    payload = "\x1f".join("" if p is None else str(p) for p in parts)
+    return f'W/"{hashlib.sha1(payload.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 (약한 비교, 여러 값/`*` 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = _opaque(etag)
+    return any(_opaque(tag) == target for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
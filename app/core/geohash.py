@@ -0,0 +1,120 @@
+"""
+Geohash 인코딩 / 반경 검색용 셀 계산
+
+- encode: 위도/경도 → base32 geohash (같은 접두사 = 같은 격자 셀)
+- covering_prefixes: 반경 r 원을 덮는 3x3 셀 접두사 (접두사 범위 스캔용)
+"""
+import math
+from typing import List, Tuple
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {c: i for i, c in enumerate(BASE32)}
+
+# user_stores.geohash 저장 길이 (약 4.8m x 4.8m)
+STORE_PRECISION = 9
+
+# 반경 판정은 haversine_np (구면, 반지름 6371km) 거리로 하므로 같은 구면으로 계산
+_EARTH_RADIUS_M = 6371000
+
+
+def encode(lat: float, lon: float, precision: int = STORE_PRECISION) -> str:
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # 짝수 비트는 경도
+
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                value = (value << 1) | 1
+                lon_lo = mid
+            else:
+                value <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                value = (value << 1) | 1
+                lat_lo = mid
+            else:
+                value <<= 1
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = 0
+            value = 0
+
+    return "".join(chars)
+
+
+def decode_bbox(geohash: str) -> Tuple[float, float, float, float]:
+    """geohash 셀 경계 (lat_min, lat_max, lon_min, lon_max)"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    even = True
+
+    for char in geohash:
+        value = _DECODE[char]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if even:
+                mid = (lon_lo + lon_hi) / 2
+                if bit:
+                    lon_lo = mid
+                else:
+                    lon_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if bit:
+                    lat_lo = mid
+                else:
+                    lat_hi = mid
+            even = not even
+
+    return lat_lo, lat_hi, lon_lo, lon_hi
+
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """precision 자리 셀의 (위도 높이, 경도 너비) - 도 단위"""
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def precision_for_radius(lat: float, radius_m: float, max_precision: int = STORE_PRECISION) -> int:
+    """셀 높이/너비가 반경 원의 위도/경도 반폭 이상인 가장 긴 precision (3x3 이웃이 원을 덮는다)"""
+    delta = radius_m / _EARTH_RADIUS_M
+    need_lat = math.degrees(delta)
+    # 원의 경도 반폭 = asin(sin δ / cos φ) (극에 가까워 1 이상이면 경도 전체)
+    ratio = math.sin(delta) / max(math.cos(math.radians(lat)), 1e-12)
+    need_lon = math.degrees(math.asin(ratio)) if ratio < 1 else 360.0
+
+    best = 1
+    for precision in range(1, max_precision + 1):
+        lat_deg, lon_deg = cell_size_degrees(precision)
+        if lat_deg < need_lat or lon_deg < need_lon:
+            break
+        best = precision
+    return best
+
+
+def covering_prefixes(lat: float, lon: float, radius_m: float) -> List[str]:
+    """(lat, lon) 중심 반경 radius_m 원을 덮는 셀 접두사 (중심 셀 + 8개 이웃, 중복 제거)"""
+    precision = precision_for_radius(lat, radius_m)
+    lat_deg, lon_deg = cell_size_degrees(precision)
+
+    prefixes = []
+    for d_lat in (-lat_deg, 0.0, lat_deg):
+        for d_lon in (-lon_deg, 0.0, lon_deg):
+            cell_lat = min(max(lat + d_lat, -90.0), 90.0 - 1e-12)
+            cell_lon = (lon + d_lon + 180.0) % 360.0 - 180.0
+            prefix = encode(cell_lat, cell_lon, precision)
+            if prefix not in prefixes:
+                prefixes.append(prefix)
+    return prefixes
@@ -0,0 +1,155 @@
+"""
+Prometheus 메트릭
+
+- HTTP: 라우트별 지연 시간 히스토그램, 처리 중 요청 수, 요청당 쿼리 수
+- DB 커넥션 풀: checkout 대기 시간, 타임아웃(풀 고갈), 사용 중 커넥션 수/포화도
+- 카카오 API: upstream 지연 시간과 상태 코드
+"""
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+)
+QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries",
+    "요청 하나가 실행한 SQL 문 수",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21, 50, 100),
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 대기한 시간",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "풀 고갈로 커넥션을 얻지 못한 횟수",
+    ["engine"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "사용 중인 커넥션 수",
+    ["engine"],
+)
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity_connections",
+    "풀이 만들 수 있는 최대 커넥션 수 (pool_size + max_overflow)",
+    ["engine"],
+)
+DB_POOL_SATURATION = Gauge(
+    "db_pool_saturation_ratio",
+    "사용 중 커넥션 / 최대 커넥션",
+    ["engine"],
+)
+
+KAKAO_LATENCY = Histogram(
+    "kakao_api_request_duration_seconds",
+    "카카오 API upstream 요청 시간",
+    ["endpoint", "status"],
+)
+
+# 요청 단위 쿼리 카운터 (미들웨어가 요청마다 새 리스트를 넣는다)
+_query_count: ContextVar[Optional[List[int]]] = ContextVar("query_count", default=None)
+
+
+class _TimedCheckoutMixin:
+    """connect() 대기 시간을 측정하는 풀 (pool_logging_name 을 메트릭 라벨로 사용)"""
+
+    def connect(self):
+        name = getattr(self, "logging_name", None) or "default"
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(name).observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_checked_out(engine: Engine) -> float:
+    pool = engine.pool
+    return float(pool.checkedout()) if hasattr(pool, "checkedout") else 0.0
+
+
+def _pool_capacity(engine: Engine) -> float:
+    pool = engine.pool
+    if not hasattr(pool, "size"):
+        return 0.0
+    return float(pool.size() + max(0, getattr(pool, "_max_overflow", 0)))
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """풀 게이지와 쿼리 카운터 이벤트 등록 (비동기 엔진은 sync_engine 을 넘긴다)"""
+    DB_POOL_CHECKED_OUT.labels(name).set_function(lambda: _pool_checked_out(engine))
+    DB_POOL_CAPACITY.labels(name).set_function(lambda: _pool_capacity(engine))
+    DB_POOL_SATURATION.labels(name).set_function(
+        lambda: _pool_checked_out(engine) / (_pool_capacity(engine) or 1.0)
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_count.get()
+        if counter is not None:
+            counter[0] += 1
+
+
+class MetricsMiddleware:
+    """라우트 지연 시간 / 처리 중 요청 / 요청당 쿼리 수 측정 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        counter = [0]
+        token = _query_count.set(counter)
+        REQUESTS_IN_FLIGHT.labels(method).inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_FLIGHT.labels(method).dec()
+            _query_count.reset(token)
+
+            # 경로 파라미터가 값으로 들어가지 않도록 라우트 템플릿 사용
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            REQUEST_LATENCY.labels(method, route_path, str(status["code"])).observe(elapsed)
+            QUERIES_PER_REQUEST.labels(route_path).observe(counter[0])
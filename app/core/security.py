@@ -1,17 +1,25 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
 from app.config.settings import settings
 
 pwd_context = CryptContext(
     schemes=["pbkdf2_sha256"],
     deprecated="auto",
+    pbkdf2_sha256__default_rounds=settings.PASSWORD_HASH_ROUNDS,  # 해시 작업량
 )
 ALGORITHM = "HS256"
 
+# 해싱 전용 프로세스 풀 (요청 스레드/이벤트 루프와 CPU 작업 분리)
+_hash_executor: Optional[ProcessPoolExecutor] = None
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -21,6 +29,42 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+def start_hash_executor() -> Optional[ProcessPoolExecutor]:
+    """PASSWORD_HASH_WORKERS > 0 이면 프로세스 풀 생성 (앱 startup 에서 호출)"""
+    global _hash_executor
+    if _hash_executor is None and settings.PASSWORD_HASH_WORKERS > 0:
+        _hash_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            # 이벤트 루프/스레드를 가진 프로세스를 fork 하지 않도록 spawn 사용
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def _run_hash(fn, *args):
+    executor = start_hash_executor()
+    if executor is None:
+        # 프로세스 풀 비활성화 시 스레드풀에서 실행
+        return await run_in_threadpool(fn, *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hash(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_hash(verify_password, plain, hashed)
+
+
 def create_access_token(data: dict, expires_minutes: Optional[int] = None) -> str:
     to_encode = data.copy()
     minutes = expires_minutes or settings.ACCESS_TOKEN_EXPIRE_MINUTES
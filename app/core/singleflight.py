@@ -0,0 +1,37 @@
+"""
+Single-flight 요청 병합
+
+같은 키로 동시에 들어온 비동기 호출은 하나의 upstream 작업(Task)을 공유한다.
+먼저 들어온 호출이 작업을 시작하고, 뒤에 온 호출들은 같은 결과를 기다린다.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0  # 실제로 upstream 을 호출한 횟수
+        self.coalesced = 0  # 진행 중인 작업에 합류한 횟수
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.coalesced += 1
+
+        # 한 호출자가 취소되어도 공유 작업은 다른 호출자를 위해 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
@@ -1,14 +1,125 @@
+import asyncio
+import time
+
 import aiohttp
 from typing import Dict, Optional, List
 from app.config.settings import settings
+from app.core.cache import MISSING, CacheBackend, create_cache_backend, make_cache_key
+from app.core.metrics import KAKAO_LATENCY
+from app.core.singleflight import SingleFlight
 
 
 class KakaoAPIClient:
-    """카카오 Maps API 클라이언트"""
+    """
+    카카오 Maps API 클라이언트
+
+    앱 단위로 하나의 ClientSession(keep-alive 커넥션 풀)을 공유한다.
+    start()/close() 는 앱 startup/shutdown 에서 호출하며,
+    start() 전에 호출되면 첫 요청에서 세션을 만든다.
+
+    200 응답은 정규화된 질의 파라미터를 키로 캐시한다 (KAKAO_CACHE_BACKEND).
+    캐시 미스인 동일 질의가 동시에 들어오면 upstream 요청 하나를 공유한다.
+    """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheBackend] = None):
         self.api_key = settings.KAKAO_REST_API_KEY
-        self.base_url = "https://dapi.kakao.com"
+        self.base_url = settings.KAKAO_API_BASE_URL
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.cache = cache or create_cache_backend(
+            settings.KAKAO_CACHE_BACKEND,
+            max_entries=settings.KAKAO_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.KAKAO_CACHE_TTL_SECONDS,
+            redis_url=settings.REDIS_URL,
+            prefix="kakao:",
+        )
+        self._flights = SingleFlight()
+
+    async def start(self) -> None:
+        """커넥션 풀/세션 생성 (이미 열려 있으면 무시)"""
+        if self._session is not None and not self._session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=settings.KAKAO_HTTP_MAX_CONNECTIONS,  # 동시 커넥션 상한
+            keepalive_timeout=settings.KAKAO_HTTP_KEEPALIVE_SECONDS,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Authorization": f"KakaoAK {self.api_key}"},
+            timeout=aiohttp.ClientTimeout(
+                total=settings.KAKAO_HTTP_TIMEOUT_SECONDS,
+                connect=settings.KAKAO_HTTP_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+        if settings.KAKAO_MAX_CONCURRENCY > 0:
+            self._semaphore = asyncio.Semaphore(settings.KAKAO_MAX_CONCURRENCY)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._semaphore = None
+        await self.cache.close()
+
+    def cache_info(self) -> Dict:
+        """캐시 적중/미스 및 요청 병합 카운터"""
+        return {
+            **self.cache.info(),
+            "upstream_calls": self._flights.leaders,
+            "coalesced": self._flights.coalesced,
+            "inflight": len(self._flights),
+        }
+
+    async def _get(self, path: str, params: Dict) -> Optional[Dict]:
+        """
+        GET 요청 공통 처리
+
+        Returns:
+            200 응답의 JSON 또는 None (오류/타임아웃)
+        """
+        key = make_cache_key(path, params)
+        cached = await self.cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        return await self._flights.do(key, lambda: self._fetch_and_cache(key, path, params))
+
+    async def _fetch_and_cache(self, key: str, path: str, params: Dict) -> Optional[Dict]:
+        data = await self._fetch(path, params)
+        if data is not None:
+            await self.cache.set(key, data)
+        return data
+
+    async def _fetch(self, path: str, params: Dict) -> Optional[Dict]:
+        if self._session is None or self._session.closed:
+            await self.start()
+
+        if self._semaphore is not None:
+            async with self._semaphore:
+                return await self._send(path, params)
+        return await self._send(path, params)
+
+    async def _send(self, path: str, params: Dict) -> Optional[Dict]:
+        started = time.perf_counter()
+        status = "error"
+        try:
+            async with self._session.get(f"{self.base_url}{path}", params=params) as response:
+                status = str(response.status)
+                if response.status == 200:
+                    return await response.json()
+                print(f"⚠️  Kakao API {path} responded {response.status}")
+                return None
+        except asyncio.TimeoutError:
+            status = "timeout"
+            print(f"❌ Kakao API {path} timed out")
+            return None
+        except aiohttp.ClientError as e:
+            print(f"❌ Kakao API {path} failed: {e!r}")
+            return None
+        finally:
+            KAKAO_LATENCY.labels(path, status).observe(time.perf_counter() - started)
 
     async def convert_address_to_coordinates(
         self,
@@ -23,27 +134,17 @@ class KakaoAPIClient:
         Returns:
             좌표 정보 또는 None
         """
-        url = f"{self.base_url}/v2/local/search/address.json"
-        headers = {"Authorization": f"KakaoAK {self.api_key}"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers=headers,
-                params={"query": address}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data["documents"]:
-                        doc = data["documents"][0]
-                        return {
-                            "latitude": float(doc["y"]),
-                            "longitude": float(doc["x"]),
-                            "address": doc["address_name"],
-                            "road_address": doc.get("road_address_name"),
-                            "accuracy": "high" if doc["address_type"] == "ROAD_ADDR" else "medium"
-                        }
-                return None
+        data = await self._get("/v2/local/search/address.json", {"query": address})
+        if data and data["documents"]:
+            doc = data["documents"][0]
+            return {
+                "latitude": float(doc["y"]),
+                "longitude": float(doc["x"]),
+                "address": doc["address_name"],
+                "road_address": doc.get("road_address_name"),
+                "accuracy": "high" if doc["address_type"] == "ROAD_ADDR" else "medium"
+            }
+        return None
 
     async def get_nearby_places(
         self,
@@ -64,9 +165,6 @@ class KakaoAPIClient:
         Returns:
             매장 목록
         """
-        url = f"{self.base_url}/v2/local/search/category.json"
-        headers = {"Authorization": f"KakaoAK {self.api_key}"}
-
         params = {
             "category_group_code": category,
             "x": longitude,
@@ -75,25 +173,23 @@ class KakaoAPIClient:
             "size": 15
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [
-                        {
-                            "place_id": doc["id"],
-                            "name": doc["place_name"],
-                            "category": doc["category_name"],
-                            "address": doc["address_name"],
-                            "phone": doc.get("phone", ""),
-                            "latitude": float(doc["y"]),
-                            "longitude": float(doc["x"]),
-                            "distance": int(doc["distance"]) if doc.get("distance") else None,
-                            "place_url": doc.get("place_url", "")
-                        }
-                        for doc in data["documents"]
-                    ]
-                return []
+        data = await self._get("/v2/local/search/category.json", params)
+        if data is None:
+            return []
+        return [
+            {
+                "place_id": doc["id"],
+                "name": doc["place_name"],
+                "category": doc["category_name"],
+                "address": doc["address_name"],
+                "phone": doc.get("phone", ""),
+                "latitude": float(doc["y"]),
+                "longitude": float(doc["x"]),
+                "distance": int(doc["distance"]) if doc.get("distance") else None,
+                "place_url": doc.get("place_url", "")
+            }
+            for doc in data["documents"]
+        ]
 
     async def search_keyword(
         self,
@@ -114,9 +210,6 @@ class KakaoAPIClient:
         Returns:
             검색 결과
         """
-        url = f"{self.base_url}/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {self.api_key}"}
-
         params = {"query": query}
         if latitude and longitude:
             params["x"] = longitude
@@ -124,22 +217,24 @@ class KakaoAPIClient:
         if radius:
             params["radius"] = radius
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [
-                        {
-                            "place_id": doc["id"],
-                            "name": doc["place_name"],
-                            "category": doc["category_name"],
-                            "address": doc["address_name"],
-                            "road_address": doc.get("road_address_name", ""),
-                            "phone": doc.get("phone", ""),
-                            "latitude": float(doc["y"]),
-                            "longitude": float(doc["x"]),
-                            "distance": int(doc["distance"]) if doc.get("distance") else None,
-                        }
-                        for doc in data["documents"]
-                    ]
-                return []
\ No newline at end of file
+        data = await self._get("/v2/local/search/keyword.json", params)
+        if data is None:
+            return []
+        return [
+            {
+                "place_id": doc["id"],
+                "name": doc["place_name"],
+                "category": doc["category_name"],
+                "address": doc["address_name"],
+                "road_address": doc.get("road_address_name", ""),
+                "phone": doc.get("phone", ""),
+                "latitude": float(doc["y"]),
+                "longitude": float(doc["x"]),
+                "distance": int(doc["distance"]) if doc.get("distance") else None,
+            }
+            for doc in data["documents"]
+        ]
+
+
+# 앱 전역에서 공유하는 클라이언트 (세션은 app startup/shutdown 에서 열고 닫음)
+kakao_client = KakaoAPIClient()
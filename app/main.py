@@ -1,10 +1,15 @@
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware  # ✅ CORS 미들웨어 추가
 from fastapi.openapi.utils import get_openapi   # ⭐ 추가됨
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from app.core.database import Base, engine
-from app.api.v1 import auth, stores, recommendations, debug
+from app.core.database import Base, engine, dispose_engines
+from app.core.metrics import MetricsMiddleware
+from app.core.security import start_hash_executor, shutdown_hash_executor
+from app.api.v1 import auth, stores, recommendations, debug, districts
+from app.external.kakao_client import kakao_client
+from app.services.reference_snapshot import reference_snapshot
 
 app = FastAPI(title="소확행 API v1")
 
@@ -22,11 +27,40 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 라우트 지연 시간 / 처리 중 요청 / 요청당 쿼리 수
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(stores.router, prefix="/api/v1")
 app.include_router(recommendations.router, prefix="/api/v1")
 app.include_router(debug.router, prefix="/api/v1")
+app.include_router(districts.router, prefix="/api/v1")
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.on_event("startup")
+async def startup():
+    # 카카오 API keep-alive 세션 생성
+    await kakao_client.start()
+    # 비밀번호 해싱 프로세스 풀 (첫 로그인에서 워커 기동 지연이 없도록 미리 생성)
+    start_hash_executor()
+    # 참조 데이터 스냅샷 백그라운드 빌드/갱신 (요청 경로에서는 DB 조회 없음)
+    reference_snapshot.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    # 비동기 커넥션 풀 / 카카오 세션 정리
+    reference_snapshot.stop()
+    await kakao_client.close()
+    await dispose_engines()
+    shutdown_hash_executor()
 
 
 # OpenAPI 스키마 캐싱 (부팅 속도 개선)
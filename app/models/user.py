@@ -10,6 +10,7 @@ from sqlalchemy import (
     ForeignKey,
     DECIMAL,
     CheckConstraint,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 
@@ -38,9 +39,9 @@ class UserStore(Base):
     __tablename__ = "user_stores"
 
     id = Column(BigInteger, primary_key=True, index=True)
-    user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
-    kakao_place_id = Column(String(50), nullable=True)
+    kakao_place_id = Column(String(50), nullable=True, index=True)  # 카카오 장소 회원 여부 조회
     store_name = Column(String(150), nullable=False)
     place_url = Column(String(255), nullable=True)
     phone = Column(String(20), nullable=True)
@@ -50,6 +51,7 @@ class UserStore(Base):
     # 좌표 정보 - DDL과 정확히 일치 (11,7)
     x = Column(DECIMAL(11, 7), nullable=True)  # longitude
     y = Column(DECIMAL(11, 7), nullable=True)  # latitude
+    geohash = Column(String(12), nullable=True, index=True)  # 좌표 geohash - 주변 매장 접두사 검색
 
     # 상권 정보
     district_code = Column(String(20), nullable=True)
@@ -145,4 +147,6 @@ class StoreImage(Base):
 
     __table_args__ = (
         CheckConstraint("sequence BETWEEN 1 AND 5", name="chk_sequence_range"),
+        # 매장당 순서 중복 방지 + user_store_id 조회 인덱스 (선두 컬럼)
+        UniqueConstraint("user_store_id", "sequence", name="uq_store_images_store_sequence"),
     )
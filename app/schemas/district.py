@@ -0,0 +1,27 @@
+from typing import Optional, List
+
+from pydantic import BaseModel
+
+
+# ----- 좌표 배치 → 최근접 상권 -----
+class CoordinateItem(BaseModel):
+    x: float  # longitude (경도)
+    y: float  # latitude (위도)
+
+
+class NearestDistrictBatchRequest(BaseModel):
+    coordinates: List[CoordinateItem]
+
+
+class NearestDistrictItem(BaseModel):
+    x: float
+    y: float
+    district_code: Optional[str] = None
+    district_name: Optional[str] = None
+    district_cluster_label: Optional[int] = None
+    district_cluster_type: Optional[str] = None
+    distance_meters: Optional[float] = None
+
+
+class NearestDistrictBatchResponse(BaseModel):
+    results: List[NearestDistrictItem]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -17,3 +17,37 @@ class IndustryRecommendationResponse(BaseModel):
     clusterLabel: int
     clusterName: str
     recommendations: List[IndustryRecommendationItem]
+
+
+class PartnerRecommendationItem(BaseModel):
+    storeId: int
+    storeName: str
+    industryName: Optional[str]
+    districtName: Optional[str]
+    distanceMeters: float
+    industryAffinity: float  # 0~100, 업종 유사도 (같은 클러스터만)
+    sameDistrictCluster: bool
+    score: float  # 0~100
+    comment: str
+
+
+class PartnerRecommendationResponse(BaseModel):
+    storeId: int
+    storeName: str
+    radiusMeters: float
+    candidateCount: int
+    recommendations: List[PartnerRecommendationItem]
+
+
+class DistrictFitItem(BaseModel):
+    industryName: str
+    clusterLabel: int
+    ratio: float  # 상권 유형 내 업종 비율
+    lift: float  # ratio / 업종의 유형 평균 비율
+
+
+class DistrictFitResponse(BaseModel):
+    mode: str  # "industries" (상권 유형 → 업종) | "clusters" (업종 → 상권 유형)
+    clusterLabel: Optional[int] = None
+    industryName: Optional[str] = None
+    results: List[DistrictFitItem]
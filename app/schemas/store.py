@@ -83,6 +83,15 @@ class StoreOut(BaseModel):
         from_attributes = True
 
 
+# ----- 주변 회원 매장 -----
+class NearbyStoreOut(StoreOut):
+    distance_meters: float
+
+
+class NearbyStoresResponse(BaseModel):
+    results: List[NearbyStoreOut]
+
+
 # ----- Kakao 배치 검색 -----
 class KakaoPlaceItem(BaseModel):
     placeId: str
@@ -101,3 +110,17 @@ class KakaoPlaceBulkResultItem(BaseModel):
 
 class KakaoPlaceBulkResponse(BaseModel):
     results: List[KakaoPlaceBulkResultItem]
+
+
+# ----- 매장 일괄 등록 -----
+class StoreBulkImportError(BaseModel):
+    row: int  # 입력 순서 (1부터)
+    kakaoPlaceId: Optional[str] = None
+    error: str
+
+
+class StoreBulkImportResponse(BaseModel):
+    total: int
+    created: int
+    failed: int
+    errors: List[StoreBulkImportError] = []
@@ -0,0 +1,232 @@
+"""
+상권 좌표 공간 인덱스
+
+district_clusters 의 좌표를 프로세스 메모리에 격자(grid) 인덱스로 올려두고
+가장 가까운 상권을 DB 조회 없이 찾는다.
+빌드/갱신은 참조 데이터 스냅샷(reference_snapshot)이 담당한다.
+"""
+import math
+from typing import Optional, Dict, List
+
+EARTH_RADIUS_M = 6371000  # 지구 반지름 (미터)
+
+# 이 링까지 넓혀도 최근접이 확정되지 않으면 전체 배열을 한 번에 계산하는 편이 빠르다
+MAX_RING_SEARCH = 64
+
+# 배치 계산 시 한 번에 만드는 거리 행렬 크기 상한 (원소 수)
+BATCH_MATRIX_CELLS = 2_000_000
+
+
+def haversine_np(lat1, lon1, lat2, lon2):
+    """
+    Haversine 거리 (미터) - NumPy 배열 브로드캐스팅 지원
+    """
+    import numpy as np
+
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(lon2) - np.radians(lon1)
+
+    a = (np.sin(delta_lat / 2) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class DistrictSpatialIndex:
+    """
+    상권 좌표 격자 인덱스 (불변 객체 - 재빌드 시 새로 만든다)
+
+    - 좌표를 cell_degrees 크기의 셀로 나누고 셀 키로 정렬된 배열을 유지
+    - 질의 시 매장이 속한 셀부터 바깥 링으로 넓혀가며 후보만 Haversine 계산
+    - 남은 링까지의 최소 거리가 현재 최단 거리보다 멀어지면 탐색 종료
+    """
+
+    def __init__(
+        self,
+        codes: List[str],
+        names: List[str],
+        labels: List[int],
+        types: List[Optional[str]],
+        lons,
+        lats,
+        cell_degrees: float,
+        cell_state: Optional[Dict] = None,
+    ):
+        """
+        codes / names / types 는 인덱스로 접근 가능한 시퀀스 (list 또는 참조 파일의 문자열 컬럼)
+        cell_state: cell_state() 로 내보낸 격자 정렬 결과 (참조 파일에서 읽을 때 재계산 생략)
+        """
+        import numpy as np
+
+        self.codes = codes
+        self.names = names
+        self.labels = labels
+        self.types = types
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.cell_degrees = cell_degrees
+
+        self._n_rows = int(math.ceil(180.0 / cell_degrees)) + 1
+        self._n_cols = int(math.ceil(360.0 / cell_degrees)) + 1
+
+        if cell_state is not None:
+            self._order = cell_state["order"]
+            self._sorted_keys = cell_state["sorted_keys"]
+            self._row_range = tuple(cell_state["row_range"])
+            self._col_range = tuple(cell_state["col_range"])
+            self._max_abs_lat = cell_state["max_abs_lat"]
+            return
+
+        rows, cols = self._cells(self.lats, self.lons)
+        keys = rows * self._n_cols + cols
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+        if len(self):
+            self._row_range = (int(rows.min()), int(rows.max()))
+            self._col_range = (int(cols.min()), int(cols.max()))
+            max_abs_lat = float(np.abs(self.lats).max())
+        else:
+            self._row_range = self._col_range = (0, 0)
+            max_abs_lat = 0.0
+        self._max_abs_lat = max_abs_lat
+
+    def cell_state(self) -> Dict:
+        """격자 정렬 결과 (참조 파일 내보내기용)"""
+        return {
+            "order": self._order,
+            "sorted_keys": self._sorted_keys,
+            "row_range": list(self._row_range),
+            "col_range": list(self._col_range),
+            "max_abs_lat": self._max_abs_lat,
+        }
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _cells(self, lats, lons):
+        import numpy as np
+
+        rows = np.floor((np.asarray(lats) + 90.0) / self.cell_degrees).astype(np.int64)
+        cols = np.floor((np.asarray(lons) + 180.0) / self.cell_degrees).astype(np.int64)
+        return rows, cols
+
+    def _ring_candidates(self, row: int, col: int, ring: int):
+        """(row, col) 셀 기준 ring 번째 링에 속한 상권 인덱스들"""
+        import numpy as np
+
+        if ring == 0:
+            cells = [(row, col)]
+        else:
+            cells = []
+            for dc in range(-ring, ring + 1):
+                cells.append((row - ring, col + dc))
+                cells.append((row + ring, col + dc))
+            for dr in range(-ring + 1, ring):
+                cells.append((row + dr, col - ring))
+                cells.append((row + dr, col + ring))
+
+        keys = [
+            r * self._n_cols + c
+            for r, c in cells
+            if 0 <= r < self._n_rows and 0 <= c < self._n_cols
+        ]
+        if not keys:
+            return np.empty(0, dtype=np.int64)
+
+        keys = np.asarray(keys, dtype=np.int64)
+        lo = np.searchsorted(self._sorted_keys, keys, side="left")
+        hi = np.searchsorted(self._sorted_keys, keys, side="right")
+        hit = hi > lo
+        if not hit.any():
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([self._order[a:b] for a, b in zip(lo[hit], hi[hit])])
+
+    def _ring_clearance(self, ring: int, lat: float) -> float:
+        """ring 바깥에 있는 상권까지의 최소 거리 하한 (미터)"""
+        delta = math.radians(ring * self.cell_degrees)
+        max_lat = max(self._max_abs_lat, abs(lat))
+        min_cos = math.cos(math.radians(min(max_lat, 90.0)))
+        by_lat = EARTH_RADIUS_M * delta
+        by_lon = 2 * EARTH_RADIUS_M * math.asin(min(1.0, min_cos * math.sin(delta / 2)))
+        return min(by_lat, by_lon)
+
+    def nearest(self, x: float, y: float) -> Optional[Dict]:
+        """
+        좌표(x=경도, y=위도)에서 가장 가까운 상권
+
+        Returns:
+            Dict with district info or None
+        """
+        import numpy as np
+
+        if not len(self):
+            return None
+
+        rows, cols = self._cells([y], [x])
+        row, col = int(rows[0]), int(cols[0])
+        max_ring = max(
+            abs(row - self._row_range[0]), abs(row - self._row_range[1]),
+            abs(col - self._col_range[0]), abs(col - self._col_range[1]),
+        )
+
+        best_idx, best_dist = -1, float("inf")
+        last_ring = min(max_ring, MAX_RING_SEARCH)
+        for ring in range(last_ring + 1):
+            candidates = self._ring_candidates(row, col, ring)
+            if len(candidates):
+                dists = haversine_np(y, x, self.lats[candidates], self.lons[candidates])
+                pos = int(np.argmin(dists))
+                if dists[pos] < best_dist:
+                    best_dist = float(dists[pos])
+                    best_idx = int(candidates[pos])
+            if best_idx >= 0 and best_dist <= self._ring_clearance(ring, y):
+                break
+        else:
+            if last_ring < max_ring:
+                # MAX_RING_SEARCH 링 안에서 확정하지 못함 (격자 밖 / 상권이 드문 지역) → 전체 배열 계산
+                dists = haversine_np(y, x, self.lats, self.lons)
+                best_idx = int(np.argmin(dists))
+                best_dist = float(dists[best_idx])
+
+        return self.result(best_idx, best_dist)
+
+    def nearest_many(self, xs, ys):
+        """
+        여러 좌표의 최근접 상권을 한 번에 계산 (NumPy 브로드캐스팅)
+        메모리 사용량을 제한하기 위해 좌표를 청크로 나눠 (청크 x 상권) 거리 행렬을 만든다
+
+        Returns:
+            (상권 인덱스 배열, 거리 배열)
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        best_idx = np.full(len(xs), -1, dtype=np.int64)
+        best_dist = np.full(len(xs), np.inf)
+        if not len(self) or not len(xs):
+            return best_idx, best_dist
+
+        chunk = max(1, BATCH_MATRIX_CELLS // len(self))
+        for start in range(0, len(xs), chunk):
+            end = start + chunk
+            dists = haversine_np(
+                ys[start:end, None], xs[start:end, None],
+                self.lats[None, :], self.lons[None, :],
+            )
+            best_idx[start:end] = np.argmin(dists, axis=1)
+            best_dist[start:end] = dists[np.arange(dists.shape[0]), best_idx[start:end]]
+
+        return best_idx, best_dist
+
+    def result(self, idx: int, distance: float) -> Dict:
+        return {
+            "district_code": self.codes[idx],
+            "district_name": self.names[idx],
+            "district_cluster_label": int(self.labels[idx]),
+            "district_cluster_type": self.types[idx],
+            "distance_meters": round(distance, 2),
+        }
+
@@ -0,0 +1,119 @@
+"""
+상권 유형 × 업종 적합도 인덱스
+
+district_industry_mix (업종별 cluster_0_ratio ~ cluster_3_ratio) 를 한 번 읽어
+업종 x 상권 클러스터 밀집 행렬로 보관한다.
+- ratio: 해당 상권 유형에서 업종이 차지하는 비율
+- lift: ratio / 업종의 전체 유형 평균 비율 (1보다 크면 그 유형에 상대적으로 몰려 있음)
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.database import SessionLocal
+from app.models.user import DistrictIndustryMix
+from app.services.reference_cache import ReferenceIndexHolder
+
+DISTRICT_CLUSTER_LABELS = (0, 1, 2, 3)
+
+
+class DistrictIndustryMixIndex:
+    """업종 x 상권 클러스터 비율 행렬 (불변 객체 - 재빌드 시 새로 만든다)"""
+
+    def __init__(self, names: List[str], ratios):
+        import numpy as np
+
+        ratios = np.asarray(ratios, dtype=np.float64).reshape(-1, len(DISTRICT_CLUSTER_LABELS))
+
+        # 같은 업종이 여러 행이면 평균
+        unique_names, inverse = np.unique(np.asarray(names, dtype=object), return_inverse=True)
+        sums = np.zeros((len(unique_names), ratios.shape[1]))
+        counts = np.zeros(len(unique_names))
+        np.add.at(sums, inverse, ratios)
+        np.add.at(counts, inverse, 1)
+
+        self.names: List[str] = [str(n) for n in unique_names]
+        self.index_of: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.ratios = sums / np.maximum(counts, 1)[:, None]
+
+        row_mean = self.ratios.mean(axis=1, keepdims=True)
+        self.lift = np.divide(
+            self.ratios, row_mean, out=np.zeros_like(self.ratios), where=row_mean > 0
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_db(cls, db: Session) -> "DistrictIndustryMixIndex":
+        rows = db.query(
+            DistrictIndustryMix.industry_name,
+            DistrictIndustryMix.cluster_0_ratio,
+            DistrictIndustryMix.cluster_1_ratio,
+            DistrictIndustryMix.cluster_2_ratio,
+            DistrictIndustryMix.cluster_3_ratio,
+        ).all()
+        return cls(
+            names=[r.industry_name for r in rows],
+            ratios=[
+                [float(v or 0) for v in (r.cluster_0_ratio, r.cluster_1_ratio, r.cluster_2_ratio, r.cluster_3_ratio)]
+                for r in rows
+            ],
+        )
+
+    def lookup(self, industry_name: str) -> Optional[int]:
+        return self.index_of.get(industry_name)
+
+    def rank_industries(self, cluster_label: int, top_n: int) -> List[Dict]:
+        """상권 유형에 잘 맞는 업종 (비율 내림차순, 동률이면 lift)"""
+        import numpy as np
+
+        col = DISTRICT_CLUSTER_LABELS.index(cluster_label)
+        ratio = self.ratios[:, col]
+        lift = self.lift[:, col]
+        k = min(top_n, len(self))
+        if k <= 0:
+            return []
+        top = np.argpartition(-ratio, k - 1)[:k]
+        top = top[np.lexsort((-lift[top], -ratio[top]))]
+        return [
+            {
+                "industryName": self.names[i],
+                "clusterLabel": cluster_label,
+                "ratio": round(float(ratio[i]), 8),
+                "lift": round(float(lift[i]), 4),
+            }
+            for i in top
+        ]
+
+    def rank_clusters(self, idx: int) -> List[Dict]:
+        """업종 idx 에 잘 맞는 상권 유형 (비율 내림차순)"""
+        import numpy as np
+
+        order = np.argsort(-self.ratios[idx], kind="stable")
+        return [
+            {
+                "industryName": self.names[idx],
+                "clusterLabel": DISTRICT_CLUSTER_LABELS[j],
+                "ratio": round(float(self.ratios[idx, j]), 8),
+                "lift": round(float(self.lift[idx, j]), 4),
+            }
+            for j in order
+        ]
+
+
+district_mix_index: ReferenceIndexHolder[DistrictIndustryMixIndex] = ReferenceIndexHolder(
+    "District-industry mix index",
+    DistrictIndustryMixIndex.from_db,
+    lambda: settings.DISTRICT_MIX_INDEX_TTL_SECONDS,
+    SessionLocal,
+)
+
+
+@event.listens_for(DistrictIndustryMix, "after_insert")
+@event.listens_for(DistrictIndustryMix, "after_update")
+@event.listens_for(DistrictIndustryMix, "after_delete")
+def _invalidate_district_mix_index(mapper, connection, target):
+    district_mix_index.invalidate()
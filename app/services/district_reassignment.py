@@ -0,0 +1,138 @@
+"""
+매장 상권 재배정
+
+district_clusters 를 다시 적재하면 가입 시점에 저장된
+user_stores.district_code / district_name / district_cluster_label / district_cluster_type 이 낡는다.
+전체 매장을 id 순으로 스트리밍(yield_per)하며 배치마다 공간 인덱스로 최근접 상권을 다시 계산하고,
+바뀐 행만 PK 기준 bulk UPDATE 로 반영한다.
+
+- 배치마다 commit → 잠금은 배치 크기 행, 짧은 시간만 유지
+- 읽기/쓰기 세션 분리 (스트리밍 커서가 열린 커넥션에서 UPDATE 하지 않도록)
+- 마지막으로 commit 한 id 를 진행 상황으로 넘기므로 start_after_id 로 이어서 실행 가능
+"""
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.user import UserStore
+from app.services.reference_snapshot import reference_snapshot
+
+_DISTRICT_FIELDS = ("district_code", "district_name", "district_cluster_label", "district_cluster_type")
+
+
+def _to_python(value):
+    # NumPy 스칼라 → DB 드라이버가 받는 파이썬 값
+    return value.item() if hasattr(value, "item") else value
+
+
+def reassign_store_districts(
+    read_db: Session,
+    write_db: Session,
+    start_after_id: int = 0,
+    batch_size: Optional[int] = None,
+    dry_run: bool = False,
+    rebuild_index: bool = True,
+    on_progress: Optional[Callable[[Dict], None]] = None,
+) -> Dict:
+    """
+    Returns:
+        {"processed", "updated", "last_id", "elapsed_seconds", "dry_run"}
+        last_id 는 마지막으로 반영(commit)된 매장 id - 중단 시 start_after_id 로 넘기면 이어서 실행
+    """
+    import numpy as np
+
+    batch_size = batch_size or settings.DISTRICT_REASSIGN_BATCH_SIZE
+    if rebuild_index:
+        # 재적재된 district_clusters 로 스냅샷을 바로 다시 빌드 (primary 에서 읽음)
+        index = reference_snapshot.refresh().district_index
+    else:
+        index = reference_snapshot.get(read_db).district_index
+    if not len(index):
+        raise ValueError("district_clusters 에 좌표가 있는 상권이 없어 재배정할 수 없습니다.")
+
+    codes = np.asarray(list(index.codes), dtype=object)
+    names = np.asarray(list(index.names), dtype=object)
+    labels = np.asarray(list(index.labels), dtype=object)
+    types = np.asarray(list(index.types), dtype=object)
+
+    stmt = (
+        select(
+            UserStore.id,
+            UserStore.x,
+            UserStore.y,
+            UserStore.district_code,
+            UserStore.district_name,
+            UserStore.district_cluster_label,
+            UserStore.district_cluster_type,
+        )
+        .where(UserStore.id > start_after_id)
+        .where(UserStore.x.isnot(None), UserStore.y.isnot(None))
+        .order_by(UserStore.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    stats = {"processed": 0, "updated": 0, "last_id": start_after_id, "dry_run": dry_run}
+    started = time.perf_counter()
+
+    for rows in read_db.execute(stmt).partitions():
+        ids = np.fromiter((r.id for r in rows), dtype=np.int64, count=len(rows))
+        xs = np.fromiter((float(r.x) for r in rows), dtype=np.float64, count=len(rows))
+        ys = np.fromiter((float(r.y) for r in rows), dtype=np.float64, count=len(rows))
+        best_idx, _ = index.nearest_many(xs, ys)
+
+        resolved = best_idx >= 0
+        safe_idx = np.maximum(best_idx, 0)
+        new_values = {
+            "district_code": codes[safe_idx],
+            "district_name": names[safe_idx],
+            "district_cluster_label": labels[safe_idx],
+            "district_cluster_type": types[safe_idx],
+        }
+        changed = np.zeros(len(rows), dtype=bool)
+        for field in _DISTRICT_FIELDS:
+            current = np.asarray([getattr(r, field) for r in rows], dtype=object)
+            changed |= current != new_values[field]
+        changed &= resolved
+
+        positions = np.flatnonzero(changed)
+        if len(positions) and not dry_run:
+            now = datetime.utcnow()  # 매장 정보 변경 시각
+            write_db.execute(
+                update(UserStore),
+                [
+                    {
+                        "id": int(ids[i]),
+                        **{field: _to_python(new_values[field][i]) for field in _DISTRICT_FIELDS},
+                        "updated_at": now,
+                    }
+                    for i in positions
+                ],
+            )
+            write_db.commit()
+
+        stats["processed"] += len(rows)
+        stats["updated"] += len(positions)
+        stats["last_id"] = int(ids[-1])
+        stats["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+        if on_progress:
+            on_progress(dict(stats))
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+    print(
+        f"🗺️  District reassignment {'(dry run) ' if dry_run else ''}done: "
+        f"{stats['updated']}/{stats['processed']} stores changed in {stats['elapsed_seconds']}s"
+    )
+    return stats
+
+
+def count_stores_to_scan(db: Session, start_after_id: int = 0) -> int:
+    """진행률 표시용 전체 대상 매장 수"""
+    return db.scalar(
+        select(func.count(UserStore.id))
+        .where(UserStore.id > start_after_id)
+        .where(UserStore.x.isnot(None), UserStore.y.isnot(None))
+    )
@@ -1,10 +1,9 @@
 import math
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 
-from app.models.district import DistrictCluster
-from app.models.user import IndustryCluster
+from app.services.reference_cache import ReferenceDataUnavailable
+from app.services.reference_snapshot import reference_snapshot
 
 
 class DistrictService:
@@ -38,70 +37,64 @@ class DistrictService:
     ) -> Optional[Dict]:
         """
         매장 좌표에서 가장 가까운 상권 클러스터 찾기
-        district_clusters 테이블의 x, y 좌표와 비교
+        참조 데이터 스냅샷의 공간 인덱스에서 조회
         
         Returns:
             Dict with district info or None
         """
         try:
             print(f"🔍 Looking for nearest district to store at: x={store_x}, y={store_y}")
-            
-            # district_clusters 테이블에서 모든 상권 조회
-            district_clusters = (
-                db.query(DistrictCluster)
-                .filter(DistrictCluster.x.isnot(None))
-                .filter(DistrictCluster.y.isnot(None))
-                .all()
-            )
-            
-            print(f"📊 Found {len(district_clusters)} districts with coordinates")
-            
-            if not district_clusters:
+
+            # 프로세스 메모리의 스냅샷 사용 (요청 경로에서는 DB 조회 없음)
+            index = reference_snapshot.get(db).district_index
+            if not len(index):
                 print("⚠️  No district clusters found with coordinates")
                 return None
-            
-            nearest_district = None
-            min_distance = float('inf')
-            
-            # 각 상권과의 거리 계산
-            for i, district in enumerate(district_clusters):
-                try:
-                    distance = DistrictService.calculate_distance(
-                        store_y, store_x,  # 매장 좌표
-                        float(district.y), float(district.x)  # 상권 좌표
-                    )
-                    
-                    if distance < min_distance:
-                        min_distance = distance
-                        nearest_district = district
-                        
-                    if i < 3:  # 처음 3개만 로그 출력
-                        print(f"  District {district.district_code}: distance={distance:.2f}m")
-                        
-                except Exception as e:
-                    print(f"❌ Error calculating distance for {district.district_code}: {e}")
-                    continue
-            
-            if nearest_district:
-                result = {
-                    "district_code": nearest_district.district_code,
-                    "district_name": nearest_district.district_name,
-                    "district_cluster_label": nearest_district.cluster_label,
-                    "district_cluster_type": nearest_district.cluster_type,
-                    "distance_meters": round(min_distance, 2)
-                }
+
+            result = index.nearest(store_x, store_y)
+            if result:
                 print(f"✅ Found nearest district: {result}")
-                return result
             else:
                 print("⚠️  No nearest district found")
-                return None
-                
+            return result
+
+        except ReferenceDataUnavailable:
+            raise  # 스냅샷 준비 전 - '상권 없음' 으로 처리하지 않고 503
         except Exception as e:
             print(f"❌ Error in find_nearest_district_cluster: {e}")
             import traceback
             print(f"❌ Traceback: {traceback.format_exc()}")
             return None
     
+    @staticmethod
+    def find_nearest_district_clusters(
+        db: Session,
+        coordinates: List[Tuple[float, float]],  # (경도, 위도) 목록
+    ) -> List[Optional[Dict]]:
+        """
+        여러 좌표의 가장 가까운 상권 클러스터를 한 번에 찾기
+        좌표 배열 전체에 대해 NumPy Haversine 을 한 번에 계산
+
+        Returns:
+            입력 순서와 같은 Dict 목록 (상권이 없으면 None)
+        """
+        index = reference_snapshot.get(db).district_index
+        if not coordinates:
+            return []
+        if not len(index):
+            print("⚠️  No district clusters found with coordinates")
+            return [None] * len(coordinates)
+
+        xs = [x for x, _ in coordinates]
+        ys = [y for _, y in coordinates]
+        best_idx, best_dist = index.nearest_many(xs, ys)
+
+        print(f"✅ Resolved nearest districts for {len(coordinates)} coordinates")
+        return [
+            index.result(int(i), float(d)) if i >= 0 else None
+            for i, d in zip(best_idx, best_dist)
+        ]
+    
     @staticmethod
     def get_district_info(db: Session, district_code: str) -> Optional[Dict]:
         """
@@ -113,34 +106,32 @@ class DistrictService:
         try:
             print(f"🔍 Looking up district info for: '{district_code}'")
             
-            district_cluster = (
-                db.query(DistrictCluster)
-                .filter(DistrictCluster.district_code == district_code)
-                .first()
-            )
+            district = reference_snapshot.get(db).districts.get(district_code)
             
-            if not district_cluster:
+            if not district:
                 print(f"⚠️  District '{district_code}' not found in district_clusters table")
                 return None
             
             result = {
-                "district_code": district_cluster.district_code,
-                "district_name": district_cluster.district_name,
-                "cluster_label": district_cluster.cluster_label,
-                "cluster_type": district_cluster.cluster_type,
-                "total_revenue": int(district_cluster.total_revenue),
-                "avg_age": float(district_cluster.avg_age),
-                "efficiency": float(district_cluster.efficiency),
-                "business_count": district_cluster.business_count,
+                "district_code": district.district_code,
+                "district_name": district.district_name,
+                "cluster_label": district.cluster_label,
+                "cluster_type": district.cluster_type,
+                "total_revenue": district.total_revenue,
+                "avg_age": district.avg_age,
+                "efficiency": district.efficiency,
+                "business_count": district.business_count,
                 "coordinates": {
-                    "latitude": float(district_cluster.y) if district_cluster.y else None,
-                    "longitude": float(district_cluster.x) if district_cluster.x else None
+                    "latitude": district.y if district.y else None,
+                    "longitude": district.x if district.x else None
                 }
             }
             
             print(f"✅ District info found: {result}")
             return result
             
+        except ReferenceDataUnavailable:
+            raise  # 스냅샷 준비 전 - '상권 없음' 으로 처리하지 않고 503
         except Exception as e:
             print(f"❌ Error in get_district_info: {e}")
             import traceback
@@ -158,35 +149,21 @@ class DistrictService:
         try:
             print(f"🔍 Looking up industry cluster for: '{industry_name}'")
             
-            industry_cluster = (
-                db.query(IndustryCluster)
-                .filter(IndustryCluster.industry_name == industry_name)
-                .first()
-            )
+            industries = reference_snapshot.get(db).industries
+            industry_cluster = industries.get(industry_name)
             
             if not industry_cluster:
                 print(f"⚠️  Industry '{industry_name}' not found in industry_clusters table")
                 
                 # 유사한 업종명 찾기 (디버깅용)
-                similar_industries = (
-                    db.query(IndustryCluster.industry_name)
-                    .filter(IndustryCluster.industry_name.like(f"%{industry_name}%"))
-                    .limit(5)
-                    .all()
-                )
+                similar_names = [name for name in industries if industry_name in name][:5]
                 
-                if similar_industries:
-                    similar_names = [row[0] for row in similar_industries]
+                if similar_names:
                     print(f"💡 Similar industries found: {similar_names}")
                 else:
                     # 전체 업종 목록 확인 (처음 5개)
-                    all_industries = (
-                        db.query(IndustryCluster.industry_name)
-                        .limit(5)
-                        .all()
-                    )
-                    if all_industries:
-                        all_names = [row[0] for row in all_industries]
+                    all_names = list(industries)[:5]
+                    if all_names:
                         print(f"📋 Available industries (first 5): {all_names}")
                     
                 return None
@@ -199,6 +176,8 @@ class DistrictService:
             print(f"✅ Industry cluster found: {result}")
             return result
             
+        except ReferenceDataUnavailable:
+            raise  # 스냅샷 준비 전 - '상권 없음' 으로 처리하지 않고 503
         except Exception as e:
             print(f"❌ Error in get_industry_cluster_info: {e}")
             import traceback
@@ -0,0 +1,131 @@
+"""
+업종 유사도 인덱스
+
+industry_clusters 전체를 한 번 읽어 표준화된 특성 행렬과
+업종별 상위 N개 유사 업종 테이블을 미리 계산해 둔다.
+빌드/갱신은 참조 데이터 스냅샷(reference_snapshot)이 담당한다.
+"""
+from typing import Dict, List, Mapping, Optional
+
+# 추천 API 의 top_n 상한 (Query le=10)
+MAX_TOP_N = 10
+
+
+class IndustrySimilarityIndex:
+    """
+    업종 유사도 인덱스 (불변 객체 - 재빌드 시 새로 만든다)
+
+    - features: (평균 연령, 여성 비중) 표준화 행렬 (n x 2)
+    - top_idx / top_score: 같은 클러스터 안에서 유사도 내림차순 상위 MAX_TOP_N 개
+      (부족한 칸은 -1 로 채움)
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        ages,
+        female,
+        labels,
+        top_n: int = MAX_TOP_N,
+        index_of: Optional[Mapping[str, int]] = None,
+        precomputed: Optional[Dict] = None,
+    ):
+        """
+        index_of / precomputed: 참조 파일에서 읽을 때 넘긴다 (features / top_idx / top_score 재계산 생략)
+        """
+        import numpy as np
+
+        self.names = names
+        self.index_of: Mapping[str, int] = (
+            index_of if index_of is not None else {name: i for i, name in enumerate(names)}
+        )
+        self.ages = np.asarray(ages, dtype=np.float64)
+        self.female = np.asarray(female, dtype=np.float64)
+        self.labels = np.asarray(labels, dtype=np.int64)
+        self._items_cache: Dict[int, list] = {}
+
+        if precomputed is not None:
+            self.features = precomputed["features"]
+            self.top_idx = precomputed["top_idx"]
+            self.top_score = precomputed["top_score"]
+            return
+
+        n = len(names)
+        if n:
+            # 표준화
+            scaled_age = (self.ages - self.ages.mean()) / (self.ages.std() or 1.0)
+            scaled_female = (self.female - self.female.mean()) / (self.female.std() or 1.0)
+            self.features = np.column_stack([scaled_age, scaled_female])
+        else:
+            self.features = np.empty((0, 2))
+
+        self.top_idx = np.full((n, top_n), -1, dtype=np.int64)
+        self.top_score = np.zeros((n, top_n), dtype=np.float64)
+
+        # 클러스터별로 쌍별 거리 행렬 계산 (다른 클러스터끼리는 추천하지 않음)
+        for label in np.unique(self.labels):
+            members = np.flatnonzero(self.labels == label)
+            feats = self.features[members]
+            dist = np.sqrt(((feats[:, None, :] - feats[None, :, :]) ** 2).sum(axis=2))
+            similarity = np.maximum(0.0, (1 - dist) * 100.0)
+            rounded = np.round(similarity, 1)
+
+            for row, i in enumerate(members):
+                others = np.flatnonzero(members != i)
+                # 응답 점수(소수 첫째 자리) 내림차순, 동점이면 원래 순서 유지
+                order = others[np.lexsort((members[others], -rounded[row, others]))][:top_n]
+                self.top_idx[i, :len(order)] = members[order]
+                self.top_score[i, :len(order)] = rounded[row, order]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, industry_name: str) -> Optional[int]:
+        return self.index_of.get(industry_name)
+
+    def affinity(self, idx: int):
+        """
+        업종 idx 와 모든 업종의 유사도 (0~1, n 벡터)
+        top_items 와 같은 기준 - 다른 클러스터와 자기 자신은 0
+        """
+        import numpy as np
+
+        dist = np.sqrt(((self.features - self.features[idx]) ** 2).sum(axis=1))
+        scores = np.maximum(0.0, 1 - dist)
+        scores[self.labels != self.labels[idx]] = 0.0
+        scores[idx] = 0.0
+        return scores
+
+    def top_items(self, idx: int, cluster_names: Dict[int, str]) -> list:
+        """업종 idx 의 추천 항목 (최대 MAX_TOP_N 개, 최초 1회만 생성)"""
+        items = self._items_cache.get(idx)
+        if items is not None:
+            return items
+
+        from app.schemas.recommendation import IndustryRecommendationItem
+
+        items = []
+        for j, score in zip(self.top_idx[idx], self.top_score[idx]):
+            if j < 0:
+                break
+            label = int(self.labels[j])
+            name = self.names[j]
+            comment = (
+                f"{name}은(는) {cluster_names.get(label, f'{label}번 그룹')} "
+                f"고객 성향과 유사하여 협업 가능성이 높습니다. "
+                f"평균 연령 {self.ages[j]:.1f}세, 여성 비중 {self.female[j]:.0%}"
+            )
+            items.append(
+                IndustryRecommendationItem(
+                    industryName=name,
+                    similarityScore=float(score),
+                    avgAge=float(self.ages[j]),
+                    avgFemaleRatio=float(self.female[j]),
+                    clusterLabel=label,
+                    comment=comment,
+                )
+            )
+
+        self._items_cache[idx] = items
+        return items
+
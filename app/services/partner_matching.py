@@ -0,0 +1,136 @@
+"""
+제휴 매장 추천
+
+내 매장 반경 안의 다른 회원 매장 전체를 한 번에 NumPy 로 점수화한다.
+- 거리: 가까울수록 높음 (반경 끝에서 0)
+- 상권 클러스터: district_cluster_label 이 같으면 가점
+- 업종 궁합: 업종 유사도 인덱스 (recommend_for_industry_db 와 같은 기준)
+"""
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.user import Partnership, UserStore
+from app.schemas.recommendation import PartnerRecommendationItem, PartnerRecommendationResponse
+from app.services.district_index import haversine_np
+from app.services.reference_snapshot import reference_snapshot
+from app.services.store_geo import geohash_cell_filter
+
+# 점수 가중치 (합 1.0)
+WEIGHT_INDUSTRY = 0.5
+WEIGHT_DISTANCE = 0.3
+WEIGHT_DISTRICT = 0.2
+
+
+def recommend_partners(
+        db: Session,
+        store: UserStore,
+        radius_m: float = 1000,
+        top_n: int = 10,
+) -> PartnerRecommendationResponse:
+    import numpy as np
+
+    if store.x is None or store.y is None:
+        raise ValueError("매장 좌표가 없어 주변 매장을 찾을 수 없습니다.")
+    lat, lng = float(store.y), float(store.x)
+
+    rows = db.execute(
+        select(
+            UserStore.id,
+            UserStore.store_name,
+            UserStore.industry_name,
+            UserStore.district_name,
+            UserStore.district_cluster_label,
+            UserStore.x,
+            UserStore.y,
+        ).where(
+            geohash_cell_filter(lat, lng, radius_m),
+            UserStore.user_id != store.user_id,
+        )
+    ).all()
+
+    def _response(items, candidate_count=0):
+        return PartnerRecommendationResponse(
+            storeId=store.id,
+            storeName=store.store_name,
+            radiusMeters=radius_m,
+            candidateCount=candidate_count,
+            recommendations=items,
+        )
+
+    if not rows:
+        return _response([])
+
+    # 컬럼 배열 (행 단위 점수 계산 없음)
+    ids = np.fromiter((r.id for r in rows), dtype=np.int64, count=len(rows))
+    xs = np.fromiter((float(r.x) for r in rows), dtype=np.float64, count=len(rows))
+    ys = np.fromiter((float(r.y) for r in rows), dtype=np.float64, count=len(rows))
+    district_labels = np.fromiter(
+        (-1 if r.district_cluster_label is None else r.district_cluster_label for r in rows),
+        dtype=np.int64, count=len(rows),
+    )
+    names = np.array([r.store_name for r in rows], dtype=object)
+    industries = np.array([r.industry_name or "" for r in rows], dtype=object)
+
+    distances = haversine_np(lat, lng, ys, xs)
+    candidate = distances <= radius_m
+
+    # 이미 제휴 중인 매장 제외 (partnerships 는 상대 매장명을 저장)
+    partnered = list(db.scalars(
+        select(Partnership.partner_store_name).where(Partnership.user_store_id == store.id)
+    ))
+    if partnered:
+        candidate &= ~np.isin(names, partnered)
+
+    candidates = np.flatnonzero(candidate)
+    if not len(candidates):
+        return _response([])
+
+    # 업종 궁합: 고유 업종명만 인덱스 조회 후 역인덱스로 펼침
+    index = reference_snapshot.get(db).industry_index
+    my_idx = index.lookup(store.industry_name) if store.industry_name else None
+    industry_score = np.zeros(len(rows))
+    if my_idx is not None:
+        affinity = index.affinity(my_idx)
+        unique_names, inverse = np.unique(industries[candidates], return_inverse=True)
+        lookup = np.array(
+            [index.index_of.get(name, -1) for name in unique_names], dtype=np.int64
+        )
+        per_name = np.where(lookup >= 0, affinity[np.maximum(lookup, 0)], 0.0)
+        industry_score[candidates] = per_name[inverse]
+
+    distance_score = np.clip(1 - distances / radius_m, 0.0, 1.0)
+    if store.district_cluster_label is not None:
+        same_district = district_labels == store.district_cluster_label
+    else:
+        same_district = np.zeros(len(rows), dtype=bool)
+    scores = 100.0 * (
+        WEIGHT_INDUSTRY * industry_score
+        + WEIGHT_DISTANCE * distance_score
+        + WEIGHT_DISTRICT * same_district
+    )
+
+    # 상위 top_n: argpartition 후 (점수 내림차순, 거리 오름차순) 정렬
+    k = min(top_n, len(candidates))
+    top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    top = top[np.lexsort((distances[top], -scores[top]))]
+
+    items = []
+    for i in top:
+        comment = f"{names[i]}은(는) 약 {distances[i]:.0f}m 거리"
+        if industry_score[i] > 0:
+            comment += f", 업종 궁합 {industry_score[i] * 100:.0f}점"
+        if same_district[i]:
+            comment += ", 같은 상권 유형"
+        items.append(PartnerRecommendationItem(
+            storeId=int(ids[i]),
+            storeName=names[i],
+            industryName=industries[i] or None,
+            districtName=rows[i].district_name,
+            distanceMeters=round(float(distances[i]), 2),
+            industryAffinity=round(float(industry_score[i]) * 100, 1),
+            sameDistrictCluster=bool(same_district[i]),
+            score=round(float(scores[i]), 1),
+            comment=comment + "입니다.",
+        ))
+
+    return _response(items, candidate_count=len(candidates))
@@ -0,0 +1,116 @@
+"""
+등록 매장 kakao_place_id 멤버십 집합
+
+지도 화면에서 넘어오는 장소 id 는 대부분 비회원이므로
+프로세스 메모리의 집합으로 먼저 거르고, 집합에 있는 id 만 DB 에서 조회한다.
+
+- 매장 생성(ORM 이벤트 / 일괄 등록)·삭제 시 즉시 반영
+- 다른 워커 프로세스의 변경은 PLACE_MEMBERSHIP_RESYNC_SECONDS 마다 전체 재동기화로 반영
+- 집합에 남은 삭제/롤백된 id 는 DB 조회 한 번으로 걸러지므로 결과는 항상 DB 기준
+"""
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import settings
+from app.models.user import UserStore
+
+
+class PlaceMembershipSet:
+    def __init__(self):
+        self._ids: Optional[Set[str]] = None
+        self._synced_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        # 재동기화 쿼리 실행 중에 들어온 추가분 (새 집합에 합친다)
+        self._added_during_sync: Optional[Set[str]] = None
+        self.filtered = 0  # DB 조회 없이 비회원으로 답한 id 수
+        self.passed = 0  # DB 조회로 넘긴 id 수
+
+    def __len__(self) -> int:
+        return len(self._ids) if self._ids is not None else 0
+
+    def _is_fresh(self) -> bool:
+        if self._ids is None:
+            return False
+        ttl = settings.PLACE_MEMBERSHIP_RESYNC_SECONDS
+        return ttl <= 0 or time.time() - self._synced_at < ttl
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """비어 있거나 재동기화 주기가 지났으면 DB 에서 다시 읽는다"""
+        if self._is_fresh():
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._is_fresh():
+                return
+
+            self._added_during_sync = set()
+            try:
+                ids = set(
+                    await db.scalars(
+                        select(UserStore.kakao_place_id).where(UserStore.kakao_place_id.isnot(None))
+                    )
+                )
+            except Exception as e:
+                # 재동기화 실패 시 기존 집합 유지 (없으면 필터 없이 DB 조회)
+                print(f"⚠️  Place membership resync failed: {e!r}")
+                return
+            finally:
+                added, self._added_during_sync = self._added_during_sync, None
+
+            self._ids = ids | added
+            self._synced_at = time.time()
+            print(f"🗂️  Place membership synced: {len(self._ids)} place ids")
+
+    def might_contain(self, place_id: str) -> bool:
+        """False 면 확실히 비회원, True 면 DB 확인 필요 (아직 동기화 전이면 항상 True)"""
+        if self._ids is None or place_id in self._ids:
+            self.passed += 1
+            return True
+        self.filtered += 1
+        return False
+
+    def add(self, place_id: Optional[str]) -> None:
+        if not place_id:
+            return
+        if self._ids is not None:
+            self._ids.add(place_id)
+        if self._added_during_sync is not None:
+            self._added_during_sync.add(place_id)
+
+    def add_many(self, place_ids: Iterable[Optional[str]]) -> None:
+        for place_id in place_ids:
+            self.add(place_id)
+
+    def discard(self, place_id: Optional[str]) -> None:
+        if place_id and self._ids is not None:
+            self._ids.discard(place_id)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "size": len(self),
+            "synced": self._ids is not None,
+            "age_seconds": round(time.time() - self._synced_at, 1) if self._ids is not None else None,
+            "filtered": self.filtered,
+            "passed": self.passed,
+        }
+
+
+place_membership = PlaceMembershipSet()
+
+
+@event.listens_for(UserStore, "after_insert")
+@event.listens_for(UserStore, "after_update")
+def _add_place_id(mapper, connection, target):
+    # 커밋 전에 추가 - 롤백되면 DB 조회 한 번으로 걸러진다
+    place_membership.add(target.kakao_place_id)
+
+
+@event.listens_for(UserStore, "after_delete")
+def _discard_place_id(mapper, connection, target):
+    place_membership.discard(target.kakao_place_id)
@@ -1,11 +1,14 @@
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
-from app.models.user import IndustryCluster
 from app.schemas.recommendation import (
+    DistrictFitResponse,
     IndustryRecommendationResponse,
-    IndustryRecommendationItem,
 )
+from app.services.district_mix_index import DISTRICT_CLUSTER_LABELS, DistrictIndustryMixIndex
+from app.services.reference_snapshot import reference_snapshot
 
 # 클러스터 이름 (네가 쓰던 그대로)
 cluster_names = {
@@ -21,128 +24,75 @@ def recommend_for_industry_db(
         target_industry_name: str,
         top_n: int = 3,
 ) -> IndustryRecommendationResponse:
-    # Lazy import to reduce startup time
-    import numpy as np
-    
-    rows = db.query(IndustryCluster).all()
-    if not rows:
+    # 표준화/유사도 계산은 인덱스 빌드 시 1회만 수행
+    index = reference_snapshot.get(db).industry_index
+    if not len(index):
         raise ValueError("industry_clusters 테이블에 데이터가 없습니다.")
 
-    names = [r.industry_name for r in rows]
-    ages = np.array([float(r.avg_age_score) for r in rows])
-    female = np.array([float(r.avg_female_ratio) for r in rows])
-    labels = np.array([int(r.cluster_label) for r in rows])
-
-    if target_industry_name not in names:
+    idx = index.lookup(target_industry_name)
+    if idx is None:
         raise ValueError(f"'{target_industry_name}' 업종 데이터를 찾을 수 없습니다.")
 
-    # 표준화
-    age_mean, age_std = ages.mean(), ages.std() or 1.0
-    female_mean, female_std = female.mean(), female.std() or 1.0
-
-    scaled_age = (ages - age_mean) / age_std
-    scaled_female = (female - female_mean) / female_std
-
-    idx = names.index(target_industry_name)
-    my_vec = np.array([scaled_age[idx], scaled_female[idx]])
-    my_label = labels[idx]
-    my_cluster_name = cluster_names.get(my_label, f"{my_label}번 그룹")
-
-    items = []
-    for i, (name, label) in enumerate(zip(names, labels)):
-        if name == target_industry_name:
-            continue
-        if label != my_label:
-            continue
-
-        vec = np.array([scaled_age[i], scaled_female[i]])
-        dist = float(np.linalg.norm(my_vec - vec))
-        similarity = max(0.0, (1 - dist) * 100.0)
-
-        comment = (
-            f"{name}은(는) {cluster_names.get(label, f'{label}번 그룹')} "
-            f"고객 성향과 유사하여 협업 가능성이 높습니다. "
-            f"평균 연령 {ages[i]:.1f}세, 여성 비중 {female[i]:.0%}"
-        )
-
-        items.append(
-            IndustryRecommendationItem(
-                industryName=name,
-                similarityScore=round(similarity, 1),
-                avgAge=float(ages[i]),
-                avgFemaleRatio=float(female[i]),
-                clusterLabel=int(label),
-                comment=comment,
-            )
-        )
-
-    items_sorted = sorted(items, key=lambda x: -x.similarityScore)[:top_n]
+    my_label = int(index.labels[idx])
 
     return IndustryRecommendationResponse(
         userIndustry=target_industry_name,
-        clusterLabel=int(my_label),
-        clusterName=my_cluster_name,
-        recommendations=items_sorted,
+        clusterLabel=my_label,
+        clusterName=cluster_names.get(my_label, f"{my_label}번 그룹"),
+        recommendations=index.top_items(idx, cluster_names)[:top_n],
     )
 
 def recommend_for_industry_name(db: Session, industry_name: str, top_n: int = 3):
-    # Lazy import to reduce startup time
-    import numpy as np
-
-    rows = db.query(IndustryCluster).all()
-    if not rows:
+    index = reference_snapshot.get(db).industry_index
+    if not len(index):
         raise HTTPException(404, "industry_clusters 테이블이 비어있음")
 
-    names = [r.industry_name for r in rows]
-    ages = np.array([float(r.avg_age_score) for r in rows])
-    female = np.array([float(r.avg_female_ratio) for r in rows])
-    labels = np.array([int(r.cluster_label) for r in rows])
-
-    if industry_name not in names:
+    idx = index.lookup(industry_name)
+    if idx is None:
         raise HTTPException(404, f"'{industry_name}' 업종을 찾을 수 없음")
 
-    idx = names.index(industry_name)
-    my_label = labels[idx]
-
-    # 표준화
-    scaled_age = (ages - ages.mean()) / (ages.std() or 1)
-    scaled_female = (female - female.mean()) / (female.std() or 1)
-
-    my_vec = np.array([scaled_age[idx], scaled_female[idx]])
+    my_label = int(index.labels[idx])
 
-    items = []
-    for i, name in enumerate(names):
-        if name == industry_name:
-            continue
-        if labels[i] != my_label:
-            continue
-
-        vec = np.array([scaled_age[i], scaled_female[i]])
-        dist = float(np.linalg.norm(my_vec - vec))
-        similarity = max(0, (1 - dist) * 100)
+    return IndustryRecommendationResponse(
+        userIndustry=industry_name,
+        clusterLabel=my_label,
+        clusterName=cluster_names.get(my_label, f"{my_label}번 그룹"),
+        recommendations=index.top_items(idx, cluster_names)[:top_n],
+    )
 
-        comment = (
-            f"{name}은(는) {cluster_names[labels[i]]} "
-            f"고객 성향과 유사하여 협업 가능성이 높습니다. "
-            f"평균 연령 {ages[i]:.1f}세, 여성 비중 {female[i]:.0%}"
-        )
 
-        items.append(
-            IndustryRecommendationItem(
-                industryName=name,
-                similarityScore=round(similarity, 1),
-                avgAge=float(ages[i]),
-                avgFemaleRatio=float(female[i]),
-                clusterLabel=int(labels[i]),
-                comment=comment,
-            )
+def district_fit(
+        index: DistrictIndustryMixIndex,
+        cluster_label: Optional[int] = None,
+        industry_name: Optional[str] = None,
+        top_n: int = 10,
+) -> DistrictFitResponse:
+    """
+    상권 유형 ↔ 업종 적합도 (district_industry_mix)
+    - cluster_label 지정: 그 상권 유형에 맞는 업종 상위 top_n
+    - industry_name 지정: 그 업종에 맞는 상권 유형 순위
+    index 는 호출하는 쪽에서 district_mix_index.get_async() / get(db) 로 받아 넘긴다
+    """
+    if (cluster_label is None) == (industry_name is None):
+        raise ValueError("cluster_label 과 industry_name 중 하나만 지정해야 합니다.")
+
+    if not len(index):
+        raise ValueError("district_industry_mix 테이블에 데이터가 없습니다.")
+
+    if cluster_label is not None:
+        if cluster_label not in DISTRICT_CLUSTER_LABELS:
+            raise ValueError(f"상권 유형은 {DISTRICT_CLUSTER_LABELS} 중 하나여야 합니다.")
+        return DistrictFitResponse(
+            mode="industries",
+            clusterLabel=cluster_label,
+            results=index.rank_industries(cluster_label, top_n),
         )
 
-    items_sorted = sorted(items, key=lambda x: -x.similarityScore)[:top_n]
-
-    return IndustryRecommendationResponse(
-        userIndustry=industry_name,
-        clusterLabel=int(my_label),
-        clusterName=cluster_names.get(my_label, f"{my_label}번 그룹"),
-        recommendations=items_sorted,
+    idx = index.lookup(industry_name)
+    if idx is None:
+        raise ValueError(f"'{industry_name}' 업종의 상권 분포 데이터를 찾을 수 없습니다.")
+    return DistrictFitResponse(
+        mode="clusters",
+        industryName=industry_name,
+        results=index.rank_clusters(idx),
     )
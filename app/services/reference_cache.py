@@ -0,0 +1,114 @@
+"""
+참조 데이터 인덱스 보관소 (상권×업종 비율 등 단일 테이블 인덱스)
+
+- 최초 조회 시 DB에서 빌드하고, 이후에는 DB를 건드리지 않음
+- invalidate() 호출(ORM 변경 이벤트) 또는 TTL 만료 시 다음 조회에서 재빌드
+- async 라우터는 get_async() 사용: 빌드는 스레드풀에서 자체 동기 세션으로 하고,
+  같은 루프의 동시 요청은 asyncio.Lock 으로 한 번만 빌드
+- run_sync 안(이벤트 루프 스레드)에서 get() 을 부르면 빌드하지 않는다.
+  빌드 쿼리 동안 greenlet 이 루프로 양보하는데, 다른 요청이 같은 threading.Lock 을
+  루프 스레드에서 기다리면 루프 전체가 멈춰 교착되기 때문
+"""
+import asyncio
+import threading
+import time
+import weakref
+from typing import Callable, Generic, Optional, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+
+class ReferenceDataUnavailable(HTTPException):
+    """참조 데이터가 아직 준비되지 않음 (요청 경로에서는 빌드를 기다리지 않고 503)"""
+
+    def __init__(self, name: str, retry_after: int = 5):
+        super().__init__(
+            status_code=503,
+            detail=f"{name} 준비 중입니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+def on_event_loop() -> bool:
+    """현재 스레드에서 이벤트 루프가 돌고 있는지 (AsyncSession.run_sync 안 포함)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class ReferenceIndexHolder(Generic[T]):
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[Session], T],
+        ttl_seconds: Callable[[], int],
+        session_factory: Callable[[], Session],
+    ):
+        self.name = name
+        self._build = build
+        self._ttl_seconds = ttl_seconds
+        self._session_factory = session_factory  # get_async() 빌드용 (primary)
+        self._value: Optional[T] = None
+        self._built_at = 0.0
+        self._dirty = False
+        self._lock = threading.Lock()  # 스레드(빌드) 직렬화 - 루프 스레드에서는 잡지 않는다
+        self._async_locks = weakref.WeakKeyDictionary()  # 이벤트 루프 → asyncio.Lock
+
+    def _is_fresh(self) -> bool:
+        if self._value is None or self._dirty:
+            return False
+        ttl = self._ttl_seconds()
+        return ttl <= 0 or time.time() - self._built_at < ttl
+
+    def get(self, db: Session) -> T:
+        if self._is_fresh():
+            return self._value
+
+        if on_event_loop():
+            # run_sync 안에서는 락/빌드 없이 마지막 값 (재빌드는 get_async() 가 담당)
+            if self._value is not None:
+                return self._value
+            raise ReferenceDataUnavailable(self.name)
+
+        with self._lock:
+            if not self._is_fresh():
+                # 빌드 중에 들어온 invalidate() 는 dirty 로 남겨 다음 조회에서 다시 빌드
+                self._dirty = False
+                self._value = self._build(db)
+                self._built_at = time.time()
+                print(f"🗂️  {self.name} built: {len(self._value)} rows")
+            return self._value
+
+    def _build_in_thread(self) -> T:
+        db = self._session_factory()
+        try:
+            return self.get(db)
+        finally:
+            db.close()
+
+    def _async_lock(self) -> asyncio.Lock:
+        # asyncio.Lock 은 생성한 루프에 묶이므로 루프마다 따로 (uvicorn 은 하나, 테스트 클라이언트는 여럿)
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = self._async_locks[loop] = asyncio.Lock()
+        return lock
+
+    async def get_async(self) -> T:
+        """이벤트 루프용 조회 - 빌드가 필요하면 스레드풀에서 빌드하고 루프는 다른 요청을 계속 처리"""
+        if self._is_fresh():
+            return self._value
+
+        async with self._async_lock():
+            if not self._is_fresh():
+                await run_in_threadpool(self._build_in_thread)
+            return self._value
+
+    def invalidate(self) -> None:
+        self._dirty = True
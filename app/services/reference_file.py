@@ -0,0 +1,318 @@
+"""
+참조 데이터 스냅샷 파일 (메모리 매핑 컬럼 포맷)
+
+uvicorn 워커가 여러 개면 워커마다 같은 참조 데이터를 따로 들고 있게 된다.
+스냅샷을 컬럼 단위 바이너리 파일로 내보내고 워커는 np.memmap(읽기 전용)으로 열어
+OS 페이지 캐시 한 벌을 공유한다. 파이썬 객체로 풀지 않으므로 워커 기동도 즉시 끝난다.
+
+파일 구조 (리틀 엔디언):
+    MAGIC (8 bytes) | 헤더 길이 (uint64) | 헤더 JSON | 패딩 | 배열 블록들 (각 ALIGNMENT 바이트 정렬)
+
+    헤더 = {"format", "version", "created_at", "meta": {...},
+            "arrays": {이름: {"dtype", "shape", "offset"(데이터 시작 기준)}},
+            "strings": {이름: {"nullable"}}}
+
+문자열 컬럼은 UTF-8 바이트 블록(<이름>.data) + 시작 위치 배열(<이름>.offsets, n+1) 두 배열로 저장하고
+조회할 때 해당 행만 디코딩한다. 키 조회용으로 정렬 순열(<이름>.order)을 함께 저장한다.
+"""
+import bisect
+import json
+import os
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAGIC = b"SHHREF\x00\x01"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREFIX_SIZE = len(MAGIC) + 8
+
+
+def _align(n: int) -> int:
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class StringColumn(Sequence):
+    """UTF-8 블록 + offsets 로 저장된 문자열 컬럼 (행 단위로 필요할 때만 디코딩)"""
+
+    def __init__(self, data, offsets, nullable: bool = False):
+        self._data = data
+        self._offsets = offsets
+        self._nullable = nullable  # 빈 문자열 = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        value = self._data[int(self._offsets[i]):int(self._offsets[i + 1])].tobytes().decode("utf-8")
+        return None if self._nullable and not value else value
+
+    def prefix(self, n: int) -> "StringColumn":
+        """앞 n 행만 보는 컬럼 (복사 없음)"""
+        return StringColumn(self._data, self._offsets[:n + 1], self._nullable)
+
+
+class SortedKeyMap(Mapping):
+    """
+    문자열 키 → 행 위치 (또는 make(행 위치)) 매핑
+    키 컬럼의 정렬 순열로 이진 탐색하므로 파이썬 dict 를 만들지 않는다
+    """
+
+    class _SortedView(Sequence):
+        def __init__(self, keys: StringColumn, order):
+            self._keys = keys
+            self._order = order
+
+        def __len__(self) -> int:
+            return len(self._order)
+
+        def __getitem__(self, i):
+            return self._keys[self._order[i]]
+
+    def __init__(self, keys: StringColumn, order, make: Optional[Callable[[int], Any]] = None):
+        self._keys = keys
+        self._order = order
+        self._sorted = self._SortedView(keys, order)
+        self._make = make
+
+    def _position(self, key) -> Optional[int]:
+        lo = bisect.bisect_left(self._sorted, key)
+        if lo < len(self._sorted) and self._sorted[lo] == key:
+            return int(self._order[lo])
+        return None
+
+    def __getitem__(self, key):
+        pos = self._position(key)
+        if pos is None:
+            raise KeyError(key)
+        return self._make(pos) if self._make else pos
+
+    def __contains__(self, key) -> bool:
+        return self._position(key) is not None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _encode_strings(values: List[Optional[str]]):
+    import numpy as np
+
+    encoded = [(v or "").encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    order = np.asarray(sorted(range(len(values)), key=lambda i: values[i] or ""), dtype=np.int64)
+    return data, offsets, order
+
+
+def _snapshot_arrays(snapshot) -> Tuple[Dict[str, Any], Dict[str, Dict], Dict[str, Any]]:
+    """ReferenceSnapshot → (배열, 문자열 컬럼, meta)"""
+    import numpy as np
+
+    # 상권: 좌표가 있는 행(공간 인덱스 순서)을 앞에, 없는 행을 뒤에 → 공간 인덱스는 앞부분 뷰
+    index = snapshot.district_index
+    located = [snapshot.districts[code] for code in index.codes]
+    located_codes = set(index.codes)
+    rest = [d for code, d in snapshot.districts.items() if code not in located_codes]
+    districts = located + rest
+    cell_state = index.cell_state()
+
+    industry_index = snapshot.industry_index
+    industries = [snapshot.industries[name] for name in industry_index.names]
+
+    arrays = {
+        "district.label": np.asarray([d.cluster_label for d in districts], dtype=np.int64),
+        "district.total_revenue": np.asarray([d.total_revenue for d in districts], dtype=np.int64),
+        "district.avg_age": np.asarray([d.avg_age for d in districts], dtype=np.float64),
+        "district.efficiency": np.asarray([d.efficiency for d in districts], dtype=np.float64),
+        "district.business_count": np.asarray([d.business_count for d in districts], dtype=np.int64),
+        "district.x": np.asarray([np.nan if d.x is None else d.x for d in districts], dtype=np.float64),
+        "district.y": np.asarray([np.nan if d.y is None else d.y for d in districts], dtype=np.float64),
+        "district_index.order": np.asarray(cell_state["order"], dtype=np.int64),
+        "district_index.sorted_keys": np.asarray(cell_state["sorted_keys"], dtype=np.int64),
+        "industry.ages": np.asarray(industry_index.ages, dtype=np.float64),
+        "industry.female": np.asarray(industry_index.female, dtype=np.float64),
+        "industry.labels": np.asarray(industry_index.labels, dtype=np.int64),
+        "industry.features": np.ascontiguousarray(industry_index.features, dtype=np.float64),
+        "industry.top_idx": np.ascontiguousarray(industry_index.top_idx, dtype=np.int64),
+        "industry.top_score": np.ascontiguousarray(industry_index.top_score, dtype=np.float64),
+    }
+    strings = {
+        "district.code": ([d.district_code for d in districts], False),
+        "district.name": ([d.district_name for d in districts], False),
+        "district.type": ([d.cluster_type for d in districts], True),
+        "industry.name": (list(industry_index.names), False),
+        "industry.type_code": ([i.industry_type_code for i in industries], True),
+    }
+    meta = {
+        "district_located": len(index),
+        "cell_degrees": index.cell_degrees,
+        "row_range": cell_state["row_range"],
+        "col_range": cell_state["col_range"],
+        "max_abs_lat": cell_state["max_abs_lat"],
+    }
+    return arrays, strings, meta
+
+
+def write_reference_file(snapshot, path: str, version: int) -> None:
+    """
+    스냅샷을 path 에 기록 (임시 파일에 쓴 뒤 os.replace 로 교체)
+    이미 이전 파일을 매핑한 워커는 교체 후에도 이전 inode 를 계속 읽으므로 안전하다
+    """
+    arrays, strings, meta = _snapshot_arrays(snapshot)
+    header = {
+        "format": FORMAT_VERSION,
+        "version": version,
+        "created_at": datetime.utcnow().isoformat(),
+        "meta": meta,
+        "arrays": {},
+        "strings": {},
+    }
+    for name, (values, nullable) in strings.items():
+        data, offsets, order = _encode_strings(values)
+        arrays[f"{name}.data"] = data
+        arrays[f"{name}.offsets"] = offsets
+        arrays[f"{name}.order"] = order
+        header["strings"][name] = {"nullable": nullable}
+
+    offset = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = _align(offset + array.nbytes)
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = _align(_PREFIX_SIZE + len(header_bytes))
+
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header_bytes).to_bytes(8, "little"))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + header["arrays"][name]["offset"])
+            f.write(array.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_header(path: str) -> Tuple[Dict[str, Any], int]:
+    """(헤더, 데이터 시작 위치)"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"참조 스냅샷 파일이 아닙니다: {path}")
+        header_len = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_len).decode("utf-8"))
+    if header.get("format") != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 참조 스냅샷 파일 포맷: {header.get('format')}")
+    return header, _align(_PREFIX_SIZE + header_len)
+
+
+def load_reference_file(path: str):
+    """path 를 읽기 전용으로 매핑해 ReferenceSnapshot 생성 (배열 복사 없음)"""
+    import numpy as np
+
+    from app.services.district_index import DistrictSpatialIndex
+    from app.services.industry_index import IndustrySimilarityIndex
+    from app.services.reference_snapshot import DistrictInfo, IndustryInfo, ReferenceSnapshot
+
+    header, data_start = read_header(path)
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+
+    def array(name: str):
+        spec = header["arrays"][name]
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        if not count:
+            return np.empty(spec["shape"], dtype=dtype)
+        view = np.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + spec["offset"])
+        return view.reshape(spec["shape"])
+
+    def strings(name: str) -> StringColumn:
+        nullable = header["strings"][name]["nullable"]
+        return StringColumn(array(f"{name}.data"), array(f"{name}.offsets"), nullable)
+
+    meta = header["meta"]
+    located = meta["district_located"]
+
+    codes = strings("district.code")
+    names = strings("district.name")
+    types = strings("district.type")
+    labels = array("district.label")
+    revenue = array("district.total_revenue")
+    avg_age = array("district.avg_age")
+    efficiency = array("district.efficiency")
+    business_count = array("district.business_count")
+    xs = array("district.x")
+    ys = array("district.y")
+
+    def district_info(i: int) -> DistrictInfo:
+        x, y = float(xs[i]), float(ys[i])
+        return DistrictInfo(
+            district_code=codes[i],
+            district_name=names[i],
+            cluster_label=int(labels[i]),
+            cluster_type=types[i],
+            total_revenue=int(revenue[i]),
+            avg_age=float(avg_age[i]),
+            efficiency=float(efficiency[i]),
+            business_count=int(business_count[i]),
+            x=None if np.isnan(x) else x,
+            y=None if np.isnan(y) else y,
+        )
+
+    district_index = DistrictSpatialIndex(
+        codes=codes.prefix(located),
+        names=names.prefix(located),
+        labels=labels[:located],
+        types=types.prefix(located),
+        lons=xs[:located],
+        lats=ys[:located],
+        cell_degrees=meta["cell_degrees"],
+        cell_state={
+            "order": array("district_index.order"),
+            "sorted_keys": array("district_index.sorted_keys"),
+            "row_range": meta["row_range"],
+            "col_range": meta["col_range"],
+            "max_abs_lat": meta["max_abs_lat"],
+        },
+    )
+
+    industry_names = strings("industry.name")
+    industry_order = array("industry.name.order")
+    type_codes = strings("industry.type_code")
+    industry_labels = array("industry.labels")
+    industry_index = IndustrySimilarityIndex(
+        names=industry_names,
+        ages=array("industry.ages"),
+        female=array("industry.female"),
+        labels=industry_labels,
+        index_of=SortedKeyMap(industry_names, industry_order),
+        precomputed={
+            "features": array("industry.features"),
+            "top_idx": array("industry.top_idx"),
+            "top_score": array("industry.top_score"),
+        },
+    )
+
+    return ReferenceSnapshot(
+        version=header["version"],
+        districts=SortedKeyMap(codes, array("district.code.order"), make=district_info),
+        industries=SortedKeyMap(
+            industry_names,
+            industry_order,
+            make=lambda i: IndustryInfo(cluster_label=int(industry_labels[i]), industry_type_code=type_codes[i]),
+        ),
+        district_index=district_index,
+        industry_index=industry_index,
+    )
@@ -0,0 +1,313 @@
+"""
+기준 데이터 적재 (district_clusters / industry_clusters)
+
+CSV / Parquet 을 pandas 로 chunk 단위 스트리밍 → 모델 컬럼 정의대로 변환·검증 → 배치 UPSERT.
+- 파일 전체를 메모리에 올리지 않는다 (CSV: read_csv(chunksize), Parquet: iter_batches)
+- DECIMAL(p, s) 는 모델의 scale 로 반올림해 Decimal 로, 정수부 자릿수 초과는 오류
+- 정수는 float64 를 거치지 않고 Decimal → int 로 정확히 변환 (2^53 초과 BIGINT 도 그대로),
+  INT / BIGINT / SMALLINT 범위 초과는 DB 에 보내기 전에 오류
+- NOT NULL / 문자열 길이 / CHECK (col IN (...)) 제약을 DB 에 보내기 전에 chunk 단위로 벡터 검증
+- MySQL: INSERT ... ON DUPLICATE KEY UPDATE, SQLite(벤치 스탠드인): ON CONFLICT DO UPDATE
+  (REPLACE 는 district_industry_mix 의 ON DELETE CASCADE 를 타므로 쓰지 않는다)
+
+기본은 검증 패스(DB 미접근)로 파일 전체를 먼저 훑고, 오류가 없을 때만 쓰기 패스를 돈다.
+skip_invalid=True 면 한 번만 읽으며 잘못된 행만 건너뛴다.
+"""
+import re
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Integer, Numeric, SmallInteger, String
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.district import DistrictCluster
+from app.models.user import IndustryCluster
+from app.services.reference_snapshot import reference_snapshot
+
+REFERENCE_MODELS = {
+    "district_clusters": DistrictCluster,
+    "industry_clusters": IndustryCluster,
+}
+
+# "cluster_label IN (0, 1, 2, 3)" / "cluster_type IN ('red', ...)"
+_IN_CHECK = re.compile(r"^\s*(\w+)\s+IN\s*\((.*)\)\s*$", re.IGNORECASE | re.DOTALL)
+
+# 결과에 담는 오류 행 최대 개수 (나머지는 개수만 집계)
+MAX_REPORTED_ERRORS = 100
+
+# MySQL signed 정수 컬럼 비트 수 (Integer 하위 타입은 먼저 매칭)
+_INT_BITS = ((BigInteger, 64), (SmallInteger, 16), (Integer, 32))
+
+
+class _ColumnSpec:
+    """모델 컬럼 하나의 변환/검증 규칙"""
+
+    def __init__(self, column, allowed: Optional[set]):
+        self.name = column.name
+        self.nullable = column.nullable and not column.primary_key
+        self.allowed = allowed
+        col_type = column.type
+        if isinstance(col_type, Numeric) and col_type.scale is not None:
+            self.kind = "decimal"
+            self.scale = col_type.scale
+            self.limit = 10 ** (col_type.precision - col_type.scale)  # 절댓값 상한 (정수부 자릿수)
+        elif isinstance(col_type, Integer):
+            self.kind = "int"
+            bits = next(b for t, b in _INT_BITS if isinstance(col_type, t))
+            self.min, self.max = -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
+        elif isinstance(col_type, String):
+            self.kind = "str"
+            self.length = col_type.length
+        else:
+            raise ValueError(f"적재할 수 없는 컬럼 타입: {self.name} ({col_type})")
+
+
+def _check_allowed_values(model) -> Dict[str, set]:
+    """모델 __table_args__ 의 CHECK (col IN (...)) → {col: 허용값 집합}"""
+    table = model.__table__
+    allowed = {}
+    for constraint in table.constraints:
+        if not isinstance(constraint, CheckConstraint):
+            continue
+        match = _IN_CHECK.match(str(constraint.sqltext))
+        if not match or match.group(1) not in table.c:
+            continue
+        name = match.group(1)
+        raw = [v.strip().strip("'\"") for v in match.group(2).split(",")]
+        allowed[name] = {int(v) for v in raw} if isinstance(table.c[name].type, Integer) else set(raw)
+    return allowed
+
+
+def _column_specs(model) -> Dict[str, _ColumnSpec]:
+    # created_at 등 서버 기본값 컬럼은 적재 대상에서 제외
+    allowed = _check_allowed_values(model)
+    return {
+        column.name: _ColumnSpec(column, allowed.get(column.name))
+        for column in model.__table__.columns
+        if not isinstance(column.type, DateTime)
+    }
+
+
+def _parse_decimal(value: str) -> Optional[Decimal]:
+    """숫자 문자열 → Decimal (정확한 값, 숫자가 아니거나 inf/nan 이면 None)"""
+    try:
+        parsed = Decimal(value)
+    except InvalidOperation:
+        return None
+    return parsed if parsed.is_finite() else None
+
+
+def _iter_frames(path: str, chunk_size: int, columns: List[str]) -> Iterator[Any]:
+    """파일 → DataFrame chunk (문자열 컬럼의 앞자리 0 보존을 위해 CSV 는 모두 str 로 읽는다)"""
+    import pandas as pd
+
+    lower = path.lower()
+    if lower.endswith((".parquet", ".pq")):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet 적재에는 pyarrow 가 필요합니다: pip install pyarrow")
+        parquet = pq.ParquetFile(path)
+        present = [c for c in columns if c in parquet.schema_arrow.names]
+        for batch in parquet.iter_batches(batch_size=chunk_size, columns=present):
+            yield batch.to_pandas()
+        return
+
+    # .csv / .csv.gz 등 (압축은 pandas 가 확장자로 판단)
+    reader = pd.read_csv(
+        path,
+        chunksize=chunk_size,
+        dtype=str,
+        encoding="utf-8-sig",  # 엑셀 BOM 허용
+        usecols=lambda c: c.strip() in columns,
+        skipinitialspace=True,
+    )
+    for frame in reader:
+        frame.columns = [c.strip() for c in frame.columns]
+        yield frame
+
+
+def _coerce_frame(
+    frame,
+    specs: Dict[str, _ColumnSpec],
+    first_row: int,
+    errors: List[Dict[str, Any]],
+    build_records: bool = True,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    DataFrame chunk → (유효 행 dict 목록, 잘못된 행 수)
+    first_row 는 chunk 첫 행의 파일 기준 행 번호 (데이터 1행부터)
+    build_records=False 면 검증만 (검증 패스에서 Decimal 생성 비용 생략)
+    """
+    import numpy as np
+    import pandas as pd
+
+    n = len(frame)
+    invalid = np.zeros(n, dtype=bool)
+    converted: Dict[str, list] = {}
+
+    def _fail(mask, column: str, message: str) -> None:
+        nonlocal invalid
+        for pos in np.flatnonzero(mask & ~invalid):
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": first_row + int(pos), "column": column, "error": message})
+        invalid |= mask
+
+    for name, spec in specs.items():
+        if name not in frame.columns:
+            continue
+        # CSV 는 str, Parquet 은 타입이 있으므로 문자열로 맞춘 뒤 변환
+        text = frame[name].astype("string").str.strip().fillna("")
+        missing = (text == "").to_numpy(dtype=bool)
+        if spec.kind == "str":
+            if spec.length:
+                _fail((text.str.len() > spec.length).to_numpy(dtype=bool), name, f"{spec.length}자 초과")
+            present = text.to_numpy(dtype=object)
+        elif spec.kind == "int":
+            # float64 는 2^53 을 넘으면 값이 바뀌므로 행마다 Decimal 로 파싱해 파이썬 int 로
+            parsed = [None if m else _parse_decimal(v) for v, m in zip(text.to_numpy(dtype=object), missing)]
+            numeric = np.fromiter((d is not None for d in parsed), dtype=bool, count=n)
+            integral = np.fromiter(
+                (d is not None and d == d.to_integral_value() for d in parsed), dtype=bool, count=n
+            )
+            present = np.empty(n, dtype=object)
+            # 19자리 이상은 BIGINT 도 넘으므로 int 로 만들지 않는다 (1e999999 같은 입력)
+            present[:] = [int(d) if ok and d.adjusted() < 19 else None for d, ok in zip(parsed, integral)]
+            in_range = np.fromiter(
+                (v is not None and spec.min <= v <= spec.max for v in present), dtype=bool, count=n
+            )
+            _fail(~numeric & ~missing, name, "숫자가 아님")
+            _fail(numeric & ~integral, name, "정수가 아님")
+            _fail(integral & ~in_range, name, f"정수 범위 초과 ({spec.min} ~ {spec.max})")
+        else:
+            present = pd.to_numeric(text, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            _fail(np.isnan(present) & ~missing, name, "숫자가 아님")
+            present = np.round(present, spec.scale)
+            _fail(np.abs(present) >= spec.limit, name, f"DECIMAL 범위 초과 (< {spec.limit})")
+
+        if not spec.nullable:
+            _fail(missing, name, "필수 값 누락")
+        if spec.allowed is not None:
+            _fail(~missing & ~np.isin(present, list(spec.allowed)), name, f"허용값 {sorted(spec.allowed)} 이 아님")
+
+        if not build_records:
+            continue
+        if spec.kind == "decimal":
+            fmt = f".{spec.scale}f"
+            converted[name] = [None if m else Decimal(format(v, fmt)) for v, m in zip(present, missing)]
+        elif spec.kind == "int":
+            converted[name] = present.tolist()  # 누락은 이미 None
+        else:
+            converted[name] = [None if m else v for v, m in zip(present, missing)]
+
+    if not build_records:
+        return [], int(invalid.sum())
+    columns = list(converted)
+    valid_positions = np.flatnonzero(~invalid)
+    records = [{c: converted[c][i] for c in columns} for i in valid_positions]
+    return records, int(invalid.sum())
+
+
+def _upsert_statement(db: Session, model, columns: List[str]):
+    table = model.__table__
+    pk = [c.name for c in table.primary_key.columns]
+    update_columns = [c for c in columns if c not in pk]
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=pk, set_={c: stmt.excluded[c] for c in update_columns}
+        )
+    raise RuntimeError(f"지원하지 않는 DB: {dialect}")
+
+
+def _check_header(specs: Dict[str, _ColumnSpec], frame) -> None:
+    missing = [name for name, spec in specs.items() if not spec.nullable and name not in frame.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 파일에 없습니다: {', '.join(missing)}")
+
+
+def _scan(path: str, specs, chunk_size: int, errors: list, on_chunk=None) -> Dict[str, int]:
+    """파일을 chunk 단위로 변환/검증하며 on_chunk(records) 호출"""
+    stats = {"total": 0, "invalid": 0}
+    first_row = 1
+    for i, frame in enumerate(_iter_frames(path, chunk_size, list(specs))):
+        if i == 0:
+            _check_header(specs, frame)
+        records, invalid = _coerce_frame(frame, specs, first_row, errors, build_records=on_chunk is not None)
+        stats["total"] += len(frame)
+        stats["invalid"] += invalid
+        first_row += len(frame)
+        if on_chunk and records:
+            on_chunk(records)
+    return stats
+
+
+def load_reference_table(
+    db: Session,
+    table_name: str,
+    path: str,
+    chunk_size: Optional[int] = None,
+    skip_invalid: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    path 의 CSV / Parquet 을 table_name 에 UPSERT
+
+    Returns:
+        {"table", "total", "written", "invalid", "errors": [{"row", "column", "error"}], "elapsed_seconds"}
+        errors 는 최대 MAX_REPORTED_ERRORS 개, row 는 헤더 제외 데이터 행 번호 (1부터)
+    """
+    if table_name not in REFERENCE_MODELS:
+        raise ValueError(f"적재할 수 없는 테이블: {table_name} (가능: {', '.join(REFERENCE_MODELS)})")
+    model = REFERENCE_MODELS[table_name]
+    specs = _column_specs(model)
+    chunk_size = chunk_size or settings.REFERENCE_LOAD_CHUNK_SIZE
+    started = time.perf_counter()
+    errors: List[Dict[str, Any]] = []
+    result = {"table": table_name, "written": 0, "errors": errors}
+
+    def _finish(stats):
+        result.update(stats)
+        errors.sort(key=lambda e: e["row"])
+        result["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+        return result
+
+    # 1) 검증 패스 - 오류가 하나라도 있으면 아무것도 쓰지 않는다
+    if not skip_invalid or dry_run:
+        stats = _scan(path, specs, chunk_size, errors)
+        if stats["invalid"] or dry_run:
+            return _finish(stats)
+        errors.clear()
+
+    # 2) 쓰기 패스 - chunk 마다 executemany UPSERT + commit
+    statements = {}
+
+    def _write(records):
+        columns = tuple(records[0])
+        if columns not in statements:
+            statements[columns] = _upsert_statement(db, model, list(columns))
+        try:
+            db.execute(statements[columns], records)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        result["written"] += len(records)
+        print(f"  {table_name}: {result['written']} rows upserted")
+
+    stats = _scan(path, specs, chunk_size, errors, on_chunk=_write)
+    # Core UPSERT 는 ORM 이벤트가 없으므로 이 프로세스의 스냅샷을 직접 무효화
+    # (다른 워커는 REFERENCE_SNAPSHOT_REFRESH_SECONDS 주기 갱신 때, 파일 모드면 스냅샷 파일을 다시 쓸 때 반영)
+    reference_snapshot.invalidate()
+    return _finish(stats)
+
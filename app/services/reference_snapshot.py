@@ -0,0 +1,394 @@
+"""
+참조 데이터 스냅샷 (district_clusters + industry_clusters)
+
+두 테이블을 한 세션(트랜잭션)에서 읽어 불변 ReferenceSnapshot 하나로 묶는다.
+- district_index: 좌표가 있는 상권의 공간 인덱스 (DistrictSpatialIndex)
+- industry_index: 업종 유사도 인덱스 (IndustrySimilarityIndex)
+- districts / industries: 상권 코드 / 업종명 → 행 정보 (NamedTuple)
+- version: 빌드할 때마다 1씩 증가
+
+DB 에서 직접 빌드하면 dict / list 로, 스냅샷 파일(reference_file)에서 읽으면
+np.memmap 배열과 그 위의 읽기 전용 Mapping / Sequence 로 같은 인터페이스를 제공한다.
+
+요청 처리 경로는 현재 스냅샷 참조 하나만 읽는다 (잠금 / 빌드 없음, 아직 없으면 503).
+백그라운드 스레드가 주기적으로, 또는 참조 테이블 변경이 commit 된 뒤 새 스냅샷을 끝까지 만든 다음
+참조를 한 번에 교체하므로 읽는 쪽은 완성된 이전 스냅샷 또는 새 스냅샷 중 하나만 본다.
+"""
+import os
+import threading
+import time
+from itertools import chain
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.database import SessionLocal
+from app.models.district import DistrictCluster
+from app.models.user import IndustryCluster
+from app.services.district_index import DistrictSpatialIndex
+from app.services.industry_index import IndustrySimilarityIndex
+from app.services.reference_cache import ReferenceDataUnavailable, on_event_loop
+from app.services.reference_file import load_reference_file, read_header, write_reference_file
+
+
+class DistrictInfo(NamedTuple):
+    district_code: str
+    district_name: str
+    cluster_label: int
+    cluster_type: Optional[str]
+    total_revenue: int
+    avg_age: float
+    efficiency: float
+    business_count: int
+    x: Optional[float]  # 경도
+    y: Optional[float]  # 위도
+
+
+class IndustryInfo(NamedTuple):
+    cluster_label: int
+    industry_type_code: Optional[str]
+
+
+class ReferenceSnapshot:
+    """참조 데이터 한 벌 (불변 객체 - 갱신 시 새로 만든다)"""
+
+    def __init__(
+        self,
+        version: int,
+        districts: Mapping[str, DistrictInfo],
+        industries: Mapping[str, IndustryInfo],
+        district_index: DistrictSpatialIndex,
+        industry_index: IndustrySimilarityIndex,
+    ):
+        self.version = version
+        self.built_at = time.time()
+        self.districts = districts
+        self.industries = industries
+        self.district_index = district_index
+        self.industry_index = industry_index
+
+    @classmethod
+    def build(cls, db: Session, version: int) -> "ReferenceSnapshot":
+        """두 테이블을 같은 트랜잭션에서 읽어 스냅샷 생성"""
+        district_rows = db.execute(
+            select(
+                DistrictCluster.district_code,
+                DistrictCluster.district_name,
+                DistrictCluster.cluster_label,
+                DistrictCluster.cluster_type,
+                DistrictCluster.total_revenue,
+                DistrictCluster.avg_age,
+                DistrictCluster.efficiency,
+                DistrictCluster.business_count,
+                DistrictCluster.x,
+                DistrictCluster.y,
+            )
+        ).all()
+        industry_rows = db.execute(
+            select(
+                IndustryCluster.industry_name,
+                IndustryCluster.avg_age_score,
+                IndustryCluster.avg_female_ratio,
+                IndustryCluster.cluster_label,
+                IndustryCluster.industry_type_code,
+            )
+        ).all()
+
+        districts = {
+            r.district_code: DistrictInfo(
+                district_code=r.district_code,
+                district_name=r.district_name,
+                cluster_label=r.cluster_label,
+                cluster_type=r.cluster_type,
+                total_revenue=int(r.total_revenue),
+                avg_age=float(r.avg_age),
+                efficiency=float(r.efficiency),
+                business_count=r.business_count,
+                x=float(r.x) if r.x is not None else None,
+                y=float(r.y) if r.y is not None else None,
+            )
+            for r in district_rows
+        }
+        located = [d for d in districts.values() if d.x is not None and d.y is not None]
+        district_index = DistrictSpatialIndex(
+            codes=[d.district_code for d in located],
+            names=[d.district_name for d in located],
+            labels=[d.cluster_label for d in located],
+            types=[d.cluster_type for d in located],
+            lons=[d.x for d in located],
+            lats=[d.y for d in located],
+            cell_degrees=settings.DISTRICT_INDEX_CELL_DEGREES,
+        )
+
+        industries = {
+            r.industry_name: IndustryInfo(cluster_label=r.cluster_label, industry_type_code=r.industry_type_code)
+            for r in industry_rows
+        }
+        industry_index = IndustrySimilarityIndex(
+            names=[r.industry_name for r in industry_rows],
+            ages=[float(r.avg_age_score) for r in industry_rows],
+            female=[float(r.avg_female_ratio) for r in industry_rows],
+            labels=[int(r.cluster_label) for r in industry_rows],
+        )
+        return cls(version, districts, industries, district_index, industry_index)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "age_seconds": round(time.time() - self.built_at, 1),
+            "districts": len(self.districts),
+            "districts_with_coordinates": len(self.district_index),
+            "industries": len(self.industries),
+        }
+
+
+class ReferenceSnapshotStore:
+    """
+    현재 스냅샷 보관 + 갱신
+
+    - get(db): 현재 스냅샷 반환. 백그라운드 갱신 스레드가 없는 프로세스(CLI, Celery 워커)에서는
+      최초 조회 / 만료 / 무효화 시 직접 빌드 (이전 ReferenceIndexHolder 와 같은 동작)
+    - start(): 백그라운드 갱신 시작 (API 서버 startup) - 이후 get() 은 DB 도 잠금도 건드리지 않고,
+      첫 스냅샷이 발행되기 전(빌드 중 / 빌드 실패)에는 ReferenceDataUnavailable(503)
+      이벤트 루프 스레드(run_sync 안)에서도 같다 - 빌드 쿼리 중 루프로 양보한 사이 다른 요청이
+      같은 threading.Lock 을 루프 스레드에서 기다리면 교착되므로
+    - refresh(): 즉시 다시 빌드해서 교체
+
+    빌드 / 내보내기는 호출한 세션이 아니라 항상 session_factory(primary) 의 새 세션으로 읽는다.
+    레플리카에서 읽으면 무효화를 일으킨 commit 이 아직 반영되지 않은 데이터로 dirty 를 지우고
+    다음 주기까지 (파일 모드면 모든 워커에) 낡은 스냅샷을 내보낼 수 있기 때문.
+    get(db) 의 db 는 run_sync 호출 규약 때문에 받기만 한다.
+
+    파일 모드 (REFERENCE_SNAPSHOT_FILE 설정 시, 여러 uvicorn 워커용):
+    - 워커는 스냅샷 파일을 np.memmap 으로 열어 쓴다 (워커 간 페이지 캐시 공유, 기동 즉시)
+    - 백그라운드 스레드는 poll_seconds 마다 파일 교체를 확인해 다시 매핑
+    - 파일이 없거나 refresh_seconds 보다 오래됐거나 이 프로세스에서 참조 테이블 변경이 commit 되면
+      DB 에서 빌드해 파일을 다시 쓴다 (파일 잠금으로 워커 하나만)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        refresh_seconds: Callable[[], int],
+        file_path: Callable[[], str] = lambda: "",
+        poll_seconds: Callable[[], int] = lambda: 5,
+    ):
+        self._session_factory = session_factory
+        self._refresh_seconds = refresh_seconds
+        self._file_path = file_path
+        self._poll_seconds = poll_seconds
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._file_stat: Optional[tuple] = None  # 현재 매핑한 파일의 (inode, mtime, size)
+        self._version = 0
+        self._dirty = False
+        self._lock = threading.Lock()  # 빌드 직렬화용 (읽기에는 쓰지 않는다)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _background(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _is_fresh(self, snapshot: Optional[ReferenceSnapshot]) -> bool:
+        if snapshot is None or self._dirty:
+            return False
+        ttl = self._refresh_seconds()
+        return ttl <= 0 or time.time() - snapshot.built_at < ttl
+
+    def _usable(self, snapshot: Optional[ReferenceSnapshot]) -> bool:
+        # 백그라운드 갱신 중이면 조금 낡은 스냅샷도 그대로 쓴다 (교체는 스레드가 담당)
+        return snapshot is not None and (self._background() or self._is_fresh(snapshot))
+
+    def get(self, db: Optional[Session] = None) -> ReferenceSnapshot:
+        snapshot = self._snapshot
+        if self._usable(snapshot):
+            return snapshot
+        if self._background() or on_event_loop():
+            # 요청 경로: 빌드는 백그라운드 스레드 몫 - 마지막 스냅샷을 쓰거나, 아직 없으면 503
+            if snapshot is not None:
+                return snapshot
+            raise ReferenceDataUnavailable("참조 데이터 스냅샷")
+
+        with self._lock:
+            snapshot = self._snapshot
+            if self._usable(snapshot):
+                return snapshot
+            return self._rebuild()
+
+    def refresh(self) -> ReferenceSnapshot:
+        with self._lock:
+            return self._rebuild()
+
+    def _build(self, version: int) -> ReferenceSnapshot:
+        db = self._session_factory()
+        try:
+            return ReferenceSnapshot.build(db, version)
+        finally:
+            db.close()
+
+    def _rebuild(self) -> ReferenceSnapshot:
+        # 빌드 중에 들어온 invalidate() 는 dirty 로 남아 다음 갱신에서 다시 빌드
+        self._dirty = False
+        snapshot = self._build(self._version + 1)
+        self._version = snapshot.version
+        self._file_stat = None  # 파일 모드여도 DB 빌드본을 쓰는 중 (다음 poll 때 파일을 다시 매핑)
+        self._snapshot = snapshot  # 참조 하나 대입 → 원자적 교체
+        print(
+            f"🗂️  Reference snapshot v{snapshot.version} built: "
+            f"{len(snapshot.districts)} districts, {len(snapshot.industries)} industries"
+        )
+        return snapshot
+
+    def invalidate(self) -> None:
+        self._dirty = True
+        self._wake.set()
+
+    def start(self) -> None:
+        if self._background():
+            return
+        if self._file_path():
+            # 파일이 이미 있으면 매핑만 하면 되므로 첫 요청 전에 바로 준비된다
+            try:
+                self._load_file_if_changed(self._file_path())
+            except Exception as e:
+                print(f"❌ Reference snapshot file load failed: {e!r}")
+        self._stop.clear()
+        self._wake.set()  # 시작하자마자 최초 빌드 / 파일 확인
+        self._thread = threading.Thread(target=self._run, name="reference-snapshot", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _next_wait(self) -> Optional[float]:
+        if self._file_path():
+            return 0.0 if self._snapshot is None else self._poll_seconds()
+        if self._snapshot is None:
+            return 0.0
+        ttl = self._refresh_seconds()
+        if ttl <= 0:
+            return None  # 변경 commit 때만 갱신
+        return max(0.0, self._snapshot.built_at + ttl - time.time())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._next_wait())
+            if self._stop.is_set():
+                break
+            self._wake.clear()
+            try:
+                if self._file_path():
+                    self._sync_file(self._file_path())
+                elif not self._is_fresh(self._snapshot):
+                    self.refresh()
+            except Exception as e:
+                # 실패하면 이전 스냅샷을 계속 쓰고 다음 주기에 재시도
+                print(f"❌ Reference snapshot refresh failed: {e!r}")
+                if self._snapshot is None:
+                    self._stop.wait(5.0)
+
+    # ---- 파일 모드 ----
+
+    @staticmethod
+    def _stat(path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _file_is_stale(self, path: str) -> bool:
+        stat = self._stat(path)
+        if stat is None or self._dirty:
+            return True
+        ttl = self._refresh_seconds()
+        return ttl > 0 and time.time() - stat[1] / 1e9 >= ttl
+
+    def _load_file_if_changed(self, path: str) -> None:
+        stat = self._stat(path)
+        if stat is None or stat == self._file_stat:
+            return
+        snapshot = load_reference_file(path)
+        self._version = max(self._version, snapshot.version)
+        self._file_stat = stat
+        self._snapshot = snapshot  # 참조 하나 대입 → 원자적 교체 (이전 매핑은 참조가 사라지면 해제)
+        print(
+            f"🗂️  Reference snapshot v{snapshot.version} mapped from {path}: "
+            f"{len(snapshot.districts)} districts, {len(snapshot.industries)} industries"
+        )
+
+    def _sync_file(self, path: str) -> None:
+        if self._file_is_stale(path):
+            self.export(path, only_if_stale=True)
+        self._load_file_if_changed(path)
+
+    def export(self, path: Optional[str] = None, only_if_stale: bool = False) -> Optional[int]:
+        """
+        DB(primary) 에서 스냅샷을 빌드해 파일로 내보내고 버전 반환
+        다른 프로세스가 내보내는 중이면 기다리지 않고 None (only_if_stale 이면 잠금 후 다시 확인)
+        """
+        import fcntl
+
+        path = path or self._file_path()
+        with open(f"{path}.lock", "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | (fcntl.LOCK_NB if only_if_stale else 0))
+            except BlockingIOError:
+                return None
+            if only_if_stale and not self._file_is_stale(path):
+                return None  # 잠금을 기다리는 사이 다른 워커가 새로 씀
+
+            self._dirty = False
+            previous = read_header(path)[0]["version"] if os.path.exists(path) else 0
+            version = max(previous, self._version) + 1
+            snapshot = self._build(version)
+            write_reference_file(snapshot, path, version)
+            self._version = version
+        print(f"💾 Reference snapshot v{version} exported to {path}")
+        return version
+
+    def info(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **(snapshot.info() if snapshot else {"version": None}),
+            "source": "file" if self._file_stat else "db",
+            "file": self._file_path() or None,
+            "background_refresh": self._background(),
+            "dirty": self._dirty,
+        }
+
+
+reference_snapshot = ReferenceSnapshotStore(
+    SessionLocal,
+    lambda: settings.REFERENCE_SNAPSHOT_REFRESH_SECONDS,
+    lambda: settings.REFERENCE_SNAPSHOT_FILE,
+    lambda: settings.REFERENCE_SNAPSHOT_POLL_SECONDS,
+)
+
+
+# 참조 테이블 ORM 변경은 flush 시점에 표시만 하고 commit 뒤에 무효화
+# (commit 전에 다시 빌드하면 다른 커넥션에서는 아직 변경이 보이지 않는다)
+_REFERENCE_MODELS = (DistrictCluster, IndustryCluster)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_reference_change(session, flush_context):
+    if any(isinstance(obj, _REFERENCE_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info["reference_data_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("reference_data_changed", False):
+        reference_snapshot.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_reference_change(session):
+    session.info.pop("reference_data_changed", None)
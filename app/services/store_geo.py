@@ -0,0 +1,82 @@
+"""
+회원 매장 위치 검색
+
+user_stores.geohash(인덱스) 접두사 범위 스캔으로 후보를 좁히고
+NumPy Haversine 으로 정확한 거리를 걸러 가까운 순으로 반환한다.
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, event, or_, select
+from sqlalchemy.orm import Session
+
+from app.core import geohash
+from app.models.user import UserStore
+from app.services.district_index import haversine_np
+
+
+def store_geohash(x, y) -> Optional[str]:
+    """매장 좌표(경도 x, 위도 y) → 저장용 geohash (좌표가 없으면 None)"""
+    if x is None or y is None:
+        return None
+    return geohash.encode(float(y), float(x), geohash.STORE_PRECISION)
+
+
+@event.listens_for(UserStore, "before_insert")
+@event.listens_for(UserStore, "before_update")
+def _set_store_geohash(mapper, connection, target):
+    # 좌표가 바뀌면 geohash 도 함께 갱신 (Core INSERT 는 호출 측에서 직접 채운다)
+    target.geohash = store_geohash(target.x, target.y)
+
+
+def geohash_cell_filter(lat: float, lng: float, radius_m: float):
+    """반경 원을 덮는 geohash 셀들의 접두사 범위 조건 (ix_user_stores_geohash 범위 스캔)"""
+    # prefix <= geohash < prefix + '~' (base32 문자는 모두 '~' 보다 작다)
+    return or_(*[
+        and_(UserStore.geohash >= prefix, UserStore.geohash < prefix + "~")
+        for prefix in geohash.covering_prefixes(lat, lng, radius_m)
+    ])
+
+
+def find_nearby_stores(db: Session, lat: float, lng: float, radius_m: float, limit: int) -> List[Dict]:
+    """
+    (lat, lng) 반경 radius_m 안의 회원 매장 - 가까운 순 최대 limit 개
+
+    Returns:
+        StoreOut 필드 + distance_meters 를 담은 Dict 목록
+    """
+    import numpy as np
+
+    rows = db.execute(
+        select(
+            UserStore.id,
+            UserStore.store_name,
+            UserStore.industry_name,
+            UserStore.district_name,
+            UserStore.road_address_name,
+            UserStore.x,
+            UserStore.y,
+        ).where(geohash_cell_filter(lat, lng, radius_m))
+    ).all()
+    if not rows:
+        return []
+
+    xs = np.array([float(r.x) for r in rows])
+    ys = np.array([float(r.y) for r in rows])
+    distances = haversine_np(lat, lng, ys, xs)
+
+    inside = np.flatnonzero(distances <= radius_m)
+    order = inside[np.argsort(distances[inside], kind="stable")][:limit]
+
+    return [
+        {
+            "id": rows[i].id,
+            "store_name": rows[i].store_name,
+            "industry_name": rows[i].industry_name,
+            "district_name": rows[i].district_name,
+            "road_address_name": rows[i].road_address_name,
+            "x": float(xs[i]),
+            "y": float(ys[i]),
+            "distance_meters": round(float(distances[i]), 2),
+        }
+        for i in order
+    ]
@@ -0,0 +1,183 @@
+"""
+매장 일괄 등록 (프랜차이즈 온보딩)
+
+행마다 조회/commit 하지 않고 배치 전체를 메모리에서 처리한다.
+- 업종 클러스터: 참조 데이터 스냅샷에서 조회 (DB 조회 없음)
+- 최근접 상권: 공간 인덱스로 좌표 배열을 한 번에 매핑
+- INSERT: chunk_size 행씩 executemany, chunk 마다 commit
+  (chunk 가 실패하면 그 chunk 만 행 단위로 다시 넣어 실패 행을 찾는다)
+"""
+import csv
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.user import UserStore
+from app.schemas.store import StoreCreate
+from app.services.district_service import DistrictService
+from app.services.place_membership import place_membership
+from app.services.reference_snapshot import reference_snapshot
+from app.services.store_geo import store_geohash
+
+# IN (...) 목록 최대 길이
+LOOKUP_CHUNK_SIZE = 1000
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def parse_csv(content: bytes) -> List[Dict[str, Any]]:
+    """CSV (헤더 = StoreCreate 필드명) → 행 목록, 빈 칸은 None"""
+    text = content.decode("utf-8-sig")  # 엑셀 BOM 허용
+    reader = csv.DictReader(io.StringIO(text))
+    return [
+        {key.strip(): (value.strip() or None) if isinstance(value, str) else value
+         for key, value in row.items() if key}
+        for row in reader
+    ]
+
+
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+    )
+
+
+def _existing_place_ids(db: Session, place_ids: List[str]) -> set:
+    existing = set()
+    for chunk in _chunks(place_ids, LOOKUP_CHUNK_SIZE):
+        existing.update(
+            db.scalars(select(UserStore.kakao_place_id).where(UserStore.kakao_place_id.in_(chunk)))
+        )
+    return existing
+
+
+def _insert_chunk(db: Session, chunk: List[Tuple[int, StoreCreate, dict]], errors: list) -> int:
+    """chunk 를 executemany 로 넣고 성공 행 수 반환"""
+    try:
+        db.execute(insert(UserStore), [values for _, _, values in chunk])
+        db.commit()
+        # Core INSERT 는 ORM 이벤트가 없으므로 멤버십 집합에 직접 반영
+        place_membership.add_many(store.kakaoPlaceId for _, store, _ in chunk)
+        return len(chunk)
+    except SQLAlchemyError:
+        db.rollback()
+
+    # 실패한 chunk 만 행 단위로 재시도해 원인 행을 보고
+    created = 0
+    for row_no, store, values in chunk:
+        try:
+            db.execute(insert(UserStore), [values])
+            db.commit()
+            place_membership.add(store.kakaoPlaceId)
+            created += 1
+        except SQLAlchemyError as e:
+            db.rollback()
+            errors.append({
+                "row": row_no,
+                "kakaoPlaceId": store.kakaoPlaceId,
+                "error": str(getattr(e, "orig", None) or e),
+            })
+    return created
+
+
+def import_stores(
+    db: Session,
+    user_id: int,
+    rows: List[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    매장 목록을 user_id 소유로 일괄 등록
+
+    Returns:
+        {"total", "created", "failed", "errors": [{"row", "kakaoPlaceId", "error"}]}
+        row 는 입력 순서 기준 1부터 시작
+    """
+    chunk_size = chunk_size or settings.STORE_IMPORT_CHUNK_SIZE
+    errors: List[Dict[str, Any]] = []
+
+    # 1) 행 검증 + 배치 내 kakao_place_id 중복 제거
+    valid: List[Tuple[int, StoreCreate]] = []
+    seen_place_ids = set()
+    for row_no, raw in enumerate(rows, start=1):
+        try:
+            store = StoreCreate.model_validate(raw)
+        except ValidationError as e:
+            errors.append({
+                "row": row_no,
+                "kakaoPlaceId": raw.get("kakaoPlaceId") if isinstance(raw, dict) else None,
+                "error": _validation_message(e),
+            })
+            continue
+
+        if store.kakaoPlaceId:
+            if store.kakaoPlaceId in seen_place_ids:
+                errors.append({"row": row_no, "kakaoPlaceId": store.kakaoPlaceId,
+                               "error": "같은 kakaoPlaceId 가 파일 안에 중복되어 있습니다."})
+                continue
+            seen_place_ids.add(store.kakaoPlaceId)
+        valid.append((row_no, store))
+
+    # 2) 이미 등록된 매장 제외
+    existing = _existing_place_ids(db, sorted(seen_place_ids)) if seen_place_ids else set()
+    if existing:
+        kept = []
+        for row_no, store in valid:
+            if store.kakaoPlaceId in existing:
+                errors.append({"row": row_no, "kakaoPlaceId": store.kakaoPlaceId,
+                               "error": "이미 등록된 매장입니다."})
+            else:
+                kept.append((row_no, store))
+        valid = kept
+
+    # 3) 업종 클러스터 / 최근접 상권을 배치 단위로 계산
+    clusters = reference_snapshot.get(db).industries
+    districts = DistrictService.find_nearest_district_clusters(
+        db, [(store.longitude, store.latitude) for _, store in valid]
+    )
+    db.commit()  # 조회 트랜잭션 종료 (INSERT 는 chunk 별 트랜잭션)
+
+    prepared = []
+    for (row_no, store), district in zip(valid, districts):
+        label, type_code = clusters.get(store.industryName, (None, None))
+        district = district or {}
+        prepared.append((row_no, store, {
+            "user_id": user_id,
+            "kakao_place_id": store.kakaoPlaceId,
+            "store_name": store.storeName,
+            "road_address_name": store.storeAddress,
+            "x": store.longitude,
+            "y": store.latitude,
+            "geohash": store_geohash(store.longitude, store.latitude),  # Core INSERT - ORM 이벤트 없음
+            "place_url": store.placeUrl,
+            "phone": store.phone,
+            "industry_name": store.industryName,
+            "industry_cluster_label": label,
+            "industry_cluster_type": type_code,
+            "district_code": district.get("district_code"),
+            "district_name": district.get("district_name"),
+            "district_cluster_label": district.get("district_cluster_label"),
+            "district_cluster_type": district.get("district_cluster_type"),
+        }))
+
+    # 4) chunk 단위 INSERT
+    created = 0
+    for chunk in _chunks(prepared, chunk_size):
+        created += _insert_chunk(db, chunk, errors)
+
+    errors.sort(key=lambda err: err["row"])
+    print(f"📦 Bulk import for user {user_id}: {created}/{len(rows)} created, {len(errors)} failed")
+    return {
+        "total": len(rows),
+        "created": created,
+        "failed": len(errors),
+        "errors": errors,
+    }
@@ -0,0 +1,42 @@
+from app.core.celery_app import celery_app
+from app.core.database import SessionLocal
+from app.services.district_reassignment import count_stores_to_scan, reassign_store_districts
+
+
+@celery_app.task(bind=True, name="districts.reassign_store_districts", max_retries=5)
+def reassign_store_districts_task(self, start_after_id: int = 0, batch_size: int = None, dry_run: bool = False):
+    """
+    district_clusters 재적재 후 전체 매장 상권 재배정
+    진행 상황은 PROGRESS 상태 meta 로 보고, 실패 시 마지막 commit id 부터 재시도
+    """
+    read_db = SessionLocal()
+    write_db = SessionLocal()
+    progress = {"last_id": start_after_id}
+
+    def _report(stats):
+        progress.update(stats)
+        self.update_state(state="PROGRESS", meta={**stats, "total": total})
+
+    try:
+        total = count_stores_to_scan(read_db, start_after_id)
+        return reassign_store_districts(
+            read_db,
+            write_db,
+            start_after_id=start_after_id,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            on_progress=_report,
+        )
+    except ValueError:
+        raise
+    except Exception as e:
+        write_db.rollback()
+        print(f"❌ District reassignment failed after id {progress['last_id']}: {e!r}")
+        raise self.retry(
+            exc=e,
+            countdown=30,
+            kwargs={"start_after_id": progress["last_id"], "batch_size": batch_size, "dry_run": dry_run},
+        )
+    finally:
+        read_db.close()
+        write_db.close()
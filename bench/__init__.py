@@ -0,0 +1 @@
+"""엔드포인트 벤치마크 하네스 (시드 데이터 / 카카오 스텁 / 부하 드라이버)"""
@@ -0,0 +1,63 @@
+"""
+카카오 로컬 API 스텁 서버
+
+KakaoAPIClient 가 실제 dapi.kakao.com 대신 이 서버를 호출하도록
+서버 실행 시 KAKAO_API_BASE_URL=http://127.0.0.1:18080 을 지정한다.
+
+사용법:
+    python -m bench.kakao_stub --port 18080 --latency-ms 30
+"""
+import argparse
+import asyncio
+import random
+
+from aiohttp import web
+
+
+def _document(i: int, x: float, y: float) -> dict:
+    return {
+        "id": f"stub-{i}",
+        "place_name": f"스텁장소{i}",
+        "category_name": "음식점 > 카페",
+        "address_name": f"서울 스텁구 스텁동 {i}",
+        "road_address_name": f"서울 스텁구 스텁로 {i}",
+        "address_type": "ROAD_ADDR",
+        "phone": "02-000-0000",
+        "x": f"{x + random.uniform(-0.005, 0.005):.7f}",
+        "y": f"{y + random.uniform(-0.005, 0.005):.7f}",
+        "distance": str(random.randint(1, 1000)),
+        "place_url": f"https://place.map.kakao.com/stub-{i}",
+    }
+
+
+def create_app(latency_ms: float, documents: int) -> web.Application:
+    async def _search(request: web.Request) -> web.Response:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        x = float(request.query.get("x", 126.98))
+        y = float(request.query.get("y", 37.56))
+        return web.json_response({
+            "meta": {"total_count": documents},
+            "documents": [_document(i, x, y) for i in range(documents)],
+        })
+
+    app = web.Application()
+    app.router.add_get("/v2/local/search/address.json", _search)
+    app.router.add_get("/v2/local/search/category.json", _search)
+    app.router.add_get("/v2/local/search/keyword.json", _search)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="응답 지연 (실제 API 왕복 흉내)")
+    parser.add_argument("--documents", type=int, default=15)
+    args = parser.parse_args()
+
+    web.run_app(create_app(args.latency_ms, args.documents), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
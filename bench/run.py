@@ -0,0 +1,218 @@
+"""
+엔드포인트 부하 드라이버
+
+실행 중인 API 서버에 고정 동시성으로 요청을 보내고
+시나리오별 p50/p95/p99 지연 시간과 처리량을 출력한다.
+
+사용법:
+    python -m bench.run --base-url http://127.0.0.1:8000 --concurrency 32 --requests 2000
+    python -m bench.run --scenarios login store_detail --max-p95-ms store_detail=50
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import httpx
+
+from bench.seed import BENCH_PASSWORD
+
+API = "/api/v1"
+
+
+class BenchContext:
+    def __init__(self, seeded_users: int, bulk_size: int, member_ratio: float):
+        self.seeded_users = seeded_users
+        self.bulk_size = bulk_size
+        self.member_ratio = member_ratio
+        self.tokens: List[str] = []
+        self.run_id = uuid.uuid4().hex[:8]
+
+    def auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {random.choice(self.tokens)}"}
+
+    def random_login_id(self) -> str:
+        return f"bench_user_{random.randrange(self.seeded_users)}"
+
+    def bulk_payload(self) -> Dict:
+        places = []
+        for _ in range(self.bulk_size):
+            if random.random() < self.member_ratio:
+                places.append({"placeId": f"bench-{random.randrange(self.seeded_users)}"})
+            else:
+                places.append({"placeId": f"nonmember-{random.randrange(10**9)}"})
+        return {"places": places}
+
+
+async def _signup(client: httpx.AsyncClient, ctx: BenchContext, n: int) -> httpx.Response:
+    return await client.post(f"{API}/auth/signup", json={
+        "login_id": f"bench_signup_{ctx.run_id}_{n}",
+        "password": BENCH_PASSWORD,
+        "name": "벤치가입",
+        "store_info": {
+            "kakao_place_id": f"bench-signup-{ctx.run_id}-{n}",
+            "store_name": "벤치가입매장",
+            "road_address_name": "서울특별시 벤치로 1",
+            "industry_name": "벤치업종0000",
+            "x": random.uniform(126.76, 127.18),
+            "y": random.uniform(37.43, 37.70),
+        },
+    })
+
+
+async def _login(client: httpx.AsyncClient, ctx: BenchContext, n: int) -> httpx.Response:
+    return await client.post(
+        f"{API}/auth/login",
+        data={"username": ctx.random_login_id(), "password": BENCH_PASSWORD},
+    )
+
+
+async def _store_detail(client: httpx.AsyncClient, ctx: BenchContext, n: int) -> httpx.Response:
+    return await client.get(f"{API}/stores/me/detail", headers=ctx.auth_headers())
+
+
+async def _kakao_bulk(client: httpx.AsyncClient, ctx: BenchContext, n: int) -> httpx.Response:
+    return await client.post(f"{API}/stores/search/kakao/bulk", json=ctx.bulk_payload())
+
+
+async def _recommendations(client: httpx.AsyncClient, ctx: BenchContext, n: int) -> httpx.Response:
+    return await client.get(f"{API}/recommendations/industries", headers=ctx.auth_headers())
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "signup": _signup,
+    "login": _login,
+    "store_detail": _store_detail,
+    "kakao_bulk": _kakao_bulk,
+    "recommendations": _recommendations,
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+async def _run_scenario(client: httpx.AsyncClient, ctx: BenchContext, name: str,
+                        requests: int, concurrency: int, warmup: int) -> Dict:
+    fn = SCENARIOS[name]
+
+    for n in range(warmup):
+        await fn(client, ctx, -n - 1)
+
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    counter = iter(range(requests))
+
+    async def worker():
+        for n in counter:
+            started = time.perf_counter()
+            try:
+                response = await fn(client, ctx, n)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            if status not in (200, 304):
+                errors[str(status)] = errors.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+async def _prepare_tokens(client: httpx.AsyncClient, ctx: BenchContext, count: int) -> None:
+    for i in range(min(count, ctx.seeded_users)):
+        response = await client.post(
+            f"{API}/auth/login",
+            data={"username": f"bench_user_{i}", "password": BENCH_PASSWORD},
+        )
+        response.raise_for_status()
+        ctx.tokens.append(response.json()["access_token"])
+
+
+async def run(args) -> List[Dict]:
+    ctx = BenchContext(args.seeded_users, args.bulk_size, args.member_ratio)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        if {"store_detail", "recommendations"} & set(args.scenarios):
+            await _prepare_tokens(client, ctx, args.token_users)
+
+        results = []
+        for name in args.scenarios:
+            result = await _run_scenario(client, ctx, name, args.requests, args.concurrency, args.warmup)
+            results.append(result)
+            print(
+                f"{name:<16} n={result['requests']:<6} c={result['concurrency']:<4} "
+                f"{result['throughput_rps']:>9.1f} req/s  "
+                f"p50={result['p50_ms']:>8.2f}ms  p95={result['p95_ms']:>8.2f}ms  "
+                f"p99={result['p99_ms']:>8.2f}ms  errors={result['errors'] or 0}"
+            )
+        return results
+
+
+def _parse_thresholds(values: List[str]) -> Dict[str, float]:
+    thresholds = {}
+    for value in values:
+        name, _, ms = value.partition("=")
+        thresholds[name] = float(ms)
+    return thresholds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seeded-users", type=int, default=100_000, help="bench.seed --stores 값")
+    parser.add_argument("--token-users", type=int, default=200, help="인증 시나리오에 쓸 로그인 사용자 수")
+    parser.add_argument("--bulk-size", type=int, default=200, help="kakao_bulk 요청당 장소 수")
+    parser.add_argument("--member-ratio", type=float, default=0.05, help="kakao_bulk 중 회원 매장 비율")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--max-p95-ms", nargs="*", default=[], metavar="SCENARIO=MS",
+                        help="p95 상한 - 넘으면 종료 코드 1 (배포 전 회귀 검사용)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    thresholds = _parse_thresholds(args.max_p95_ms)
+    failed = [
+        r["scenario"]
+        for r in results
+        if r["scenario"] in thresholds and r["p95_ms"] > thresholds[r["scenario"]]
+    ]
+    if failed:
+        print(f"❌ p95 threshold exceeded: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+벤치마크용 합성 데이터 적재
+
+DATABASE_URL 이 가리키는 DB(로컬 MySQL 또는 SQLite)에
+users / user_stores / store_images / district_clusters / industry_clusters 를 채운다.
+
+사용법:
+    python -m bench.seed --stores 100000 --districts 20000 --industries 300 --reset
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+from sqlalchemy import BigInteger, delete, insert
+from sqlalchemy.ext.compiler import compiles
+
+from app.core.database import Base, SessionLocal, engine
+from app.core.security import hash_password
+from app.services.store_geo import store_geohash
+from app.models.district import DistrictCluster
+from app.models.user import (
+    DistrictIndustryMix,
+    IndustryCluster,
+    Partnership,
+    StoreImage,
+    User,
+    UserStore,
+)
+
+BENCH_PASSWORD = "bench-password"
+CLUSTER_TYPES = ["red", "orange", "green", "blue"]
+
+# 대략 서울 범위
+LON_RANGE = (126.76, 127.18)
+LAT_RANGE = (37.43, 37.70)
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가하므로 스탠드인 DB 에서는 INTEGER 로 생성
+    return "INTEGER"
+
+
+def _chunks(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _insert(db, model, rows, batch_size):
+    for chunk in _chunks(rows, batch_size):
+        db.execute(insert(model), chunk)
+        db.commit()
+
+
+def industry_name(i: int) -> str:
+    return f"벤치업종{i:04d}"
+
+
+def seed(stores: int, districts: int, industries: int, images_per_store: int,
+         batch_size: int, reset: bool, seed_value: int) -> None:
+    rnd = random.Random(seed_value)
+    now = datetime.utcnow()
+    started = time.perf_counter()
+
+    Base.metadata.create_all(engine)
+
+    db = SessionLocal()
+    try:
+        if reset:
+            for model in (StoreImage, Partnership, UserStore, User,
+                          DistrictIndustryMix, IndustryCluster, DistrictCluster):
+                db.execute(delete(model))
+            db.commit()
+
+        print(f"🏭 industry_clusters: {industries}")
+        _insert(db, IndustryCluster, [
+            {
+                "industry_name": industry_name(i),
+                "avg_age_score": round(rnd.uniform(20, 65), 5),
+                "avg_female_ratio": round(rnd.uniform(0, 1), 5),
+                "data_count": rnd.randint(10, 5000),
+                "cluster_label": i % 4,
+                "industry_type_code": f"I{i % 4}",
+                "created_at": now,
+            }
+            for i in range(industries)
+        ], batch_size)
+        _insert(db, DistrictIndustryMix, [
+            {
+                "industry_name": industry_name(i),
+                "cluster_0_ratio": round(rnd.random(), 8),
+                "cluster_1_ratio": round(rnd.random(), 8),
+                "cluster_2_ratio": round(rnd.random(), 8),
+                "cluster_3_ratio": round(rnd.random(), 8),
+                "created_at": now,
+            }
+            for i in range(industries)
+        ], batch_size)
+
+        print(f"🗺️  district_clusters: {districts}")
+        _insert(db, DistrictCluster, [
+            {
+                "district_code": f"B{i:07d}",
+                "district_name": f"벤치상권{i}",
+                "total_revenue": rnd.randint(10**6, 10**10),
+                "total_weighted_age_sum": rnd.randint(10**4, 10**7),
+                "total_foot_traffic": round(rnd.uniform(100, 100000), 1),
+                "business_count": rnd.randint(1, 500),
+                "avg_age": round(rnd.uniform(25, 60), 5),
+                "efficiency": round(rnd.uniform(0, 1000), 5),
+                "cluster_label": i % 4,
+                "cluster_type": CLUSTER_TYPES[i % 4],
+                "x": round(rnd.uniform(*LON_RANGE), 7),
+                "y": round(rnd.uniform(*LAT_RANGE), 7),
+                "created_at": now,
+            }
+            for i in range(districts)
+        ], batch_size)
+
+        # 모든 벤치 사용자는 같은 비밀번호 (해시 1회만 계산)
+        password_hash = hash_password(BENCH_PASSWORD)
+        print(f"👤 users / user_stores: {stores}")
+        for chunk_start in range(0, stores, batch_size):
+            ids = range(chunk_start, min(stores, chunk_start + batch_size))
+            coords = {i: (round(rnd.uniform(*LON_RANGE), 7), round(rnd.uniform(*LAT_RANGE), 7)) for i in ids}
+            db.execute(insert(User), [
+                {
+                    "id": i + 1,
+                    "login_id": f"bench_user_{i}",
+                    "password": password_hash,
+                    "name": f"벤치사용자{i}",
+                    "created_at": now,
+                }
+                for i in ids
+            ])
+            db.execute(insert(UserStore), [
+                {
+                    "id": i + 1,
+                    "user_id": i + 1,
+                    "kakao_place_id": f"bench-{i}",
+                    "store_name": f"벤치매장{i}",
+                    "road_address_name": f"서울특별시 벤치로 {i}",
+                    "industry_name": industry_name(i % max(1, industries)),
+                    "x": coords[i][0],
+                    "y": coords[i][1],
+                    "geohash": store_geohash(*coords[i]),
+                    "district_cluster_label": i % 4,
+                    "district_cluster_type": CLUSTER_TYPES[i % 4],
+                    "industry_cluster_label": (i % max(1, industries)) % 4,
+                    "store_description": "벤치마크 매장",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in ids
+            ])
+            if images_per_store:
+                db.execute(insert(StoreImage), [
+                    {
+                        "user_store_id": i + 1,
+                        "image_url": f"https://example.com/bench/{i}/{seq}.jpg",
+                        "sequence": seq,
+                    }
+                    for i in ids
+                    for seq in range(1, images_per_store + 1)
+                ])
+            db.commit()
+    finally:
+        db.close()
+
+    print(f"✅ Seed completed in {time.perf_counter() - started:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stores", type=int, default=100_000, help="사용자/매장 수 (사용자당 매장 1개)")
+    parser.add_argument("--districts", type=int, default=20_000)
+    parser.add_argument("--industries", type=int, default=300)
+    parser.add_argument("--images-per-store", type=int, default=2, choices=range(0, 6))
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (재현용)")
+    parser.add_argument("--reset", action="store_true", help="기존 데이터 삭제 후 적재")
+    args = parser.parse_args()
+
+    seed(args.stores, args.districts, args.industries, args.images_per_store,
+         args.batch_size, args.reset, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""운영/벤치마크 스크립트 (저장소 루트에서 python -m scripts.<name> 으로 실행)"""
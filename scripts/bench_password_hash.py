@@ -0,0 +1,62 @@
+"""
+비밀번호 해싱 벤치마크 - 코어당 초당 로그인(verify) 처리량
+
+사용법:
+    python -m scripts.bench_password_hash
+    python -m scripts.bench_password_hash --rounds 29000 100000 --workers 4 --seconds 3
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.context import CryptContext
+
+
+def _make_context(rounds: int) -> CryptContext:
+    return CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__default_rounds=rounds)
+
+
+def _verify_loop(rounds: int, seconds: float) -> int:
+    """seconds 동안 verify 를 반복하고 처리 횟수 반환 (워커 프로세스에서 실행)"""
+    ctx = _make_context(rounds)
+    hashed = ctx.hash("benchmark-password")
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        ctx.verify("benchmark-password", hashed)
+        count += 1
+    return count
+
+
+def run(rounds: int, workers: int, seconds: float) -> None:
+    single = _verify_loop(rounds, seconds) / seconds
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 워커 기동 시간을 측정에서 제외
+        list(executor.map(_verify_loop, [rounds] * workers, [0.01] * workers))
+        started = time.perf_counter()
+        counts = list(executor.map(_verify_loop, [rounds] * workers, [seconds] * workers))
+        elapsed = time.perf_counter() - started
+
+    total = sum(counts) / elapsed
+    print(
+        f"rounds={rounds:>7}  1 core: {single:8.1f} logins/s  "
+        f"{workers} workers: {total:8.1f} logins/s ({total / workers:8.1f}/core)  "
+        f"latency≈{1000 / single:6.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[int(os.getenv("PASSWORD_HASH_ROUNDS", "29000"))])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    for rounds in args.rounds:
+        run(rounds, args.workers, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+핫 쿼리 실행 계획 점검 - 풀 테이블 스캔이면 종료 코드 1
+
+/stores/me/* 매장 조회(user_id), 카카오 장소 회원 여부(kakao_place_id),
+이미지 조회(user_store_id, sequence), 주변 매장(geohash 접두사 범위) 쿼리를 EXPLAIN 해서 인덱스를 타는지 확인한다.
+마이그레이션 적용 후 / 배포 전 CI 에서 실행. 같은 점검을 pytest 로도 돌린다 (tests/test_query_plans.py).
+
+사용법:
+    python -m scripts.check_query_plans
+    DATABASE_URL=sqlite:///bench.db ASYNC_DATABASE_URL=sqlite+aiosqlite:///bench.db python -m scripts.check_query_plans
+"""
+import sys
+from typing import List, Tuple
+
+from sqlalchemy import and_, or_, select, text
+
+from app.core.database import engine
+from app.core.geohash import covering_prefixes
+from app.models.user import StoreImage, UserStore
+
+# (이름, 스캔하면 안 되는 테이블, 쿼리)
+HOT_QUERIES = [
+    (
+        "my store by user_id",
+        "user_stores",
+        select(UserStore.id).where(UserStore.user_id == 1).limit(1),
+    ),
+    (
+        "bulk membership by kakao_place_id",
+        "user_stores",
+        select(UserStore.id, UserStore.kakao_place_id)
+        .where(UserStore.kakao_place_id.in_(["1000001", "1000002", "1000003"])),
+    ),
+    (
+        "images by store ordered by sequence",
+        "store_images",
+        select(StoreImage.id, StoreImage.sequence, StoreImage.image_url)
+        .where(StoreImage.user_store_id == 1)
+        .order_by(StoreImage.sequence),
+    ),
+    (
+        "image slot by (user_store_id, sequence)",
+        "store_images",
+        select(StoreImage.id).where(StoreImage.user_store_id == 1, StoreImage.sequence == 1).limit(1),
+    ),
+    (
+        "nearby stores by geohash prefix ranges",
+        "user_stores",
+        select(UserStore.id, UserStore.x, UserStore.y).where(or_(*[
+            and_(UserStore.geohash >= prefix, UserStore.geohash < prefix + "~")
+            for prefix in covering_prefixes(37.5665, 126.9780, 500)
+        ])),
+    ),
+]
+
+
+def full_scans(conn, stmt, table: str) -> List[str]:
+    """stmt 실행 계획에서 table 에 대한 풀 스캔 단계 목록 (없으면 빈 목록)"""
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    dialect = conn.dialect.name
+    if dialect == "mysql":
+        rows = conn.execute(text(f"EXPLAIN {sql}")).mappings().all()
+        return [
+            f"type=ALL rows={row['rows']}"
+            for row in rows
+            if row["table"] == table and row["type"] == "ALL"
+        ]
+    if dialect == "sqlite":
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        # "SCAN user_stores" 는 풀 스캔, "SEARCH ... USING INDEX" / "SCAN ... USING COVERING INDEX" 는 인덱스 사용
+        return [
+            row[-1]
+            for row in rows
+            if row[-1].startswith(f"SCAN {table}") and "INDEX" not in row[-1]
+        ]
+    raise RuntimeError(f"지원하지 않는 DB: {dialect}")
+
+
+def check() -> List[Tuple[str, List[str]]]:
+    failures = []
+    with engine.connect() as conn:
+        for name, table, stmt in HOT_QUERIES:
+            scans = full_scans(conn, stmt, table)
+            status = "❌ FULL SCAN" if scans else "✅ index"
+            print(f"{status:<14} {name}" + (f"  ({'; '.join(scans)})" if scans else ""))
+            if scans:
+                failures.append((name, scans))
+    return failures
+
+
+def main() -> None:
+    failures = check()
+    if failures:
+        print(f"❌ {len(failures)} hot queries scan the full table - run `alembic upgrade head`")
+        sys.exit(1)
+    print("✅ All hot queries use an index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+참조 데이터 스냅샷 파일 내보내기 (워커 공유 np.memmap 파일)
+
+district_clusters / industry_clusters 를 primary DB 에서 읽어 REFERENCE_SNAPSHOT_FILE(또는 --path)에 기록한다.
+워커는 REFERENCE_SNAPSHOT_POLL_SECONDS 안에 새 파일로 교체한다.
+
+사용법:
+    REFERENCE_SNAPSHOT_FILE=/var/lib/shh/reference.snap python -m scripts.export_reference_snapshot
+    python -m scripts.export_reference_snapshot --path /tmp/reference.snap
+"""
+import argparse
+import os
+import sys
+import time
+
+from app.config.settings import settings
+from app.services.reference_file import load_reference_file
+from app.services.reference_snapshot import reference_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=None, help="출력 파일 (기본 REFERENCE_SNAPSHOT_FILE)")
+    args = parser.parse_args()
+
+    path = args.path or settings.REFERENCE_SNAPSHOT_FILE
+    if not path:
+        print("❌ --path 또는 REFERENCE_SNAPSHOT_FILE 을 지정하세요.")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    version = reference_snapshot.export(path)
+
+    info = load_reference_file(path).info()
+    print(f"✅ v{version}: {info['districts']} districts ({info['districts_with_coordinates']} with coordinates), "
+          f"{info['industries']} industries, {os.path.getsize(path) / 1024:.0f} KiB "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
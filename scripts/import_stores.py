@@ -0,0 +1,53 @@
+"""
+매장 일괄 등록 CLI (POST /stores/bulk 와 같은 로직)
+
+사용법:
+    python -m scripts.import_stores stores.csv --user-id 42
+    python -m scripts.import_stores stores.json --user-id 42 --chunk-size 2000
+"""
+import argparse
+import json
+import sys
+import time
+
+from app.core.database import SessionLocal
+from app.services.store_import import import_stores, parse_csv
+
+
+def _load_rows(path: str):
+    with open(path, "rb") as f:
+        content = f.read()
+    if path.lower().endswith(".json"):
+        rows = json.loads(content)
+        if not isinstance(rows, list):
+            raise ValueError("JSON 파일은 매장 객체 배열이어야 합니다.")
+        return rows
+    return parse_csv(content)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="CSV 또는 JSON(.json) 파일")
+    parser.add_argument("--user-id", type=int, required=True, help="매장을 소유할 사용자 id")
+    parser.add_argument("--chunk-size", type=int, default=None, help="INSERT 배치 크기 (기본 STORE_IMPORT_CHUNK_SIZE)")
+    args = parser.parse_args()
+
+    rows = _load_rows(args.path)
+    started = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        result = import_stores(db, args.user_id, rows, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    for err in result["errors"]:
+        print(f"  row {err['row']} ({err['kakaoPlaceId'] or '-'}): {err['error']}")
+    print(f"✅ {result['created']} created, {result['failed']} failed "
+          f"of {result['total']} rows in {time.perf_counter() - started:.1f}s")
+    if result["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
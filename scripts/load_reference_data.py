@@ -0,0 +1,65 @@
+"""
+기준 데이터 적재 CLI (district_clusters / industry_clusters UPSERT)
+
+사용법:
+    python -m scripts.load_reference_data district_clusters districts.csv
+    python -m scripts.load_reference_data industry_clusters industries.parquet --chunk-size 10000
+    python -m scripts.load_reference_data district_clusters districts.csv.gz --dry-run       # 검증만
+    python -m scripts.load_reference_data district_clusters districts.csv --skip-invalid     # 잘못된 행만 건너뛰기
+
+파일 헤더 = 테이블 컬럼명 (created_at 제외). Parquet 은 pyarrow 필요.
+REFERENCE_SNAPSHOT_FILE 이 설정돼 있으면 적재 후 워커 공유 스냅샷 파일도 다시 쓴다.
+district_clusters 적재 후에는 매장 상권 재배정을 실행한다:
+    python -m scripts.reassign_store_districts --enqueue
+"""
+import argparse
+import sys
+
+from app.config.settings import settings
+from app.core.database import SessionLocal
+from app.services.reference_loader import REFERENCE_MODELS, load_reference_table
+from app.services.reference_snapshot import reference_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("table", choices=list(REFERENCE_MODELS))
+    parser.add_argument("path", help="CSV(.csv, .csv.gz) 또는 Parquet(.parquet) 파일")
+    parser.add_argument("--chunk-size", type=int, default=None, help="읽기/UPSERT 배치 크기 (기본 REFERENCE_LOAD_CHUNK_SIZE)")
+    parser.add_argument("--skip-invalid", action="store_true", help="잘못된 행은 건너뛰고 나머지를 적재")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 DB 에 쓰지 않음")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = load_reference_table(
+            db,
+            args.table,
+            args.path,
+            chunk_size=args.chunk_size,
+            skip_invalid=args.skip_invalid,
+            dry_run=args.dry_run,
+        )
+        if result["written"] and settings.REFERENCE_SNAPSHOT_FILE:
+            # 워커들이 공유하는 스냅샷 파일도 바로 갱신
+            reference_snapshot.export()
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    for err in result["errors"]:
+        print(f"  row {err['row']} [{err['column']}]: {err['error']}")
+    if result["invalid"] > len(result["errors"]):
+        print(f"  ... {result['invalid'] - len(result['errors'])} more invalid rows")
+
+    if result["invalid"] and not args.skip_invalid:
+        print(f"❌ {result['invalid']} invalid rows of {result['total']} - nothing written")
+        sys.exit(1)
+    print(f"✅ {result['table']}: {result['written']} upserted, {result['invalid']} skipped "
+          f"of {result['total']} rows in {result['elapsed_seconds']}s" + (" (dry run)" if args.dry_run else ""))
+
+
+if __name__ == "__main__":
+    main()
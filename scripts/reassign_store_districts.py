@@ -0,0 +1,90 @@
+"""
+매장 상권 재배정 CLI (district_clusters 재적재 후 실행)
+
+사용법:
+    python -m scripts.reassign_store_districts
+    python -m scripts.reassign_store_districts --dry-run
+    python -m scripts.reassign_store_districts --checkpoint reassign.ckpt   # 중단 후 같은 명령으로 이어서 실행
+    python -m scripts.reassign_store_districts --enqueue                    # Celery 워커에 맡기기
+"""
+import argparse
+import os
+import sys
+
+from app.core.database import SessionLocal
+from app.services.district_reassignment import count_stores_to_scan, reassign_store_districts
+
+
+def _read_checkpoint(path: str) -> int:
+    if path and os.path.exists(path):
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    return 0
+
+
+def _write_checkpoint(path: str, last_id: int) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(str(last_id))
+    os.replace(tmp, path)  # 중간에 끊겨도 이전 체크포인트가 깨지지 않도록
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start-after-id", type=int, default=None, help="이 id 다음 매장부터 (기본: 체크포인트 또는 0)")
+    parser.add_argument("--batch-size", type=int, default=None, help="기본 DISTRICT_REASSIGN_BATCH_SIZE")
+    parser.add_argument("--checkpoint", help="배치마다 마지막 반영 id 를 기록할 파일")
+    parser.add_argument("--dry-run", action="store_true", help="변경 건수만 집계하고 UPDATE 하지 않음")
+    parser.add_argument("--enqueue", action="store_true", help="직접 실행하지 않고 Celery 작업으로 등록")
+    args = parser.parse_args()
+
+    start_after_id = args.start_after_id
+    if start_after_id is None:
+        start_after_id = _read_checkpoint(args.checkpoint)
+
+    if args.enqueue:
+        from app.tasks.district_tasks import reassign_store_districts_task
+
+        result = reassign_store_districts_task.delay(
+            start_after_id=start_after_id, batch_size=args.batch_size, dry_run=args.dry_run
+        )
+        print(f"📨 Enqueued district reassignment task {result.id}")
+        return
+
+    read_db = SessionLocal()
+    write_db = SessionLocal()
+    try:
+        total = count_stores_to_scan(read_db, start_after_id)
+        print(f"🗺️  Reassigning districts for {total} stores (after id {start_after_id})")
+
+        def _report(stats):
+            if args.checkpoint and not args.dry_run:
+                _write_checkpoint(args.checkpoint, stats["last_id"])
+            pct = stats["processed"] / total * 100 if total else 100.0
+            rate = stats["processed"] / stats["elapsed_seconds"] if stats["elapsed_seconds"] else 0.0
+            print(
+                f"  {stats['processed']}/{total} ({pct:.1f}%) scanned, {stats['updated']} changed, "
+                f"last id {stats['last_id']}, {rate:.0f} rows/s"
+            )
+
+        reassign_store_districts(
+            read_db,
+            write_db,
+            start_after_id=start_after_id,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            on_progress=_report,
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        read_db.close()
+        write_db.close()
+
+    if args.checkpoint and not args.dry_run and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)  # 완료 - 다음 실행은 처음부터
+
+
+if __name__ == "__main__":
+    main()
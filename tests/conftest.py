@@ -0,0 +1,120 @@
+"""
+테스트 공용 설정 - bench 와 같은 SQLite 스탠드인 DB
+
+설정(app.config.settings)은 import 시점에 환경변수를 읽으므로 app 을 import 하기 전에 지정한다.
+DB 는 세션 전체에서 하나를 쓰므로 테스트마다 다른 login_id / 좌표를 사용한다.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+_DB_DIR = tempfile.mkdtemp(prefix="shh-tests-")
+_DB_PATH = os.path.join(_DB_DIR, "test.db")
+
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{_DB_PATH}",
+    "ASYNC_DATABASE_URL": f"sqlite+aiosqlite:///{_DB_PATH}",
+    "DATABASE_REPLICA_URL": "",
+    "ASYNC_DATABASE_REPLICA_URL": "",
+    "REFERENCE_SNAPSHOT_FILE": "",
+    "KAKAO_CACHE_BACKEND": "memory",
+    "PASSWORD_HASH_ROUNDS": "1000",
+    "PASSWORD_HASH_WORKERS": "0",
+})
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import bench.seed  # noqa: E402,F401  SQLite 에서 BigInteger PK 를 INTEGER 로 생성 (bench 스탠드인과 같은 스키마)
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.district import DistrictCluster  # noqa: E402
+from app.models.user import DistrictIndustryMix, IndustryCluster  # noqa: E402
+from app.services.reference_snapshot import reference_snapshot  # noqa: E402
+
+# (코드, 이름, 군집, 군집 유형, 경도, 위도) - 서울 도심 몇 곳 + 유형 / 좌표가 없는 상권
+REFERENCE_DISTRICTS = [
+    ("T0001", "시청", 0, "red", 126.9779, 37.5663),
+    ("T0002", "광화문", 1, "orange", 126.9769, 37.5759),
+    ("T0003", "명동", 2, "green", 126.9856, 37.5636),
+    ("T0004", "을지로", 3, "blue", 126.9910, 37.5660),
+    ("T0005", "서울역", 0, None, 126.9707, 37.5547),
+    ("T0006", "좌표없음", 1, "orange", None, None),
+]
+
+# (업종명, 평균 연령, 여성 비중, 군집, 업종 유형 코드)
+REFERENCE_INDUSTRIES = [
+    ("카페", 31.5, 0.62, 0, "T0"),
+    ("베이커리", 34.0, 0.58, 0, "T0"),
+    ("한식", 45.2, 0.41, 1, "T1"),
+    ("분식", 28.7, 0.55, 2, None),
+    ("헬스장", 33.1, 0.37, 3, "T3"),
+]
+
+
+def seed_reference_data(db) -> None:
+    for code, name, label, cluster_type, x, y in REFERENCE_DISTRICTS:
+        db.add(DistrictCluster(
+            district_code=code, district_name=name,
+            total_revenue=1_000_000, total_weighted_age_sum=40_000, total_foot_traffic=1000,
+            business_count=10, avg_age=40, efficiency=1,
+            cluster_label=label, cluster_type=cluster_type, x=x, y=y,
+        ))
+    for name, age, female, label, type_code in REFERENCE_INDUSTRIES:
+        db.add(IndustryCluster(
+            industry_name=name, avg_age_score=age, avg_female_ratio=female,
+            data_count=10, cluster_label=label, industry_type_code=type_code,
+        ))
+    db.flush()
+    for i, (name, *_) in enumerate(REFERENCE_INDUSTRIES):
+        db.add(DistrictIndustryMix(
+            industry_name=name,
+            cluster_0_ratio=0.1 * (i % 4), cluster_1_ratio=0.2, cluster_2_ratio=0.3, cluster_3_ratio=0.1,
+        ))
+    db.commit()
+
+
+@pytest.fixture(scope="session")
+def test_db():
+    """스키마 + 참조 데이터가 들어 있는 SQLite 파일 DB"""
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        seed_reference_data(db)
+    yield engine
+    engine.dispose()
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def client(test_db):
+    """startup 을 거친 TestClient (참조 스냅샷이 처음 발행될 때까지 기다린다)"""
+    with TestClient(app) as c:
+        deadline = time.time() + 10
+        while reference_snapshot.info()["version"] is None:
+            assert time.time() < deadline, "참조 스냅샷 빌드 시간 초과"
+            time.sleep(0.05)
+        yield c
+
+
+def signup(client, login_id: str, x: float, y: float, industry_name: str = "카페", **store_info) -> dict:
+    """회원가입 + 로그인 → Authorization 헤더"""
+    response = client.post("/api/v1/auth/signup", json={
+        "login_id": login_id,
+        "password": "test-password",
+        "name": login_id,
+        "store_info": {
+            "kakao_place_id": store_info.pop("kakao_place_id", login_id),
+            "store_name": store_info.pop("store_name", f"{login_id} 매장"),
+            "road_address_name": "서울 중구 세종대로 110",
+            "industry_name": industry_name,
+            "x": x,
+            "y": y,
+            **store_info,
+        },
+    })
+    assert response.status_code == 200, response.text
+    token = client.post(
+        "/api/v1/auth/login", data={"username": login_id, "password": "test-password"}
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,147 @@
+"""
+상권 격자 인덱스 (app/services/district_index.py) - 전체 Haversine argmin 과 같은 결과인지
+"""
+import numpy as np
+import pytest
+
+from app.services.district_index import MAX_RING_SEARCH, DistrictSpatialIndex, haversine_np
+
+CELL_DEGREES = 0.01
+
+# 대략 한반도 남쪽 (제주 ~ 강원 북부)
+KOREA_LON = (124.6, 131.9)
+KOREA_LAT = (33.1, 38.6)
+
+
+def make_index(lons, lats, cell_degrees: float = CELL_DEGREES) -> DistrictSpatialIndex:
+    n = len(lons)
+    return DistrictSpatialIndex(
+        codes=[f"D{i:05d}" for i in range(n)],
+        names=[f"상권{i}" for i in range(n)],
+        labels=[i % 4 for i in range(n)],
+        types=[None if i % 5 == 0 else "red" for i in range(n)],
+        lons=lons,
+        lats=lats,
+        cell_degrees=cell_degrees,
+    )
+
+
+def brute_force(index: DistrictSpatialIndex, x: float, y: float):
+    dists = haversine_np(y, x, index.lats, index.lons)
+    idx = int(np.argmin(dists))
+    return idx, float(dists[idx])
+
+
+@pytest.fixture
+def haversine_sizes(monkeypatch):
+    """nearest() 가 Haversine 을 계산한 후보 수 기록 (링 탐색 / 전체 계산 구분용)"""
+    from app.services import district_index
+
+    sizes = []
+
+    def recording(lat1, lon1, lat2, lon2):
+        sizes.append(np.size(lat2))
+        return haversine_np(lat1, lon1, lat2, lon2)
+
+    monkeypatch.setattr(district_index, "haversine_np", recording)
+    return sizes
+
+
+@pytest.fixture(scope="module")
+def korea_index():
+    rng = np.random.default_rng(20240601)
+    # 도심처럼 몰린 상권 + 전국에 흩어진 상권
+    seoul = np.column_stack([rng.normal(126.98, 0.08, 1500), rng.normal(37.55, 0.06, 1500)])
+    spread = np.column_stack([rng.uniform(*KOREA_LON, 500), rng.uniform(*KOREA_LAT, 500)])
+    points = np.vstack([seoul, spread])
+    return make_index(points[:, 0], points[:, 1])
+
+
+def test_nearest_matches_brute_force(korea_index, haversine_sizes):
+    rng = np.random.default_rng(7)
+    xs = np.concatenate([rng.uniform(*KOREA_LON, 400), rng.normal(126.98, 0.1, 100)])
+    ys = np.concatenate([rng.uniform(*KOREA_LAT, 400), rng.normal(37.55, 0.08, 100)])
+
+    for x, y in zip(xs, ys):
+        expected_idx, expected_dist = brute_force(korea_index, x, y)
+        result = korea_index.nearest(float(x), float(y))
+        assert result["district_code"] == korea_index.codes[expected_idx]
+        assert result["distance_meters"] == pytest.approx(expected_dist, abs=0.01)
+
+    # 격자가 전국 범위(MAX_RING_SEARCH 링보다 넓음)여도 근처에 상권이 있으면 링 탐색으로 끝난다
+    assert len(korea_index) not in haversine_sizes
+
+
+def test_nearest_many_matches_brute_force(korea_index):
+    rng = np.random.default_rng(11)
+    xs = rng.uniform(*KOREA_LON, 500)
+    ys = rng.uniform(*KOREA_LAT, 500)
+
+    idx, dist = korea_index.nearest_many(xs, ys)
+    expected = [brute_force(korea_index, x, y) for x, y in zip(xs, ys)]
+    assert idx.tolist() == [i for i, _ in expected]
+    np.testing.assert_allclose(dist, [d for _, d in expected], rtol=1e-9)
+
+
+def test_nearest_many_chunks(korea_index, monkeypatch):
+    # 거리 행렬을 여러 청크로 나눠도 결과가 같아야 한다
+    from app.services import district_index
+
+    rng = np.random.default_rng(13)
+    xs = rng.uniform(*KOREA_LON, 50)
+    ys = rng.uniform(*KOREA_LAT, 50)
+    expected_idx, expected_dist = korea_index.nearest_many(xs, ys)
+
+    monkeypatch.setattr(district_index, "BATCH_MATRIX_CELLS", len(korea_index) * 7)
+    idx, dist = korea_index.nearest_many(xs, ys)
+    assert idx.tolist() == expected_idx.tolist()
+    np.testing.assert_array_equal(dist, expected_dist)
+
+
+def test_empty_index():
+    index = make_index([], [])
+    assert len(index) == 0
+    assert index.nearest(126.98, 37.55) is None
+
+    idx, dist = index.nearest_many([126.98, 127.0], [37.55, 37.56])
+    assert idx.tolist() == [-1, -1]
+    assert np.isinf(dist).all()
+
+
+def test_query_outside_grid_uses_full_scan(korea_index, haversine_sizes):
+    # 인덱스 격자에서 MAX_RING_SEARCH 링보다 먼 좌표 (도쿄) → 전체 배열 계산 경로
+    x, y = 139.69, 35.69
+    rows, cols = korea_index._cells([y], [x])
+    row, col = int(rows[0]), int(cols[0])
+    max_ring = max(
+        abs(row - korea_index._row_range[0]), abs(row - korea_index._row_range[1]),
+        abs(col - korea_index._col_range[0]), abs(col - korea_index._col_range[1]),
+    )
+    assert max_ring > MAX_RING_SEARCH
+
+    result = korea_index.nearest(x, y)
+    assert haversine_sizes[-1] == len(korea_index)
+    expected_idx, expected_dist = brute_force(korea_index, x, y)
+    assert result["district_code"] == korea_index.codes[expected_idx]
+    assert result["distance_meters"] == pytest.approx(expected_dist, abs=0.01)
+
+
+@pytest.mark.parametrize("neighbour", [
+    (127.0101, 37.5098),  # 오른쪽 셀
+    (127.0098, 37.5101),  # 위쪽 셀
+    (127.0101, 37.5101),  # 대각선 셀
+])
+def test_nearest_in_neighbouring_cell(neighbour):
+    # 질의 좌표와 같은 셀에 있는 상권보다 옆 셀 경계 너머의 상권이 더 가깝다
+    same_cell = (127.0001, 37.5001)
+    index = make_index([same_cell[0], neighbour[0]], [same_cell[1], neighbour[1]])
+    x, y = 127.0098, 37.5098
+
+    rows, cols = index._cells([y, same_cell[1], neighbour[1]], [x, same_cell[0], neighbour[0]])
+    cells = list(zip(rows.tolist(), cols.tolist()))
+    assert cells[0] == cells[1] != cells[2]
+
+    result = index.nearest(x, y)
+    assert result["district_code"] == "D00001"
+    assert result["distance_meters"] == pytest.approx(brute_force(index, x, y)[1], abs=0.01)
+    assert result["distance_meters"] < 100
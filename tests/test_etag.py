@@ -0,0 +1,71 @@
+"""
+조건부 GET (app/core/etag.py) - If-None-Match 비교 + /stores/me/* 304 흐름
+"""
+import pytest
+
+from app.core.etag import etag_matches, make_etag
+from tests.conftest import signup
+
+ETAG = make_etag("detail", 1, "매장")
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("", False),
+    (ETAG, True),
+    (ETAG[2:], True),  # 강한 태그로 보내도 약한 비교로 일치
+    ('W/"other"', False),
+    (f'W/"other", {ETAG}', True),
+    (f'"other",{ETAG[2:]}', True),
+    ('W/"other", "another"', False),
+    ("*", True),
+    (" * ", True),
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, ETAG) is expected
+
+
+def test_make_etag_changes_with_values():
+    assert make_etag("detail", 1, "매장") == ETAG
+    assert make_etag("detail", 1, "매장2") != ETAG
+    assert ETAG.startswith('W/"')
+
+
+def test_store_detail_conditional_get(client):
+    headers = signup(client, "etag-detail", 126.9780, 37.5665)
+
+    first = client.get("/api/v1/stores/me/detail", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get("/api/v1/stores/me/detail", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    updated = client.patch("/api/v1/stores/me/info", headers=headers, json={"storeDescription": "수정된 소개"})
+    assert updated.status_code == 200
+
+    after = client.get("/api/v1/stores/me/detail", headers={**headers, "If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.json()["store_description"] == "수정된 소개"
+    assert after.headers["etag"] != etag
+
+
+def test_store_images_etag_changes_on_add(client):
+    headers = signup(client, "etag-images", 126.9781, 37.5664)
+
+    first = client.get("/api/v1/stores/me/images", headers=headers)
+    assert first.status_code == 200
+    assert first.json() == []
+    etag = first.headers["etag"]
+    assert client.get("/api/v1/stores/me/images", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    added = client.post("/api/v1/stores/me/images", headers=headers, json={"imageUrl": "http://img/1.jpg", "sequence": 1})
+    assert added.status_code == 200
+
+    after = client.get("/api/v1/stores/me/images", headers={**headers, "If-None-Match": etag})
+    assert after.status_code == 200
+    assert [image["sequence"] for image in after.json()] == [1]
+    assert after.headers["etag"] != etag
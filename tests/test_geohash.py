@@ -0,0 +1,148 @@
+"""
+geohash 반경 검색 (app/core/geohash.py, app/services/store_geo.py)
+
+- covering_prefixes: 반경 안의 어떤 점도 돌려준 접두사 중 하나로 시작해야 한다
+- /stores/nearby: 가까운 순 / limit / 반경 바로 밖 매장 제외
+"""
+import math
+
+import numpy as np
+import pytest
+
+from app.core import geohash
+from app.core.database import SessionLocal
+from app.models.user import User, UserStore
+from app.services.district_index import EARTH_RADIUS_M, haversine_np
+
+SEOUL = (37.5665, 126.9780)
+
+
+def largest_radius(precision: int, lat: float) -> float:
+    """precision 셀로 덮을 수 있는 가장 큰 반경 (precision_for_radius 경계값)"""
+    lat_deg, lon_deg = geohash.cell_size_degrees(precision)
+    by_lat = math.radians(lat_deg) * EARTH_RADIUS_M
+    by_lon = math.asin(math.sin(math.radians(lon_deg)) * math.cos(math.radians(lat))) * EARTH_RADIUS_M
+    return min(by_lat, by_lon) * (1 - 1e-9)
+
+
+# 고정 반경 + 셀 크기와 거의 같은 반경 (3x3 이웃이 원을 간신히 덮는 경우)
+RADII = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000] + [
+    r for r in (largest_radius(p, SEOUL[0]) for p in range(4, 10)) if 10 <= r <= 5000
+]
+
+
+def destination(lat: float, lon: float, bearing_deg: float, distance_m: float):
+    """(lat, lon) 에서 bearing 방향으로 distance_m 떨어진 점 (구면)"""
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    bearing = math.radians(bearing_deg)
+    delta = distance_m / EARTH_RADIUS_M
+    lat2 = math.asin(math.sin(lat1) * math.cos(delta) + math.cos(lat1) * math.sin(delta) * math.cos(bearing))
+    lon2 = lon1 + math.atan2(
+        math.sin(bearing) * math.sin(delta) * math.cos(lat1),
+        math.cos(delta) - math.sin(lat1) * math.sin(lat2),
+    )
+    return math.degrees(lat2), math.degrees(lon2)
+
+
+def cell_corner_centers(radius_m: float):
+    """셀 모서리 / 변 바로 안쪽 중심 (반경 원이 이웃 셀 경계를 가장 많이 넘는 위치)"""
+    centers = []
+    for lat, lon in [SEOUL, (33.4996, 126.5312), (38.2, 128.6)]:
+        precision = geohash.precision_for_radius(lat, radius_m)
+        lat_lo, lat_hi, lon_lo, lon_hi = geohash.decode_bbox(geohash.encode(lat, lon, precision))
+        eps_lat = (lat_hi - lat_lo) * 1e-6
+        eps_lon = (lon_hi - lon_lo) * 1e-6
+        centers += [
+            (lat, lon),
+            (lat_lo + eps_lat, lon_lo + eps_lon),
+            (lat_hi - eps_lat, lon_hi - eps_lon),
+            (lat_lo + eps_lat, lon_hi - eps_lon),
+            (lat_hi - eps_lat, (lon_lo + lon_hi) / 2),
+        ]
+    return centers
+
+
+@pytest.mark.parametrize("radius_m", RADII, ids=[f"{r:.1f}m" for r in RADII])
+def test_covering_prefixes_contain_every_point_in_radius(radius_m):
+    rng = np.random.default_rng(int(radius_m))
+    for lat, lon in cell_corner_centers(radius_m):
+        prefixes = geohash.covering_prefixes(lat, lon, radius_m)
+        assert 1 <= len(prefixes) <= 9
+
+        bearings = np.concatenate([np.arange(0, 360, 15), rng.uniform(0, 360, 200)])
+        distances = np.concatenate([np.full(24, radius_m), radius_m * np.sqrt(rng.uniform(0, 1, 200))])
+        for bearing, distance in zip(bearings, distances):
+            point_lat, point_lon = destination(lat, lon, float(bearing), float(distance))
+            assert haversine_np(lat, lon, point_lat, point_lon) <= radius_m + 1e-6
+            code = geohash.encode(point_lat, point_lon)
+            assert code.startswith(tuple(prefixes)), (
+                f"r={radius_m} center=({lat}, {lon}) point=({point_lat}, {point_lon}) {code} not in {prefixes}"
+            )
+
+
+def test_encode_matches_decode_bbox():
+    lat, lon = SEOUL
+    code = geohash.encode(lat, lon)
+    assert len(code) == geohash.STORE_PRECISION
+    lat_lo, lat_hi, lon_lo, lon_hi = geohash.decode_bbox(code)
+    assert lat_lo <= lat < lat_hi
+    assert lon_lo <= lon < lon_hi
+
+
+# ----- /stores/nearby -----
+
+# 다른 테스트 매장과 섞이지 않도록 부산 (서면) 기준
+CENTER = (35.1578, 129.0600)
+
+
+@pytest.fixture(scope="module")
+def nearby_stores(client):
+    """중심에서 정해진 거리에 있는 매장들 → {매장명: 거리(m)}"""
+    placed = {
+        "n-000": (0, 0),
+        "n-080": (80, 30),
+        "n-150": (150, 200),
+        "n-240": (240, 90),
+        "n-299": (299, 315),
+        "n-301": (301, 135),  # 반경 300m 바로 밖
+        "n-900": (900, 0),
+    }
+    with SessionLocal() as db:
+        user = User(login_id="nearby-owner", password="x", name="nearby")
+        db.add(user)
+        db.flush()
+        for name, (distance, bearing) in placed.items():
+            lat, lon = destination(*CENTER, bearing, distance)
+            db.add(UserStore(
+                user_id=user.id, store_name=name, industry_name="카페", x=round(lon, 7), y=round(lat, 7),
+            ))
+        db.commit()
+    return {name: distance for name, (distance, _) in placed.items()}
+
+
+def test_nearby_orders_by_distance_within_radius(client, nearby_stores):
+    response = client.get("/api/v1/stores/nearby", params={"lat": CENTER[0], "lng": CENTER[1], "radius": 300})
+    assert response.status_code == 200
+    results = response.json()["results"]
+
+    assert [r["store_name"] for r in results] == ["n-000", "n-080", "n-150", "n-240", "n-299"]
+    distances = [r["distance_meters"] for r in results]
+    assert distances == sorted(distances)
+    for r in results:
+        assert r["distance_meters"] == pytest.approx(nearby_stores[r["store_name"]], abs=0.5)
+
+
+def test_nearby_limit_keeps_closest(client, nearby_stores):
+    response = client.get(
+        "/api/v1/stores/nearby", params={"lat": CENTER[0], "lng": CENTER[1], "radius": 1000, "limit": 3}
+    )
+    assert response.status_code == 200
+    assert [r["store_name"] for r in response.json()["results"]] == ["n-000", "n-080", "n-150"]
+
+
+def test_nearby_radius_boundary(client, nearby_stores):
+    params = {"lat": CENTER[0], "lng": CENTER[1]}
+    names = [r["store_name"] for r in client.get("/api/v1/stores/nearby", params={**params, "radius": 302}).json()["results"]]
+    assert "n-301" in names and "n-900" not in names
+
+    assert client.get("/api/v1/stores/nearby", params={**params, "radius": 5001}).status_code == 422
@@ -0,0 +1,64 @@
+"""
+카카오 장소 회원 여부 NDJSON 스트리밍 (/stores/search/kakao/bulk/stream)
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.api.v1.stores import _read_ndjson_place_ids
+from app.config.settings import settings
+from tests.conftest import signup
+
+URL = "/api/v1/stores/search/kakao/bulk/stream"
+
+
+def ndjson(place_ids):
+    return "".join(json.dumps({"placeId": pid}) + "\n" for pid in place_ids).encode()
+
+
+def test_stream_reports_membership(client):
+    signup(client, "stream-member", 126.9775, 37.5660, kakao_place_id="kp-stream-1")
+
+    response = client.post(URL, content=ndjson(["kp-stream-1", "kp-stream-none"]))
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [(line["placeId"], line["isMember"]) for line in lines] == [
+        ("kp-stream-1", True), ("kp-stream-none", False),
+    ]
+    assert lines[0]["store"]["store_name"] == "stream-member 매장"
+
+
+def test_too_many_ids_rejected_before_reading_whole_body(monkeypatch):
+    monkeypatch.setattr(settings, "PLACE_MEMBERSHIP_MAX_IDS", 3)
+    received = []
+
+    async def receive():
+        # 한 줄씩 도착하는 본문 (100줄)
+        i = len(received)
+        received.append(i)
+        return {"type": "http.request", "body": ndjson([f"kp-{i}"]), "more_body": i < 99}
+
+    request = Request({"type": "http", "method": "POST", "headers": []}, receive)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(_read_ndjson_place_ids(request))
+    assert exc_info.value.status_code == 400
+    assert "최대 3개" in exc_info.value.detail
+    assert len(received) == 4
+
+
+def test_too_many_ids_response(client, monkeypatch):
+    monkeypatch.setattr(settings, "PLACE_MEMBERSHIP_MAX_IDS", 3)
+    assert client.post(URL, content=ndjson(["a", "b", "c"])).status_code == 200
+
+    response = client.post(URL, content=ndjson(["a", "b", "c", "d"]))
+    assert response.status_code == 400
+    assert "최대 3개" in response.json()["detail"]
+
+
+def test_stream_rejects_invalid_line(client):
+    response = client.post(URL, content=b'{"placeId": "a"}\nnot json\n')
+    assert response.status_code == 400
+    assert "2번째 줄" in response.json()["detail"]
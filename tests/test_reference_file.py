@@ -0,0 +1,157 @@
+"""
+참조 스냅샷 파일 (app/services/reference_file.py) - DB 빌드 스냅샷과 memmap 으로 읽은 스냅샷이 같은지
+"""
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.district import DistrictCluster
+from app.models.user import IndustryCluster
+from app.services.reference_file import (
+    FORMAT_VERSION,
+    MAGIC,
+    load_reference_file,
+    read_header,
+    write_reference_file,
+)
+from app.services.reference_snapshot import ReferenceSnapshot
+from tests.conftest import seed_reference_data
+
+CLUSTER_NAMES = {0: "20대 여성", 1: "중장년", 2: "학생", 3: "직장인"}
+
+
+def seed_more(db, rng: random.Random) -> None:
+    """conftest 참조 데이터 + 임의 상권 / 업종 (유형·좌표·업종 코드가 없는 행 포함)"""
+    for i in range(300):
+        located = i % 7 != 0
+        db.add(DistrictCluster(
+            district_code=f"R{i:04d}", district_name=f"임의상권 {i}",
+            total_revenue=rng.randint(0, 2 ** 40), total_weighted_age_sum=rng.randint(0, 10 ** 9),
+            total_foot_traffic=round(rng.uniform(0, 1e6), 1), business_count=rng.randint(0, 500),
+            avg_age=round(rng.uniform(20, 60), 5), efficiency=round(rng.uniform(0, 100), 5),
+            cluster_label=i % 4, cluster_type=None if i % 5 == 0 else ["red", "orange", "green", "blue"][i % 4],
+            x=round(rng.uniform(126.7, 127.3), 7) if located else None,
+            y=round(rng.uniform(37.4, 37.7), 7) if located else None,
+        ))
+    for i in range(40):
+        db.add(IndustryCluster(
+            industry_name=f"임의업종{i:02d}", avg_age_score=round(rng.uniform(20, 60), 5),
+            avg_female_ratio=round(rng.uniform(0, 1), 5), data_count=10,
+            cluster_label=i % 4, industry_type_code=None if i % 3 == 0 else f"T{i % 4}",
+        ))
+    db.commit()
+
+
+@pytest.fixture(scope="module")
+def built():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        seed_reference_data(db)
+        seed_more(db, random.Random(25))
+        snapshot = ReferenceSnapshot.build(db, version=3)
+    engine.dispose()
+    return snapshot
+
+
+@pytest.fixture(scope="module")
+def loaded(built, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("reference") / "reference.snap")
+    write_reference_file(built, path, version=built.version)
+    return load_reference_file(path)
+
+
+def test_header_and_version(built, loaded):
+    assert loaded.version == built.version
+
+
+def test_districts_match(built, loaded):
+    assert len(loaded.districts) == len(built.districts)
+    assert sorted(loaded.districts) == sorted(built.districts)
+    for code, info in built.districts.items():
+        assert code in loaded.districts
+        assert loaded.districts[code] == info
+        assert loaded.districts.get(code) == info
+
+    # None 유형 / None 좌표도 그대로
+    assert loaded.districts["T0005"].cluster_type is None
+    assert loaded.districts["T0006"].x is None and loaded.districts["T0006"].y is None
+
+    assert "없는상권" not in loaded.districts
+    assert loaded.districts.get("없는상권") is None
+    with pytest.raises(KeyError):
+        loaded.districts["없는상권"]
+
+
+def test_industries_match(built, loaded):
+    assert len(loaded.industries) == len(built.industries)
+    for name, info in built.industries.items():
+        assert loaded.industries.get(name) == info
+    assert loaded.industries.get("분식").industry_type_code is None
+    assert loaded.industries.get("없는업종") is None
+
+
+def test_district_index_nearest_matches(built, loaded):
+    assert len(loaded.district_index) == len(built.district_index)
+    rng = np.random.default_rng(25)
+    for x, y in zip(rng.uniform(126.6, 127.4, 200), rng.uniform(37.3, 37.8, 200)):
+        assert loaded.district_index.nearest(float(x), float(y)) == built.district_index.nearest(float(x), float(y))
+
+    # 격자 밖 (전체 계산 경로)
+    assert loaded.district_index.nearest(129.06, 35.16) == built.district_index.nearest(129.06, 35.16)
+
+
+def test_industry_index_top_items_match(built, loaded):
+    built_index, loaded_index = built.industry_index, loaded.industry_index
+    assert len(loaded_index) == len(built_index)
+    for name in built.industries:
+        idx = built_index.lookup(name)
+        assert loaded_index.lookup(name) == idx
+        assert loaded_index.top_items(idx, CLUSTER_NAMES) == built_index.top_items(idx, CLUSTER_NAMES)
+    assert loaded_index.lookup("없는업종") is None
+
+
+def test_empty_snapshot_round_trip(tmp_path):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        snapshot = ReferenceSnapshot.build(db, version=1)
+    engine.dispose()
+
+    path = str(tmp_path / "empty.snap")
+    write_reference_file(snapshot, path, version=1)
+    loaded = load_reference_file(path)
+    assert len(loaded.districts) == 0 and len(loaded.industries) == 0
+    assert loaded.district_index.nearest(126.98, 37.56) is None
+
+
+def test_wrong_magic_raises(tmp_path):
+    path = tmp_path / "not-a-snapshot.snap"
+    path.write_bytes(b"NOTASNAP" + bytes(64))
+    with pytest.raises(ValueError, match="참조 스냅샷 파일이 아닙니다"):
+        load_reference_file(str(path))
+
+
+def test_wrong_format_raises(built, tmp_path):
+    path = str(tmp_path / "reference.snap")
+    write_reference_file(built, path, version=1)
+    header, _ = read_header(path)
+    assert header["format"] == FORMAT_VERSION
+
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data.startswith(MAGIC)
+    # 헤더 길이가 바뀌지 않도록 같은 자릿수의 다른 포맷 번호로 교체
+    old = f'"format": {FORMAT_VERSION},'.encode()
+    new = f'"format": {FORMAT_VERSION + 1},'.encode()
+    assert data.count(old) == 1 and len(new) == len(old)
+    with open(path, "wb") as f:
+        f.write(data.replace(old, new))
+
+    with pytest.raises(ValueError, match="지원하지 않는 참조 스냅샷 파일 포맷"):
+        load_reference_file(path)
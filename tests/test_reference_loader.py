@@ -0,0 +1,165 @@
+"""
+기준 데이터 적재 (app/services/reference_loader.py) - CSV 변환/검증과 쓰기 패스
+"""
+import csv
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.district import DistrictCluster
+from app.services.reference_loader import load_reference_table
+
+HEADER = [
+    "district_code", "district_name", "total_revenue", "total_weighted_age_sum", "total_foot_traffic",
+    "business_count", "avg_age", "efficiency", "cluster_label", "cluster_type", "x", "y",
+]
+
+
+def district_row(code: str, **overrides) -> dict:
+    row = {
+        "district_code": code,
+        "district_name": f"상권 {code}",
+        "total_revenue": "1000000",
+        "total_weighted_age_sum": "40000",
+        "total_foot_traffic": "1234.5",
+        "business_count": "12",
+        "avg_age": "41.12345",
+        "efficiency": "1.5",
+        "cluster_label": "2",
+        "cluster_type": "green",
+        "x": "126.9779692",
+        "y": "37.5662952",
+    }
+    row.update(overrides)
+    return row
+
+
+def write_csv(path, rows, header=HEADER):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def stored_codes(db):
+    return db.scalars(select(DistrictCluster.district_code).order_by(DistrictCluster.district_code)).all()
+
+
+def test_bigint_above_2_53_stays_exact(db, tmp_path):
+    big = 2 ** 53 + 1
+    path = write_csv(tmp_path / "districts.csv", [
+        district_row("A1", total_revenue=str(big)),
+        district_row("A2", total_revenue=str(2 ** 63 - 1), total_weighted_age_sum="9007199254740993.0"),
+    ])
+
+    result = load_reference_table(db, "district_clusters", path)
+    assert result["invalid"] == 0 and result["written"] == 2
+
+    rows = {r.district_code: r for r in db.execute(select(DistrictCluster)).scalars()}
+    assert rows["A1"].total_revenue == big
+    assert rows["A2"].total_revenue == 2 ** 63 - 1
+    assert rows["A2"].total_weighted_age_sum == 9007199254740993
+
+
+@pytest.mark.parametrize("column, value, message", [
+    ("business_count", "12.5", "정수가 아님"),
+    ("business_count", "2147483648", "정수 범위 초과"),
+    ("total_revenue", str(2 ** 63), "정수 범위 초과"),
+    ("business_count", "1e999999", "정수 범위 초과"),
+    ("business_count", "twelve", "숫자가 아님"),
+    ("cluster_label", "4", "허용값"),
+    ("cluster_label", "-1", "허용값"),
+    ("cluster_type", "purple", "허용값"),
+    ("avg_age", "1000.00001", "DECIMAL 범위 초과"),
+    ("avg_age", "999.999999", "DECIMAL 범위 초과"),  # scale 5 로 반올림하면 1000
+    ("x", "-10000", "DECIMAL 범위 초과"),
+    ("district_name", "", "필수 값 누락"),
+])
+def test_invalid_value_is_rejected(db, tmp_path, column, value, message):
+    path = write_csv(tmp_path / "districts.csv", [
+        district_row("B1"),
+        district_row("B2", **{column: value}),
+    ])
+
+    result = load_reference_table(db, "district_clusters", path)
+    assert result["invalid"] == 1
+    assert result["written"] == 0
+    assert len(result["errors"]) == 1
+    error = result["errors"][0]
+    assert error["row"] == 2 and error["column"] == column
+    assert message in error["error"]
+
+
+def test_integral_decimal_and_optional_values_are_accepted(db, tmp_path):
+    path = write_csv(tmp_path / "districts.csv", [
+        district_row("C1", business_count="12.0", cluster_type="", x="", y=""),
+    ])
+
+    result = load_reference_table(db, "district_clusters", path)
+    assert result["invalid"] == 0 and result["written"] == 1
+
+    row = db.scalar(select(DistrictCluster))
+    assert row.business_count == 12
+    assert row.cluster_type is None and row.x is None and row.y is None
+
+
+def test_missing_required_header_raises(db, tmp_path):
+    header = [c for c in HEADER if c != "cluster_label"]
+    path = write_csv(tmp_path / "districts.csv", [district_row("D1")], header=header)
+
+    with pytest.raises(ValueError, match="cluster_label"):
+        load_reference_table(db, "district_clusters", path)
+    assert stored_codes(db) == []
+
+
+def test_default_mode_writes_nothing_when_any_row_is_invalid(db, tmp_path):
+    path = write_csv(tmp_path / "districts.csv", [
+        district_row("E1"),
+        district_row("E2", cluster_label="9"),
+        district_row("E3"),
+        district_row("E4", business_count="1.5"),
+        district_row("E5"),
+    ])
+
+    result = load_reference_table(db, "district_clusters", path, chunk_size=2)
+    assert result["total"] == 5
+    assert result["invalid"] == 2
+    assert result["written"] == 0
+    assert [e["row"] for e in result["errors"]] == [2, 4]
+    assert stored_codes(db) == []
+
+
+def test_skip_invalid_writes_only_valid_rows(db, tmp_path):
+    path = write_csv(tmp_path / "districts.csv", [
+        district_row("E1"),
+        district_row("E2", cluster_label="9"),
+        district_row("E3"),
+        district_row("E4", business_count="1.5"),
+        district_row("E5"),
+    ])
+
+    result = load_reference_table(db, "district_clusters", path, chunk_size=2, skip_invalid=True)
+    assert result["invalid"] == 2
+    assert result["written"] == 3
+    assert stored_codes(db) == ["E1", "E3", "E5"]
+
+
+def test_dry_run_validates_without_writing(db, tmp_path):
+    path = write_csv(tmp_path / "districts.csv", [district_row("F1"), district_row("F2")])
+
+    result = load_reference_table(db, "district_clusters", path, dry_run=True)
+    assert result["total"] == 2 and result["invalid"] == 0 and result["written"] == 0
+    assert stored_codes(db) == []